@@ -1,25 +1,27 @@
-
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-import Backend
 from Backend.GameManagement.player import Player
-from Backend.GameManagement.player_turn import Player_Turn
-from Backend.GameManagement.gameboardGrouping import game_board, game_processor, space
-from Backend.cardGroupings import Card, Deck, Hand, CardType
+from Backend.gameboardGroupings.space import Room, Space
+
+if TYPE_CHECKING:
+    from Backend.GameManagement.player_turn import Player_Turn
 
-class Actions():
+class Actions(ABC):
     p: Player
-    pt: Player_Turn
+    pt: "Player_Turn"
 
-    def __init__(self, player: Player, playerTurn: Player_Turn):
-        p = player
-        pt = playerTurn
+    def __init__(self, player: Player, playerTurn: "Player_Turn"):
+        self.p = player
+        self.pt = playerTurn
 
     @abstractmethod
-    def validate(self):
+    def validate(self) -> bool:
+        pass
 
     @abstractmethod
-    def perform_action(self):
+    def perform_action(self, *args):
+        pass
 
 
 class Accusation(Actions):
@@ -33,41 +35,16 @@ class Accusation(Actions):
         else:
             return True
 
-    def perform_action(self):
-        # enter checking win conditions
-        winningCards_iter = iter(list(Backend.GameManagement.GameProcessor.winningCards))
-        nextCard = next(winningCards_iter)
-
-        # output to GUI/client list of options for suspect, have them choose one
-
-        self.suspect = selected_suspect
-
-        # output to GUI/client list of options for weapon, have them choose one
-
-        self.weapon = selected_weapon
-
-        # output to GUI/client list of options for room, have them choose one
-
-        self.room = selected_room
-
-        suspectCorrect = False
-        weaponCorrect = False
-        roomCorrect = False
-        if nextCard.getCardType() == CardType.SUSPECT:
-            if self.suspect == nextCard.getCardName():
-                suspectCorrect = True
-        elif nextCard.getCardType() == CardType.WEAPON:
-            if self.weapon == nextCard.getCardName():
-                weaponCorrect = True
-        elif nextCard.getCardType() == CardType.ROOM:
-            if self.room == nextCard.getCardName():
-                roomCorrect = True
+    def perform_action(self, suspect: str, weapon: str, room: str) -> bool:
+        # the suspect, weapon and room are chosen by the player on the client
+        self.suspect = suspect
+        self.weapon = weapon
+        self.room = room
 
-        if (suspectCorrect and weaponCorrect and roomCorrect):
-            # player wins game, enter win game state
-        else:
-            # output player eliminated
-            p.isEliminated = True
+        # enter checking win conditions; the accusation and case file are
+        # compared as packed integer codes. The game ends when it is right
+        # and eliminates the player when it is wrong.
+        return self.pt.game.handle_accusation(self.p, self.suspect, self.weapon, self.room)
 
 class Suggestion(Actions):
     suspect: str
@@ -80,38 +57,17 @@ class Suggestion(Actions):
                 return True
         return False
 
-    def perform_action(self):
-        # prompt for susepct, weapon, room
-
-        self.create_suggestion(suspect, weap, room_suggest)
-
-        disproveFinished = False
-
-        turnList = Backend.GameManagement.GameProcessor.turnOrder
-        turnList_iter = iter(turnList)
-        nextPlayer = None
-        while (nextPlayer != p):
-            nextPlayer = next(turnList_iter)
-
-        while(not disproveFinished):
-            nextPlayer = next(turnList_iter)
-            # ask player to disprove
-            # output list of player's cards that match suggestion
-            disproveCards = []
-            for card in self.p.playerHand:
-                curr_card = card.get_name()
-                if curr_card == self.suspect or curr_card == self.weapon or curr_card == self.room:
-                    disproveCards.append(curr_card)
-
-            if not disproveCards:
-                return False
-            else:
-                # have them select one
-                # wait for them to accept then broadcast event (not card)
-                disproveFinished = True
-
-        self.pt.hasMadeSuggestion = True
-
+    def perform_action(self, suspect: str, weapon: str, room: str):
+        # the suspect, weapon and room are chosen by the player on the client;
+        # the game asks each player after the suggester in turn order and
+        # returns the first matching card, or None if nobody can disprove it.
+        # Players may only suggest the room they are in.
+        location = self.p.currLocation
+        if location is None or location.get_name() != room:
+            raise ValueError(f"{self.p.playerName} is not in the {room}")
+        disproving_card = self.pt.game.handle_suggestion(self.p, suspect, weapon, room)
+        self.create_suggestion(suspect, weapon, room)
+        return disproving_card
 
     def create_suggestion(self, suspect: str, weap: str, room_suggest: str):
         self.suspect = suspect
@@ -119,8 +75,14 @@ class Suggestion(Actions):
         self.room = room_suggest
 
         # move player and weapon tokens to the room suggested
-        Player susp = game_processor.get_player_associated_with_character(self.suspect)
-        game_processor.move_player(susp, self.room)
+        game = self.pt.game
+        room = game.game_board.get_space_by_name(self.room)
+        if not isinstance(room, Room):
+            raise ValueError(f"{self.room} is not a room")
+        susp = game.get_player_associated_with_character(self.suspect)
+        if susp is not None:
+            game.summon_player(susp, room)
+        game.move_weapon(self.weapon, room)
 
 
 class Move(Actions):
@@ -130,31 +92,6 @@ class Move(Actions):
             return True
         return False
 
-    def perform_action(self):
-        moves_list = self.p.get_valid_moves()
-
-        # output possible moves
-        adj = self.p.currLocation.get_adjacent_spaces()
-
-        possible_dest = []
-        # check if adjacent spaces are empty
-        for sp in adj:
-            if sp.is_empty():
-                possible_dest.append(sp)
-
-        # have player select a move
-        selected_destination
-
-        if(selected_destination.get_space_type() == ROOM):
-            self.pt.hasEnteredRoom = True
-
-        selected_destination.add_player(self.p)
-        self.p.currLocation.remove_player(self.p)
-
-        # broadcast move
-
-
-
-
-
-
+    def perform_action(self, selected_destination: Space) -> bool:
+        # the game checks the move, updates the turn and broadcasts the move
+        return self.pt.game.move_player(self.p, selected_destination)
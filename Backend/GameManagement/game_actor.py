@@ -0,0 +1,279 @@
+import asyncio
+from typing import Callable, Dict, Optional, Tuple
+from Backend.GameManagement.game_registry import GameRegistry
+from Backend.GameManagement.player_turn import TurnAction
+from Backend.gameboardGroupings.game_processor import GameState
+
+DEFAULT_MAILBOX_SIZE = 64
+# Seconds an actor waits for a message before its task exits; the game
+# itself stays in the registry
+DEFAULT_ACTOR_IDLE_TIMEOUT = 60
+# Seconds between the registry's evict_idle() calls
+DEFAULT_EVICTION_INTERVAL = 60
+
+# Placed in a mailbox to stop its actor
+_STOP = object()
+
+
+class MailboxFull(Exception):
+    """Raised when a game already has as many actions queued as its mailbox holds"""
+
+
+class GameNotFound(LookupError):
+    """Raised when an action is submitted for a game the registry does not know"""
+
+
+class GameActor():
+    """
+    GameActor: Runs every action on one game, one at a time, on its own task
+
+    Actions are plain functions called as action(game, *args). They are
+    queued in a bounded mailbox and run to completion in arrival order, so
+    no two actions on a game ever interleave and none of them needs a lock.
+    Actions must not await; an action that blocks stalls only its own game.
+
+    The game is looked up in the registry for each action, so the registry
+    remains free to evict it between actions, and the events each action
+    logs are synced to the registry's store before its result is returned.
+
+    Attributes:
+        game_id (str): Id of the game this actor runs
+    """
+    def __init__(self, game_id: str, registry: GameRegistry, mailbox_size: int = DEFAULT_MAILBOX_SIZE,
+                 idle_timeout: float = DEFAULT_ACTOR_IDLE_TIMEOUT,
+                 on_stop: Optional[Callable[["GameActor"], None]] = None):
+        self.game_id = game_id
+        self._registry = registry
+        self._mailbox: asyncio.Queue = asyncio.Queue(mailbox_size)
+        self._idle_timeout = idle_timeout
+        self._on_stop = on_stop
+        self._task: Optional[asyncio.Task] = None
+        self._is_stopped = False
+
+    def start(self) -> None:
+        """Starts the actor's task on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f"game-{self.game_id}")
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._is_stopped
+
+    def pending(self) -> int:
+        """Returns the number of queued actions"""
+        return self._mailbox.qsize()
+
+    async def submit(self, action: Callable, *args):
+        """Queues an action, waiting for room in the mailbox, and returns
+           its result once it has run"""
+        future = self._new_future()
+        await self._mailbox.put((action, args, future))
+        if self._is_stopped and not future.done():
+            # The actor stopped while this was waiting for room
+            future.set_exception(RuntimeError(f"The actor for game {self.game_id} has stopped"))
+        return await future
+
+    def submit_nowait(self, action: Callable, *args) -> asyncio.Future:
+        """Queues an action and returns a future for its result. Raises
+           MailboxFull rather than waiting when the mailbox is full."""
+        future = self._new_future()
+        try:
+            self._mailbox.put_nowait((action, args, future))
+        except asyncio.QueueFull:
+            raise MailboxFull(f"Game {self.game_id} has too many pending actions") from None
+        return future
+
+    async def stop(self) -> None:
+        """Runs the actions already queued, then ends the actor's task"""
+        if self._task is None or self._is_stopped:
+            return
+        await self._mailbox.put(_STOP)
+        await self._task
+
+    def _new_future(self) -> asyncio.Future:
+        if self._is_stopped:
+            raise RuntimeError(f"The actor for game {self.game_id} has stopped")
+        return asyncio.get_running_loop().create_future()
+
+    async def _run(self) -> None:
+        mailbox = self._mailbox
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(mailbox.get(), self._idle_timeout)
+                except asyncio.TimeoutError:
+                    # A message may have arrived while the wait was cancelled
+                    if mailbox.empty():
+                        break
+                    continue
+                if message is _STOP:
+                    break
+                action, args, future = message
+                if future.cancelled():
+                    continue
+                try:
+                    # A game that fails to load fails only this action
+                    game = self._registry.get(self.game_id)
+                    if game is None:
+                        raise GameNotFound(self.game_id)
+                    try:
+                        result = action(game, *args)
+                    finally:
+                        # Store the action's events before answering it
+                        self._registry.sync(self.game_id)
+                except Exception as error:
+                    future.set_exception(error)
+                else:
+                    future.set_result(result)
+        finally:
+            # Nothing awaits between here and the end of the task, so no
+            # submit can reach this actor once it is marked stopped
+            self._is_stopped = True
+            while not mailbox.empty():
+                message = mailbox.get_nowait()
+                if message is not _STOP and not message[2].done():
+                    message[2].set_exception(RuntimeError(f"The actor for game {self.game_id} has stopped"))
+            if self._on_stop is not None:
+                self._on_stop(self)
+
+
+class GameActorSystem():
+    """
+    GameActorSystem: Starts and finds the actor of each live game
+
+    Actors are started on the first action for a game and exit after
+    idle_timeout seconds without one. Idle games are evicted from the
+    registry every eviction_interval seconds by a task started with the
+    system. Everything here runs on the event loop it is used from, so it
+    must be shared only within one loop, as under an ASGI server.
+
+    Attributes:
+        registry (GameRegistry): Where the games themselves live
+    """
+    def __init__(self, registry: Optional[GameRegistry] = None, mailbox_size: int = DEFAULT_MAILBOX_SIZE,
+                 idle_timeout: float = DEFAULT_ACTOR_IDLE_TIMEOUT,
+                 eviction_interval: float = DEFAULT_EVICTION_INTERVAL):
+        self.registry = registry if registry is not None else GameRegistry()
+        self._mailbox_size = mailbox_size
+        self._idle_timeout = idle_timeout
+        self._eviction_interval = eviction_interval
+        self._actors: Dict[str, GameActor] = {}
+        self._eviction_task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        """Returns the number of running actors"""
+        return len(self._actors)
+
+    def start(self) -> None:
+        """Starts evicting idle games. Called by the first request if needed;
+           must run on the event loop that will use the system."""
+        if self._eviction_task is None:
+            self._eviction_task = asyncio.get_running_loop().create_task(
+                self.evict_idle_games(self._eviction_interval), name="evict-idle-games")
+
+    async def create_game(self, game_id: Optional[str] = None) -> str:
+        """Registers a new game and returns its id"""
+        self.start()
+        return self.registry.create(game_id).game_id
+
+    def get_actor(self, game_id: str) -> GameActor:
+        """Returns the game's actor, starting one if needed"""
+        self.start()
+        actor = self._actors.get(game_id)
+        if actor is None:
+            actor = GameActor(game_id, self.registry, self._mailbox_size, self._idle_timeout, self._forget)
+            self._actors[game_id] = actor
+            actor.start()
+        return actor
+
+    async def submit(self, game_id: str, action: Callable, *args):
+        """Runs an action on a game's actor and returns its result"""
+        return await self.get_actor(game_id).submit(action, *args)
+
+    def submit_nowait(self, game_id: str, action: Callable, *args) -> asyncio.Future:
+        """Queues an action on a game's actor, raising MailboxFull if it is busy"""
+        return self.get_actor(game_id).submit_nowait(action, *args)
+
+    async def evict_idle_games(self, interval: float) -> None:
+        """Calls the registry's evict_idle() every interval seconds. Run it
+           as a task on the same loop so eviction never lands mid-action."""
+        while True:
+            await asyncio.sleep(interval)
+            self.registry.evict_idle()
+
+    async def close(self) -> None:
+        """Stops evicting games, then stops every actor after its queued
+           actions have run"""
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            await asyncio.gather(self._eviction_task, return_exceptions=True)
+            self._eviction_task = None
+        await asyncio.gather(*(actor.stop() for actor in list(self._actors.values())))
+
+    def _forget(self, actor: GameActor) -> None:
+        if self._actors.get(actor.game_id) is actor:
+            del self._actors[actor.game_id]
+
+
+# Actions submitted by views and consumers. Each takes the game and the
+# request's arguments and returns a JSON-serializable dict. Invalid requests
+# raise ValueError (or TypeError for arguments of the wrong type).
+
+def _get_player(game, player_id: int):
+    player_id = int(player_id)
+    if not 0 <= player_id < len(game.player_table):
+        raise ValueError(f"No player {player_id} in game {game.game_id}")
+    return game.player_table.get_player(player_id)
+
+
+def _get_turn(game, player_id: int):
+    """Returns the current turn, if it is this player's"""
+    player = _get_player(game, player_id)
+    if game.state != GameState.IN_PROGRESS:
+        raise ValueError(f"Game {game.game_id} is not in progress")
+    if player != game.current_turn.p:
+        raise ValueError(f"It is not player {player.playerID}'s turn")
+    return game.current_turn
+
+
+def join_game(game, player_name: str) -> dict:
+    player = game.add_player(str(player_name))
+    return {'player_id': player.playerID, 'character': player.character}
+
+
+def start_game(game) -> dict:
+    game.start_game()
+    return {'current_player_id': game.current_turn.p.playerID}
+
+
+def move_player(game, player_id: int, space_id: int) -> dict:
+    turn = _get_turn(game, player_id)
+    space_id = int(space_id)
+    if not 0 <= space_id < game.game_board.get_space_count():
+        raise ValueError(f"No space {space_id}")
+    return {'moved': turn.take_action(TurnAction.MOVE, game.game_board.get_space(space_id))}
+
+
+def make_suggestion(game, player_id: int, suspect: str, weapon: str, room: str) -> dict:
+    card = _get_turn(game, player_id).take_action(TurnAction.SUGGESTION, suspect, weapon, room)
+    return {'disproved_by': None if card is None else card.get_name()}
+
+
+def make_accusation(game, player_id: int, suspect: str, weapon: str, room: str) -> dict:
+    return {'correct': _get_turn(game, player_id).take_action(TurnAction.ACCUSATION, suspect, weapon, room)}
+
+
+def end_turn(game, player_id: int) -> dict:
+    _get_turn(game, player_id)
+    turn = game.end_turn()
+    return {'current_player_id': None if turn is None else turn.p.playerID}
+
+
+# Action name -> (action, names of its arguments in a request)
+GAME_ACTIONS: Dict[str, Tuple[Callable, Tuple[str, ...]]] = {
+    'join_game': (join_game, ('player_name',)),
+    'start_game': (start_game, ()),
+    'move_player': (move_player, ('player_id', 'space_id')),
+    'make_suggestion': (make_suggestion, ('player_id', 'suspect', 'weapon', 'room')),
+    'make_accusation': (make_accusation, ('player_id', 'suspect', 'weapon', 'room')),
+    'end_turn': (end_turn, ('player_id',)),
+}
@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from Backend.GameManagement.game_actor import GameActorSystem
+from Backend.GameManagement.game_pool import GamePool
+from Backend.GameManagement.game_registry import GameRegistry, FileGameStore
+
+if not getattr(settings, 'GAME_STORE_DIR', None):
+    raise ImproperlyConfigured("GAME_STORE_DIR must name the directory where games are stored")
+
+# Runs this server's games: in a pool of worker processes when
+# GAME_WORKER_PROCESSES is set, otherwise as actors on this process's event
+# loop. Both provide create_game, submit and submit_nowait, and both keep
+# their games in GAME_STORE_DIR.
+if settings.GAME_WORKER_PROCESSES:
+    game_engine = GamePool(str(settings.GAME_STORE_DIR), settings.GAME_WORKER_PROCESSES)
+else:
+    game_engine = GameActorSystem(GameRegistry(FileGameStore(str(settings.GAME_STORE_DIR))))
+
+
+async def game_engine_lifespan(scope, receive, send) -> None:
+    """
+    ASGI lifespan handler: starts the game engine on the server's event loop
+    at startup and stops it, after its queued actions, at shutdown. Servers
+    without lifespan support start the engine on its first request instead.
+    """
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            game_engine.start()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await game_engine.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
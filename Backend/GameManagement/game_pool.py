@@ -0,0 +1,303 @@
+import asyncio
+import hashlib
+import itertools
+import multiprocessing
+import os
+import time
+import uuid
+from bisect import bisect, insort
+from typing import Callable, Dict, List, Optional, Tuple
+from Backend.GameManagement.game_actor import MailboxFull, GameNotFound
+from Backend.GameManagement.game_registry import GameRegistry, FileGameStore, DEFAULT_IDLE_TIMEOUT
+
+# Points each worker gets on the hash ring; more points even out the share
+# of games each worker owns
+DEFAULT_RING_REPLICAS = 128
+# Requests a worker may have in flight before submit waits. Keeps the pipes
+# well under their buffer size, so neither side ever blocks on a send.
+DEFAULT_MAX_PENDING = 64
+# Seconds between a worker's evict_idle() calls
+DEFAULT_EVICTION_INTERVAL = 60
+
+# Requests understood by a worker
+_CREATE = 0
+_ACTION = 1
+_REBALANCE = 2
+_STOP = 3
+
+
+def _ring_hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing():
+    """
+    HashRing: Consistent hashing of game ids onto nodes
+
+    Each node is placed at several points on a ring of 64-bit hashes; a key
+    belongs to the first node point at or after its own hash. Adding a node
+    only takes keys from the nodes next to its points, about 1/n of them.
+    """
+    def __init__(self, nodes=(), replicas: int = DEFAULT_RING_REPLICAS):
+        self.replicas = replicas
+        self._points: List[Tuple[int, str]] = []
+        for node in nodes:
+            self.add_node(node)
+
+    def __len__(self) -> int:
+        """Returns the number of nodes"""
+        return len(self._points) // self.replicas
+
+    def add_node(self, node: str):
+        for replica in range(self.replicas):
+            insort(self._points, (_ring_hash(f"{node}#{replica}"), node))
+
+    def remove_node(self, node: str):
+        self._points = [point for point in self._points if point[1] != node]
+
+    def get_node(self, key: str) -> str:
+        """Returns the node that owns a key"""
+        if not self._points:
+            raise LookupError("The hash ring has no nodes")
+        index = bisect(self._points, (_ring_hash(key), ""))
+        return self._points[index % len(self._points)][1]
+
+
+def _run_worker(conn, name: str, store_dir: str, idle_timeout: float, eviction_interval: float, replicas: int):
+    """Entry point of a worker process. Runs requests from the router one at
+       a time against the worker's own GameRegistry, until told to stop.
+       Each action's events are in the store before its reply is sent."""
+    registry = GameRegistry(FileGameStore(store_dir), idle_timeout=idle_timeout)
+    next_eviction = time.monotonic() + eviction_interval
+    while True:
+        now = time.monotonic()
+        if now >= next_eviction:
+            registry.evict_idle()
+            next_eviction = now + eviction_interval
+        if not conn.poll(next_eviction - now):
+            continue
+        try:
+            request_id, request, game_id, args = conn.recv()
+        except EOFError:
+            # The router is gone; keep the games for whoever runs next
+            registry.flush()
+            return
+        try:
+            if request == _ACTION:
+                game = registry.get(game_id)
+                if game is None:
+                    raise GameNotFound(game_id)
+                action, action_args = args
+                try:
+                    result = action(game, *action_args)
+                finally:
+                    registry.sync(game_id)
+            elif request == _CREATE:
+                result = registry.create(game_id).game_id
+            elif request == _REBALANCE:
+                # args lists every worker; release the games now owned by another
+                ring = HashRing(args, replicas)
+                result = sum(registry.release(live_id) for live_id in registry.get_game_ids()
+                             if ring.get_node(live_id) != name)
+            else:
+                registry.flush()
+                conn.send((request_id, True, None))
+                return
+        except Exception as error:
+            reply = (request_id, False, error)
+        else:
+            reply = (request_id, True, result)
+        try:
+            conn.send(reply)
+        except Exception as error:
+            # Results and errors must pickle to cross the pipe
+            conn.send((request_id, False, RuntimeError(f"Could not return the result: {error!r}")))
+
+
+class _Worker():
+    """The router's side of one worker process."""
+    __slots__ = ("name", "process", "conn", "pending", "has_room")
+
+    def __init__(self, name: str, process, conn):
+        self.name = name
+        self.process = process
+        self.conn = conn
+        self.pending: Dict[int, asyncio.Future] = {}
+        self.has_room = asyncio.Event()
+        self.has_room.set()
+
+
+class GamePool():
+    """
+    GamePool: Runs live games in a pool of worker processes
+
+    Games are spread over the workers by a HashRing of their ids, so game
+    engine work scales past the one core a single process can use. Each
+    worker runs its requests one at a time against its own GameRegistry, so
+    actions on any one game are still serialized. The pool itself is the
+    router: it lives on the ASGI process's event loop and talks to each
+    worker over a multiprocessing pipe, reading replies with the loop's
+    add_reader (Unix only).
+
+    Actions are module-level functions called as action(game, *args) in the
+    worker, like those in GAME_ACTIONS; they and their arguments and results
+    must pickle. All workers share one FileGameStore directory, which is how
+    games move between them. A worker appends each action's events to the
+    store before replying, so when a worker exits its games' new owners load
+    every acknowledged action. When add_worker() changes which worker owns a
+    game, the old owner releases it to the store and the new owner loads it
+    on its next action.
+
+    Attributes:
+        store_dir (str): Directory of the workers' shared FileGameStore
+    """
+    def __init__(self, store_dir: str, worker_count: Optional[int] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 eviction_interval: float = DEFAULT_EVICTION_INTERVAL, replicas: int = DEFAULT_RING_REPLICAS):
+        if not store_dir:
+            raise ValueError("GamePool needs a store directory shared by its workers")
+        self.store_dir = str(store_dir)
+        self._initial_workers = worker_count or os.cpu_count() or 1
+        self._max_pending = max_pending
+        self._idle_timeout = idle_timeout
+        self._eviction_interval = eviction_interval
+        self._context = multiprocessing.get_context("spawn")
+        self._ring = HashRing(replicas=replicas)
+        self._workers: Dict[str, _Worker] = {}
+        self._worker_names = (f"worker-{index}" for index in itertools.count())
+        self._request_ids = itertools.count()
+        self._replicas = replicas
+        # Set while add_worker() hands games over; new requests wait for it
+        self._rebalancing: Optional[asyncio.Event] = None
+        self._is_started = False
+
+    def get_worker_count(self) -> int:
+        return len(self._workers)
+
+    def start(self) -> None:
+        """Starts the worker processes. Called by the first request if needed;
+           must run on the event loop that will use the pool."""
+        if self._is_started:
+            return
+        self._is_started = True
+        for _ in range(self._initial_workers):
+            self._spawn()
+
+    async def create_game(self, game_id: Optional[str] = None) -> str:
+        """Registers a new game on its worker and returns its id"""
+        game_id = game_id or str(uuid.uuid4())
+        worker = await self._route(game_id)
+        return await self._send(worker, _CREATE, game_id, None)
+
+    async def submit(self, game_id: str, action: Callable, *args):
+        """Runs an action on a game's worker and returns its result, waiting
+           while the worker has max_pending requests in flight"""
+        while True:
+            # Route again after waiting, in case the game moved meanwhile
+            worker = await self._route(game_id)
+            if len(worker.pending) < self._max_pending:
+                break
+            worker.has_room.clear()
+            await worker.has_room.wait()
+        return await self._send(worker, _ACTION, game_id, (action, args))
+
+    def submit_nowait(self, game_id: str, action: Callable, *args) -> asyncio.Future:
+        """Sends an action to a game's worker and returns a future for its
+           result. Raises MailboxFull rather than waiting when the worker has
+           max_pending requests in flight or games are being moved."""
+        self.start()
+        if self._rebalancing is not None:
+            raise MailboxFull(f"Game {game_id} may be moving to another worker")
+        worker = self._workers[self._ring.get_node(game_id)]
+        if len(worker.pending) >= self._max_pending:
+            raise MailboxFull(f"Worker {worker.name} has too many pending actions")
+        return self._send(worker, _ACTION, game_id, (action, args))
+
+    async def add_worker(self) -> int:
+        """Starts another worker and moves to it the games the hash ring now
+           assigns it. Returns the number of live games moved; games only in
+           the store move without any work."""
+        self.start()
+        while self._rebalancing is not None:
+            await self._rebalancing.wait()
+        rebalancing = self._rebalancing = asyncio.Event()
+        try:
+            worker = self._spawn()
+            nodes = list(self._workers)
+            # Pipes are ordered, so each worker rebalances after every
+            # action already sent to it
+            moved = await asyncio.gather(*(self._send(other, _REBALANCE, None, nodes)
+                                           for other in list(self._workers.values()) if other is not worker))
+        finally:
+            self._rebalancing = None
+            rebalancing.set()
+        return sum(moved)
+
+    async def close(self) -> None:
+        """Stops every worker after its pending requests have run. Each saves
+           its live games to the store."""
+        workers = list(self._workers.values())
+        await asyncio.gather(*(self._send(worker, _STOP, None, None) for worker in workers),
+                             return_exceptions=True)
+        for worker in workers:
+            self._close_worker(worker, RuntimeError(f"Worker {worker.name} has stopped"))
+            worker.process.join()
+
+    async def _route(self, game_id: str) -> _Worker:
+        """Returns the game's worker once no games are being moved"""
+        self.start()
+        while self._rebalancing is not None:
+            await self._rebalancing.wait()
+        return self._workers[self._ring.get_node(game_id)]
+
+    def _send(self, worker: _Worker, request: int, game_id: Optional[str], args) -> asyncio.Future:
+        if worker.conn.closed:
+            raise RuntimeError(f"Worker {worker.name} has stopped")
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        worker.conn.send((request_id, request, game_id, args))
+        worker.pending[request_id] = future
+        return future
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        name = next(self._worker_names)
+        process = self._context.Process(target=_run_worker, name=f"clue_less-{name}", daemon=True,
+                                        args=(child_conn, name, self.store_dir, self._idle_timeout,
+                                              self._eviction_interval, self._replicas))
+        process.start()
+        child_conn.close()
+        worker = _Worker(name, process, parent_conn)
+        self._workers[name] = worker
+        self._ring.add_node(name)
+        asyncio.get_running_loop().add_reader(parent_conn.fileno(), self._on_readable, worker)
+        return worker
+
+    def _on_readable(self, worker: _Worker) -> None:
+        try:
+            while worker.conn.poll():
+                request_id, is_ok, result = worker.conn.recv()
+                future = worker.pending.pop(request_id)
+                if not future.done():
+                    if is_ok:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(result)
+        except (EOFError, OSError):
+            self._close_worker(worker, RuntimeError(f"Worker {worker.name} exited"))
+        worker.has_room.set()
+
+    def _close_worker(self, worker: _Worker, error: Exception) -> None:
+        if worker.conn.closed:
+            return
+        asyncio.get_running_loop().remove_reader(worker.conn.fileno())
+        worker.conn.close()
+        # Its games now hash to the remaining workers, which load them from
+        # the store with every action it acknowledged
+        del self._workers[worker.name]
+        self._ring.remove_node(worker.name)
+        for future in worker.pending.values():
+            if not future.done():
+                future.set_exception(error)
+        worker.pending.clear()
+        worker.has_room.set()
@@ -0,0 +1,303 @@
+import os
+import re
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+from Backend.gameboardGroupings.game_processor import GameProcessor
+
+DEFAULT_SHARD_COUNT = 16
+DEFAULT_MAX_LIVE_GAMES = 4096
+# Seconds a game may sit untouched before evict_idle() writes it out
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+# Game ids as routed by ws/games/<game_id>/; anything else could name a
+# path outside a FileGameStore's directory
+GAME_ID_PATTERN = re.compile(r"[\w-]+")
+
+
+def is_valid_game_id(game_id) -> bool:
+    """Returns True if game_id is a string matching GAME_ID_PATTERN"""
+    return isinstance(game_id, str) and GAME_ID_PATTERN.fullmatch(game_id) is not None
+
+
+class GameStore(ABC):
+    """
+    GameStore: Where the registry keeps its games' encoded logs
+
+    A game is saved whole by save() and then grows by append(), so keeping
+    a live game up to date costs a few bytes per action. load() returns
+    everything saved and appended since, which is what GameProcessor's
+    from_bytes() reads.
+    """
+    @abstractmethod
+    def save(self, game_id: str, data: bytes) -> None:
+        """Replace whatever is stored for a game."""
+
+    @abstractmethod
+    def append(self, game_id: str, data: bytes) -> None:
+        """Add bytes after what is stored for a game."""
+
+    @abstractmethod
+    def load(self, game_id: str) -> Optional[bytes]:
+        """Return what is stored for a game, or None."""
+
+    @abstractmethod
+    def delete(self, game_id: str) -> None:
+        pass
+
+
+class InMemoryGameStore(GameStore):
+    """Keeps games in a dict. Useful for tests and single-process
+    deployments where evicting only needs to shrink the live game objects."""
+    def __init__(self):
+        self._games: Dict[str, bytearray] = {}
+        self._lock = threading.Lock()
+
+    def save(self, game_id: str, data: bytes) -> None:
+        with self._lock:
+            self._games[game_id] = bytearray(data)
+
+    def append(self, game_id: str, data: bytes) -> None:
+        with self._lock:
+            self._games.setdefault(game_id, bytearray()).extend(data)
+
+    def load(self, game_id: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._games.get(game_id)
+            return None if data is None else bytes(data)
+
+    def delete(self, game_id: str) -> None:
+        with self._lock:
+            self._games.pop(game_id, None)
+
+
+class FileGameStore(GameStore):
+    """Keeps each game in its own file in a directory. Game ids must match
+    GAME_ID_PATTERN."""
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, game_id: str) -> str:
+        if not is_valid_game_id(game_id):
+            raise ValueError(f"Invalid game id {game_id!r}")
+        return os.path.join(self.directory, f"{game_id}.game")
+
+    def save(self, game_id: str, data: bytes) -> None:
+        # Write then rename, so a crash never leaves a half-written game
+        temp_path = self._path(game_id) + ".tmp"
+        with open(temp_path, "wb") as game_file:
+            game_file.write(data)
+        os.replace(temp_path, self._path(game_id))
+
+    def append(self, game_id: str, data: bytes) -> None:
+        # A crash mid-append leaves a torn last event, which loading drops
+        with open(self._path(game_id), "ab") as game_file:
+            game_file.write(data)
+
+    def load(self, game_id: str) -> Optional[bytes]:
+        try:
+            with open(self._path(game_id), "rb") as game_file:
+                return game_file.read()
+        except FileNotFoundError:
+            return None
+
+    def delete(self, game_id: str) -> None:
+        try:
+            os.remove(self._path(game_id))
+        except FileNotFoundError:
+            pass
+
+
+class _Shard():
+    """One lock and the live games whose ids hash to it, least recently
+    used first, with how many of each game's events are in the store."""
+    __slots__ = ("lock", "games", "last_used", "stored_events")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.games: "OrderedDict[str, GameProcessor]" = OrderedDict()
+        self.last_used: Dict[str, float] = {}
+        self.stored_events: Dict[str, int] = {}
+
+
+class GameRegistry():
+    """
+    GameRegistry: Owns the live GameProcessor instances of this process
+
+    Games are spread over shards by a hash of their id, each with its own
+    lock, so requests for different games rarely contend. Lookups are a
+    dict access. Each shard keeps its games in least-recently-used order;
+    when a shard holds more than its share of max_live_games, or a game has
+    been idle longer than idle_timeout when evict_idle() runs, the game is
+    saved to the store and dropped from memory. The next get() for it loads
+    it back, history and all.
+
+    The store keeps each game's encoded log. A game is written whole when
+    it is created or evicted, and sync() appends the events logged since,
+    so a caller that syncs after each action can lose a process without
+    losing its games. The stored copy is only replaced, never dropped,
+    until the game is removed.
+
+    The registry only guards its own maps; callers must still serialize
+    actions on any one game.
+
+    Attributes:
+        store (GameStore): Where games are kept when not in memory, and as they change
+        idle_timeout (float): Seconds of inactivity before evict_idle() evicts a game
+    """
+    def __init__(self, store: Optional[GameStore] = None, shard_count: int = DEFAULT_SHARD_COUNT,
+                 max_live_games: int = DEFAULT_MAX_LIVE_GAMES, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+                 factory: Callable[..., GameProcessor] = GameProcessor,
+                 save: Callable[[GameProcessor], bytes] = GameProcessor.to_bytes,
+                 load: Callable[[bytes], GameProcessor] = GameProcessor.from_bytes,
+                 clock: Callable[[], float] = time.monotonic):
+        if shard_count < 1 or max_live_games < 1:
+            raise ValueError("Shard count and max live games must be at least 1")
+        self.store = store if store is not None else InMemoryGameStore()
+        self.idle_timeout = idle_timeout
+        self._shards: List[_Shard] = [_Shard() for _ in range(shard_count)]
+        self._games_per_shard = -(-max_live_games // shard_count)
+        self._factory = factory
+        self._save = save
+        self._load = load
+        self._clock = clock
+
+    def _shard(self, game_id: str) -> _Shard:
+        return self._shards[zlib.crc32(game_id.encode("utf-8")) % len(self._shards)]
+
+    def __len__(self) -> int:
+        """Returns the number of games in memory"""
+        return sum(len(shard.games) for shard in self._shards)
+
+    def __contains__(self, game_id: str) -> bool:
+        """Returns True if the game is in memory"""
+        return game_id in self._shard(game_id).games
+
+    def get_game_ids(self) -> List[str]:
+        """Returns the ids of the games in memory"""
+        game_ids = []
+        for shard in self._shards:
+            with shard.lock:
+                game_ids.extend(shard.games)
+        return game_ids
+
+    def create(self, game_id: Optional[str] = None) -> GameProcessor:
+        """Creates, registers, stores and returns a new game"""
+        game = self._factory(game_id=game_id)
+        shard = self._shard(game.game_id)
+        with shard.lock:
+            if game.game_id in shard.games or self.store.load(game.game_id) is not None:
+                raise ValueError(f"Game {game.game_id} already exists")
+            self._write(shard, game.game_id, game)
+            self._insert(shard, game.game_id, game)
+        return game
+
+    def get(self, game_id: str) -> Optional[GameProcessor]:
+        """Returns a game, loading it from the store if it was evicted, or
+           None if there is no such game"""
+        shard = self._shard(game_id)
+        with shard.lock:
+            game = shard.games.get(game_id)
+            if game is not None:
+                shard.games.move_to_end(game_id)
+                shard.last_used[game_id] = self._clock()
+                return game
+            data = self.store.load(game_id)
+            if data is None:
+                return None
+            game = self._load(data)
+            if game.event_log.torn_bytes:
+                # Appending after a torn event would glue it to the next
+                # one, so store the game whole first
+                self._write(shard, game_id, game)
+            else:
+                # The stored copy stays until the game is written again
+                shard.stored_events[game_id] = len(game.event_log)
+            self._insert(shard, game_id, game)
+            return game
+
+    def sync(self, game_id: str) -> int:
+        """Appends the events a live game has logged since it was last
+           stored. Returns the number appended."""
+        shard = self._shard(game_id)
+        with shard.lock:
+            game = shard.games.get(game_id)
+            if game is None:
+                return 0
+            stored = shard.stored_events.get(game_id)
+            if stored is None:
+                self._write(shard, game_id, game)
+                return len(game.event_log)
+            tail = game.event_log.events_since(stored)
+            if tail:
+                self.store.append(game_id, tail)
+                shard.stored_events[game_id] = len(game.event_log)
+            return len(game.event_log) - stored
+
+    def remove(self, game_id: str) -> bool:
+        """Forgets a game, in memory and in the store. Returns False if it
+           was not in memory."""
+        shard = self._shard(game_id)
+        with shard.lock:
+            game = shard.games.pop(game_id, None)
+            shard.last_used.pop(game_id, None)
+            shard.stored_events.pop(game_id, None)
+            self.store.delete(game_id)
+        return game is not None
+
+    def release(self, game_id: str) -> bool:
+        """Saves a game to the store and drops it from memory, e.g. to hand
+           it to another process sharing the store. Returns False if it was
+           not in memory."""
+        shard = self._shard(game_id)
+        with shard.lock:
+            if game_id not in shard.games:
+                return False
+            self._evict(shard, game_id)
+        return True
+
+    def evict_idle(self) -> int:
+        """Saves and drops every game idle longer than idle_timeout. Returns
+           the number evicted. Call periodically, e.g. from a background task."""
+        cutoff = self._clock() - self.idle_timeout
+        evicted = 0
+        for shard in self._shards:
+            with shard.lock:
+                while shard.games:
+                    game_id = next(iter(shard.games))
+                    if shard.last_used[game_id] > cutoff:
+                        break
+                    self._evict(shard, game_id)
+                    evicted += 1
+        return evicted
+
+    def flush(self) -> int:
+        """Saves and drops every live game, e.g. at shutdown. Returns the
+           number saved."""
+        saved = 0
+        for shard in self._shards:
+            with shard.lock:
+                while shard.games:
+                    self._evict(shard, next(iter(shard.games)))
+                    saved += 1
+        return saved
+
+    def _insert(self, shard: _Shard, game_id: str, game: GameProcessor):
+        shard.games[game_id] = game
+        shard.last_used[game_id] = self._clock()
+        while len(shard.games) > self._games_per_shard:
+            self._evict(shard, next(iter(shard.games)))
+
+    def _evict(self, shard: _Shard, game_id: str):
+        game = shard.games.pop(game_id)
+        del shard.last_used[game_id]
+        self._write(shard, game_id, game)
+        del shard.stored_events[game_id]
+
+    def _write(self, shard: _Shard, game_id: str, game: GameProcessor):
+        # Rewriting the whole game also folds in any appended tails
+        self.store.save(game_id, self._save(game))
+        shard.stored_events[game_id] = len(game.event_log)
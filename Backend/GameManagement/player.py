@@ -1,33 +1,238 @@
+from array import array
+from typing import List, Optional
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.cardGroupings.Hand import Hand
+from Backend.gameboardGroupings.space import Space
+
+NO_CHARACTER = -1
+NO_LOCATION = -1
+
+# Hand bitmasks fit in an unsigned 64-bit array entry for catalogs this size
+MAX_PACKED_HAND_CARDS = 64
+
+
+class PlayerTable():
+    """
+    PlayerTable: One game's players stored as parallel arrays
+
+    Row i holds the player in seat i. Each field is its own array, so loops
+    over every player (turn advance, disproval, broadcast targeting) scan
+    contiguous memory instead of chasing Player objects. Player objects are
+    views onto a row; add_player creates exactly one per row.
+
+    Attributes:
+        names (list): Player name of each row
+        player_ids (array): Player id of each row
+        character_ids (array): Suspect card id of each row's character, or NO_CHARACTER
+        location_ids (array): Space id each row is in, or NO_LOCATION
+        prev_location_ids (array): Space id each row was in before its last move
+        eliminated (bytearray): 1 for each row that has been eliminated
+        hand_masks (array): Card bitmask of each row's hand
+    """
+    def __init__(self, board=None):
+        self._board = board
+        self.names: List[str] = []
+        self.player_ids = array("i")
+        self.character_ids = array("h")
+        self.location_ids = array("h")
+        self.prev_location_ids = array("h")
+        self.eliminated = bytearray()
+        self.hand_masks = array("Q") if Card.count() <= MAX_PACKED_HAND_CARDS else []
+        self._active_count: int = 0
+        self._views: List[Player] = []
+
+    def __len__(self) -> int:
+        return len(self._views)
+
+    def add_player(self, name: str) -> "Player":
+        """Add a row for a new player and return its view. The player id
+           defaults to the row."""
+        row = len(self._views)
+        self.names.append(name)
+        self.player_ids.append(row)
+        self.character_ids.append(NO_CHARACTER)
+        self.location_ids.append(NO_LOCATION)
+        self.prev_location_ids.append(NO_LOCATION)
+        self.eliminated.append(0)
+        self.hand_masks.append(0)
+        self._active_count += 1
+        player = Player._view(self, row)
+        self._views.append(player)
+        return player
+
+    def load_rows(self, names, player_ids: bytes, character_ids: bytes, location_ids: bytes,
+                  prev_location_ids: bytes, eliminated: bytes, hand_masks):
+        """Replace every column, e.g. from a snapshot. Views of rows that
+           still exist stay valid."""
+        self.names = list(names)
+        for column, data in ((self.player_ids, player_ids), (self.character_ids, character_ids),
+                             (self.location_ids, location_ids), (self.prev_location_ids, prev_location_ids)):
+            del column[:]
+            column.frombytes(data)
+        self.eliminated = bytearray(eliminated)
+        del self.hand_masks[:]
+        self.hand_masks.extend(hand_masks)
+        self._active_count = len(self.eliminated) - sum(self.eliminated)
+        del self._views[len(self.names):]
+        for row in range(len(self._views), len(self.names)):
+            self._views.append(Player._view(self, row))
+
+    def get_player(self, row: int) -> "Player":
+        """Return the view of a row."""
+        return self._views[row]
+
+    def get_players(self) -> List["Player"]:
+        """Return the views of every row, in seat order."""
+        return list(self._views)
+
+    def get_space(self, space_id: int) -> Optional[Space]:
+        """Return the board space with the given id, or None."""
+        if space_id == NO_LOCATION or self._board is None:
+            return None
+        return self._board.get_space(space_id)
+
+    def set_location(self, row: int, space: Optional[Space]):
+        """Record the space a row is in."""
+        if space is None:
+            self.location_ids[row] = NO_LOCATION
+            return
+        if self._board is None:
+            self._board = space.get_board()
+        self.location_ids[row] = space.get_space_id()
+
+    def eliminate(self, row: int) -> bool:
+        """Mark a row eliminated. Returns False if it already was."""
+        if self.eliminated[row]:
+            return False
+        self.eliminated[row] = 1
+        self._active_count -= 1
+        return True
+
+    def active_count(self) -> int:
+        """Return the number of players not eliminated."""
+        return self._active_count
+
+    def active_rows(self) -> List[int]:
+        """Return the rows not eliminated, in seat order."""
+        return [row for row, is_out in enumerate(self.eliminated) if not is_out]
+
+    def rows_in_space(self, space_id: int) -> List[int]:
+        """Return the rows located in a space, in seat order."""
+        return [row for row, location in enumerate(self.location_ids) if location == space_id]
 
-from Backend.cardGroupings.Card import Card
-import Backend.GameManagement.gameboardGrouping
-from Backend.GameManagement.gameboardGrouping.space import Space, SpaceType
 
 class Player():
-    playerName: str
-    playerID: int
-    character: str
-    playerHand: list
-    currLocation: Space
-    prevLocation: Space
-    isEliminated: bool
+    """
+    Player: A view of one row of a PlayerTable
+
+    The attributes below read and write the table's arrays. playerHand
+    returns a Hand built from the row's bitmask; assign it back (or use
+    receive_card_dealt) to change the hand.
+
+    Attributes:
+        playerName (str): Name of the player
+        playerID (int): Id of the player
+        character (str): Name of the player's suspect, or None
+        playerHand (Hand): The player's cards
+        currLocation (Space): Space the player is in
+        prevLocation (Space): Space the player was in before their last move
+        isEliminated (bool): True once the player has made a false accusation
+    """
+    __slots__ = ("_table", "_row")
 
     def __init__(self, name: str):
-        self.playerName = name
-        self.isEliminated = False
+        # A player created on its own gets a single-row table
+        table = PlayerTable()
+        table.add_player(name)
+        self._table = table
+        self._row = 0
+        table._views[0] = self
 
-    def receive_card_dealt(self, card: Card):
-        self.playerHand.add_card(card)
+    @classmethod
+    def _view(cls, table: PlayerTable, row: int) -> "Player":
+        """Build the view of a table row. Only PlayerTable should call this."""
+        player = object.__new__(cls)
+        player._table = table
+        player._row = row
+        return player
 
-    def get_valid_moves(self):
-        # returns a list of Space objects
-        adj = self.currLocation.adjacent_spaces()
-        returnList = []
-        for s in adj:
-            if s.get_space_type() == SpaceType.HALLWAY and is_instance(s, Hallway) and s.is_empty():
-                h =
-                returnList.append(s)
+    def __repr__(self) -> str:
+        return f"Player({self.playerName!r})"
+
+    def get_row(self) -> int:
+        return self._row
+
+    def get_table(self) -> PlayerTable:
+        return self._table
+
+    @property
+    def playerName(self) -> str:
+        return self._table.names[self._row]
+
+    @playerName.setter
+    def playerName(self, name: str):
+        self._table.names[self._row] = name
+
+    @property
+    def playerID(self) -> int:
+        return self._table.player_ids[self._row]
+
+    @playerID.setter
+    def playerID(self, player_id: int):
+        self._table.player_ids[self._row] = player_id
+
+    @property
+    def character(self) -> Optional[str]:
+        character_id = self._table.character_ids[self._row]
+        return None if character_id == NO_CHARACTER else Card.from_id(character_id).get_name()
+
+    @character.setter
+    def character(self, name: str):
+        self._table.character_ids[self._row] = Card(name, CardType.SUSPECT).get_id()
+
+    @property
+    def playerHand(self) -> Hand:
+        return Hand.from_mask(self._table.hand_masks[self._row])
 
-        return returnList
+    @playerHand.setter
+    def playerHand(self, hand: Hand):
+        self._table.hand_masks[self._row] = hand.get_mask()
 
+    @property
+    def currLocation(self) -> Optional[Space]:
+        return self._table.get_space(self._table.location_ids[self._row])
 
+    @currLocation.setter
+    def currLocation(self, space: Optional[Space]):
+        self._table.set_location(self._row, space)
+
+    @property
+    def prevLocation(self) -> Optional[Space]:
+        return self._table.get_space(self._table.prev_location_ids[self._row])
+
+    @prevLocation.setter
+    def prevLocation(self, space: Optional[Space]):
+        self._table.prev_location_ids[self._row] = NO_LOCATION if space is None else space.get_space_id()
+
+    @property
+    def isEliminated(self) -> bool:
+        return bool(self._table.eliminated[self._row])
+
+    @isEliminated.setter
+    def isEliminated(self, is_eliminated: bool):
+        if is_eliminated:
+            self._table.eliminate(self._row)
+        elif self._table.eliminated[self._row]:
+            raise ValueError("An eliminated player cannot rejoin the game")
+
+    def receive_card_dealt(self, card: Card):
+        hand = self.playerHand
+        hand.add_card(card)
+        self.playerHand = hand
+
+    def receive_hand(self, hand: Hand):
+        self.playerHand = hand
+
+    def get_valid_moves(self):
+        # returns a list of Space objects
+        return self.currLocation.get_valid_moves()
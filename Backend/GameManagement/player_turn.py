@@ -1,39 +1,101 @@
-
-from Backend.GameManagement.Actions import Actions, Suggestion, Accusation, Move
+from enum import IntFlag
+from typing import Optional, TYPE_CHECKING
+from Backend.GameManagement.Actions import Suggestion, Accusation, Move
 from Backend.GameManagement.player import Player
-from Backend.GameManagement.gameboardGrouping import game_board, game_processor, space
-from Backend.cardGroupings import Card, Deck, Hand
+
+if TYPE_CHECKING:
+    from Backend.gameboardGroupings.game_processor import GameProcessor
+
+class TurnAction(IntFlag):
+    """The actions a player may take, as bits of one small integer"""
+    NONE = 0
+    SUGGESTION = 1
+    ACCUSATION = 2
+    MOVE = 4
+
+_ACTION_CLASSES = {
+    TurnAction.SUGGESTION: Suggestion,
+    TurnAction.ACCUSATION: Accusation,
+    TurnAction.MOVE: Move,
+}
 
 class Player_Turn():
+    """One player's turn. The set of valid actions is computed from the turn
+    flags as a TurnAction bitmask and cached until a flag changes; action
+    objects are only built when an action is taken, and act on the game."""
     p: Player
+    game: Optional["GameProcessor"]
     isActive: bool
-    hasMadeAccusation: bool
-    hasMadeSuggestion: bool
-    hasEnteredRoom: bool
-    hasMoved: bool
 
-    def __init__(self, player: Player):
-        p = player
+    def __init__(self, player: Player, game: Optional["GameProcessor"] = None):
+        self.p = player
+        self.game = game
         self.isActive = False
-        self.hasMadeAccusation = False
-        self.hasMadeSuggestion = False
-        self.hasEnteredRoom = False
-        self.hasMoved = False
+        self._hasMadeAccusation = False
+        self._hasMadeSuggestion = False
+        self._hasEnteredRoom = False
+        self._hasMoved = False
+        self._valid_actions = None
+
+    @property
+    def hasMadeAccusation(self) -> bool:
+        return self._hasMadeAccusation
 
-    # isActive becomes True only when get_valid_actions() is called
-    def get_valid_actions(self):
-        return_list = []
+    @hasMadeAccusation.setter
+    def hasMadeAccusation(self, value: bool):
+        self._hasMadeAccusation = value
+        self._valid_actions = None
+
+    @property
+    def hasMadeSuggestion(self) -> bool:
+        return self._hasMadeSuggestion
+
+    @hasMadeSuggestion.setter
+    def hasMadeSuggestion(self, value: bool):
+        self._hasMadeSuggestion = value
+        self._valid_actions = None
+
+    @property
+    def hasEnteredRoom(self) -> bool:
+        return self._hasEnteredRoom
+
+    @hasEnteredRoom.setter
+    def hasEnteredRoom(self, value: bool):
+        self._hasEnteredRoom = value
+        self._valid_actions = None
+
+    @property
+    def hasMoved(self) -> bool:
+        return self._hasMoved
+
+    @hasMoved.setter
+    def hasMoved(self, value: bool):
+        self._hasMoved = value
+        self._valid_actions = None
+
+    # The game activates each turn as it starts; asking for the valid
+    # actions marks a turn active as well
+    def get_valid_actions(self) -> TurnAction:
         self.isActive = True
-        if self.hasEnteredRoom and not self.hasMadeSuggestion:
-            return_list.append(Suggestion(self.p, self))
-        if not self.hasMadeAccusation:
-            return_list.append(Accusation(self.p, self))
-        if not self.hasMoved:
-            return_list.append(Move(self.p, self))
-        return return_list
+        valid_actions = self._valid_actions
+        if valid_actions is None:
+            valid_actions = TurnAction.NONE
+            if self._hasEnteredRoom and not self._hasMadeSuggestion:
+                valid_actions |= TurnAction.SUGGESTION
+            if not self._hasMadeAccusation:
+                valid_actions |= TurnAction.ACCUSATION
+            if not self._hasMoved:
+                valid_actions |= TurnAction.MOVE
+            self._valid_actions = valid_actions
+        return valid_actions
 
-    def take_action(self, action: Actions):
-        action.perform_action()
+    def take_action(self, action: TurnAction, *args):
+        """Performs an action with the player's choices, e.g. the move's
+           destination, and returns its result"""
+        # Only one action at a time; a combined flag has no action class
+        if action not in _ACTION_CLASSES or not action & self.get_valid_actions():
+            raise ValueError(f"{action!r} is not a valid action this turn")
+        return _ACTION_CLASSES[action](self.p, self).perform_action(*args)
 
     def end_turn(self):
         self.isActive = False
@@ -41,4 +103,3 @@ class Player_Turn():
         self.hasMadeSuggestion = False
         self.hasEnteredRoom = False
         self.hasMoved = False
-
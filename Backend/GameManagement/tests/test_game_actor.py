@@ -0,0 +1,124 @@
+import asyncio
+import pytest
+from Backend.GameManagement.game_actor import GameActorSystem, GameNotFound, MailboxFull, GAME_ACTIONS
+from Backend.GameManagement.game_registry import GameRegistry, InMemoryGameStore
+from Backend.gameboardGroupings.game_processor import GameState
+
+def run(system, *calls):
+    """Runs (action name, game id, args...) calls on the system in order,
+       returning each result or the exception it raised, then closes it."""
+    async def main():
+        results = []
+        for name, game_id, *args in calls:
+            try:
+                results.append(await system.submit(game_id, GAME_ACTIONS[name][0], *args))
+            except Exception as error:
+                results.append(error)
+        await system.close()
+        return results
+    return asyncio.run(main())
+
+@pytest.fixture
+def system():
+    """Fixture to create an actor system holding one game with three players."""
+    system = GameActorSystem()
+    game = system.registry.create("game")
+    for name in ("Ann", "Bob", "Cy"):
+        game.add_player(name)
+    return system
+
+def test_turns_belong_to_the_current_player(system):
+    started, wrong_end, end, wrong_accusation = run(
+        system,
+        ("start_game", "game"),
+        ("end_turn", "game", 1),
+        ("end_turn", "game", "0"),
+        ("make_accusation", "game", 0, "Colonel Mustard", "Rope", "Hall"))
+    assert started == {'current_player_id': 0}
+    assert isinstance(wrong_end, ValueError)
+    assert end == {'current_player_id': 1}
+    assert isinstance(wrong_accusation, ValueError)
+    assert not system.registry.get("game").player_table.get_player(0).isEliminated
+
+def test_actions_need_a_game_in_progress(system):
+    early_move, early_end, started, restarted = run(
+        system,
+        ("move_player", "game", 0, 0),
+        ("end_turn", "game", 0),
+        ("start_game", "game"),
+        ("start_game", "game"))
+    assert isinstance(early_move, ValueError)
+    assert isinstance(early_end, ValueError)
+    assert started == {'current_player_id': 0}
+    assert isinstance(restarted, ValueError)
+    assert system.registry.get("game").state == GameState.IN_PROGRESS
+
+def test_actions_follow_the_turn_rules(system):
+    game = system.registry.get("game")
+    game.start_game()
+    player = game.current_turn.p
+    space_id = game.get_valid_moves(player)[0].get_space_id()
+    moved, second_move, bad_args, missing = run(
+        system,
+        ("move_player", "game", 0, space_id),
+        ("move_player", "game", 0, space_id),
+        ("move_player", "game", None, space_id),
+        ("end_turn", "missing", 0))
+    assert moved == {'moved': True}
+    assert isinstance(second_move, ValueError)
+    assert isinstance(bad_args, TypeError)
+    assert isinstance(missing, GameNotFound)
+
+def test_idle_games_are_evicted():
+    registry = GameRegistry(idle_timeout=0)
+    system = GameActorSystem(registry, eviction_interval=0.01)
+
+    async def main():
+        game_id = await system.create_game()
+        assert game_id in registry
+        await asyncio.sleep(0.05)
+        live = registry.get_game_ids()
+        await system.close()
+        return game_id, live
+    game_id, live = asyncio.run(main())
+    assert game_id not in live
+    assert registry.get(game_id) is not None
+
+def test_full_mailbox_is_rejected():
+    system = GameActorSystem(mailbox_size=1)
+    system.registry.create("game")
+
+    async def main():
+        first = system.submit_nowait("game", GAME_ACTIONS['join_game'][0], "Ann")
+        with pytest.raises(MailboxFull):
+            system.submit_nowait("game", GAME_ACTIONS['join_game'][0], "Bob")
+        result = await first
+        await system.close()
+        return result
+    assert asyncio.run(main())['player_id'] == 0
+
+def test_failed_lookups_fail_only_their_action():
+    store = InMemoryGameStore()
+    store.save("game", b"not a game")
+    system = GameActorSystem(GameRegistry(store))
+
+    async def main():
+        join = GAME_ACTIONS['join_game'][0]
+        with pytest.raises(ValueError):
+            await asyncio.wait_for(system.submit("game", join, "Ann"), 1)
+        with pytest.raises(AttributeError):
+            await asyncio.wait_for(system.submit(7, join, "Ann"), 1)
+        # The actor is still running and serves the game once it loads
+        store.delete("game")
+        system.registry.create("game")
+        result = await asyncio.wait_for(system.submit("game", join, "Ann"), 1)
+        await system.close()
+        return result
+    assert asyncio.run(main())['player_id'] == 0
+
+def test_actions_are_synced_to_the_store():
+    system = GameActorSystem()
+    game_id = system.registry.create().game_id
+    run(system, ("join_game", game_id, "Ann"), ("join_game", game_id, "Bob"))
+    recovered = GameRegistry(system.registry.store).get(game_id)
+    assert [player.playerName for player in recovered.players] == ["Ann", "Bob"]
@@ -0,0 +1,46 @@
+import asyncio
+import os
+import signal
+from Backend.GameManagement.game_actor import GAME_ACTIONS
+from Backend.GameManagement.game_pool import GamePool, HashRing
+from Backend.GameManagement.game_registry import GameRegistry, FileGameStore
+
+def action(name):
+    return GAME_ACTIONS[name][0]
+
+def test_hash_ring_moves_few_keys():
+    ring = HashRing(["worker-0", "worker-1"])
+    keys = [f"game-{index}" for index in range(1000)]
+    before = {key: ring.get_node(key) for key in keys}
+    ring.add_node("worker-2")
+    moved = [key for key in keys if ring.get_node(key) != before[key]]
+    # Only keys taken by the new node move
+    assert all(ring.get_node(key) == "worker-2" for key in moved)
+    assert 200 < len(moved) < 500
+    assert HashRing(["worker-2", "worker-0", "worker-1"]).get_node("game-1") == ring.get_node("game-1")
+
+def test_games_survive_new_and_exited_workers(tmp_path):
+    async def main():
+        pool = GamePool(str(tmp_path), 2)
+        # Fixed ids, so some of them always hash to the added worker
+        game_ids = [await pool.create_game(f"game-{index}") for index in range(12)]
+        for game_id in game_ids:
+            for name in ("Ann", "Bob", "Cy"):
+                await pool.submit(game_id, action("join_game"), name)
+            await pool.submit(game_id, action("start_game"))
+            await pool.submit(game_id, action("end_turn"), 0)
+        assert await pool.add_worker() > 0
+        for game_id in game_ids:
+            assert await pool.submit(game_id, action("end_turn"), 1) == {'current_player_id': 2}
+        # A worker that dies keeps every action it acknowledged
+        worker = next(iter(pool._workers.values()))
+        os.kill(worker.process.pid, signal.SIGKILL)
+        while pool.get_worker_count() == 3:
+            await asyncio.sleep(0.01)
+        for game_id in game_ids:
+            assert await pool.submit(game_id, action("end_turn"), 2) == {'current_player_id': 0}
+        await pool.close()
+        return game_ids
+    game_ids = asyncio.run(main())
+    registry = GameRegistry(FileGameStore(str(tmp_path)))
+    assert all(registry.get(game_id).current_turn.p.playerID == 0 for game_id in game_ids)
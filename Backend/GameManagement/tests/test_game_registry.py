@@ -0,0 +1,136 @@
+import pytest
+from Backend.GameManagement.game_registry import GameRegistry, GameStore, InMemoryGameStore, FileGameStore
+from Backend.GameManagement.player_turn import TurnAction
+from Backend.gameboardGroupings.game_processor import GameProcessor
+
+@pytest.fixture(params=["memory", "file"])
+def store(request, tmp_path):
+    """Fixture to create each kind of GameStore."""
+    return InMemoryGameStore() if request.param == "memory" else FileGameStore(str(tmp_path))
+
+def start(game):
+    for name in ("Ann", "Bob", "Cy"):
+        game.add_player(name)
+    game.start_game()
+    turn = game.current_turn
+    turn.take_action(TurnAction.MOVE, turn.p.get_valid_moves()[0])
+
+def test_game_store_is_abstract():
+    with pytest.raises(TypeError):
+        GameStore()
+
+def test_store_save_append_load(store):
+    assert store.load("game") is None
+    store.save("game", b"abc")
+    store.append("game", b"de")
+    assert store.load("game") == b"abcde"
+    store.save("game", b"x")
+    assert store.load("game") == b"x"
+    store.delete("game")
+    store.delete("game")
+    assert store.load("game") is None
+
+def test_reloaded_game_keeps_its_id_and_history(store):
+    registry = GameRegistry(store)
+    game = registry.create()
+    start(game)
+    events = list(game.event_log.events())
+    snapshot = game.snapshot()
+    assert registry.release(game.game_id)
+    reloaded = registry.get(game.game_id)
+    assert reloaded is not game
+    assert reloaded.game_id == game.game_id == reloaded.event_log.game_id
+    assert list(reloaded.event_log.events()) == events
+    assert reloaded.snapshot() == snapshot
+
+def test_stored_copy_survives_get(store):
+    registry = GameRegistry(store)
+    game_id = registry.create().game_id
+    registry.release(game_id)
+    registry.get(game_id)
+    # Another process sharing the store, e.g. after this one crashed
+    assert GameRegistry(store).get(game_id).game_id == game_id
+
+def test_synced_actions_survive_a_crash(store):
+    registry = GameRegistry(store)
+    game = registry.create()
+    start(game)
+    assert registry.sync(game.game_id) == len(game.event_log)
+    assert registry.sync(game.game_id) == 0
+    game.end_turn()
+    assert registry.sync(game.game_id) == 1
+    # The live copy is lost without being flushed
+    recovered = GameRegistry(store).get(game.game_id)
+    assert recovered.snapshot() == game.snapshot()
+    assert len(recovered.event_log) == len(game.event_log)
+
+def test_unsynced_actions_are_lost_but_the_game_is_not(store):
+    registry = GameRegistry(store)
+    game = registry.create()
+    game.add_player("Ann")
+    recovered = GameRegistry(store).get(game.game_id)
+    assert recovered is not None and len(recovered.player_table) == 0
+
+def test_capacity_and_idle_eviction(store):
+    now = [0.0]
+    registry = GameRegistry(store, shard_count=1, max_live_games=2, idle_timeout=10, clock=lambda: now[0])
+    first, second = registry.create(), registry.create()
+    registry.create()
+    assert first.game_id not in registry and len(registry) == 2
+    assert registry.get(first.game_id) is not None and second.game_id not in registry
+    now[0] = 20.0
+    assert registry.evict_idle() == 2
+    assert len(registry) == 0 and registry.get_game_ids() == []
+    assert registry.get(second.game_id).game_id == second.game_id
+
+def test_create_rejects_existing_ids(store):
+    registry = GameRegistry(store)
+    registry.create("game")
+    with pytest.raises(ValueError):
+        registry.create("game")
+    registry.release("game")
+    with pytest.raises(ValueError):
+        registry.create("game")
+
+def test_remove_and_flush(store):
+    registry = GameRegistry(store)
+    kept, removed = registry.create(), registry.create()
+    assert registry.remove(removed.game_id)
+    assert registry.get(removed.game_id) is None
+    assert registry.flush() == 1
+    assert registry.get_game_ids() == []
+    assert registry.get(kept.game_id) is not None
+
+def test_from_snapshot_keeps_the_game_id():
+    game = GameProcessor()
+    copy = GameProcessor.from_snapshot(game.snapshot())
+    assert copy.game_id == game.game_id == copy.event_log.game_id
+
+def test_sync_after_a_torn_event(store):
+    registry = GameRegistry(store)
+    game = registry.create()
+    start(game)
+    registry.sync(game.game_id)
+    # A crash mid-append leaves part of the next event behind
+    game.end_turn()
+    store.append(game.game_id, game.event_log.events_since(len(game.event_log) - 1)[:-1])
+    recovered_registry = GameRegistry(store)
+    recovered = recovered_registry.get(game.game_id)
+    names = [player.playerName for player in recovered.players]
+    recovered.end_turn()
+    recovered_registry.sync(game.game_id)
+    reloaded = GameRegistry(store).get(game.game_id)
+    assert [player.playerName for player in reloaded.players] == names == ["Ann", "Bob", "Cy"]
+    assert reloaded.snapshot() == recovered.snapshot()
+    assert len(reloaded.event_log) == len(recovered.event_log)
+
+def test_file_store_rejects_paths(tmp_path):
+    store = FileGameStore(str(tmp_path / "games"))
+    for game_id in ("../../x", "a/b", "", 7, None):
+        with pytest.raises(ValueError):
+            store.load(game_id)
+        with pytest.raises(ValueError):
+            store.save(game_id, b"x")
+    assert not (tmp_path / "x.game").exists()
+    store.save("a1-b_2", b"x")
+    assert store.load("a1-b_2") == b"x"
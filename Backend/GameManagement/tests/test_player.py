@@ -0,0 +1,99 @@
+import pytest
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.cardGroupings.Hand import Hand
+from Backend.GameManagement.player import Player, PlayerTable, NO_CHARACTER, NO_LOCATION
+from Backend.gameboardGroupings.gameboard import GameBoard
+
+@pytest.fixture
+def board():
+    """Fixture to create an empty classic GameBoard for testing."""
+    return GameBoard()
+
+@pytest.fixture
+def table(board):
+    """Fixture to create a table of three players on the board."""
+    table = PlayerTable(board)
+    for name in ("Ann", "Bob", "Cy"):
+        table.add_player(name)
+    return table
+
+def test_one_view_per_row(table):
+    assert len(table) == 3
+    players = table.get_players()
+    assert [player.get_row() for player in players] == [0, 1, 2]
+    assert all(table.get_player(row) is player for row, player in enumerate(players))
+    assert all(player.get_table() is table for player in players)
+    assert [player.playerID for player in players] == [0, 1, 2]
+
+def test_views_read_and_write_columns(table):
+    bob = table.get_player(1)
+    assert bob.playerName == "Bob" and repr(bob) == "Player('Bob')"
+    bob.playerName = "Robert"
+    assert table.names[1] == "Robert"
+    assert bob.character is None and table.character_ids[1] == NO_CHARACTER
+    bob.character = Card.VALID_SUSPECTS[3]
+    assert table.character_ids[1] == Card(Card.VALID_SUSPECTS[3], CardType.SUSPECT).get_id()
+    assert bob.character == Card.VALID_SUSPECTS[3]
+    with pytest.raises(ValueError):
+        bob.character = "Nobody"
+
+def test_hand_is_stored_as_a_mask(table):
+    ann = table.get_player(0)
+    rope, hall = Card("Rope", CardType.WEAPON), Card("Hall", CardType.ROOM)
+    ann.receive_card_dealt(rope)
+    ann.receive_card_dealt(hall)
+    assert table.hand_masks[0] == rope.get_mask() | hall.get_mask()
+    assert ann.playerHand.has_card(rope)
+    # The returned Hand is a copy; assign it back to change the hand
+    hand = ann.playerHand
+    hand.remove_card(rope)
+    assert ann.playerHand.has_card(rope)
+    ann.playerHand = hand
+    assert not ann.playerHand.has_card(rope)
+    ann.receive_hand(Hand())
+    assert table.hand_masks[0] == 0
+
+def test_locations_are_board_spaces(table, board):
+    cy = table.get_player(2)
+    assert cy.currLocation is None and cy.prevLocation is None
+    hall, lounge = board.get_space_by_name("Hall"), board.get_space_by_name("Lounge")
+    cy.currLocation = hall
+    cy.prevLocation = cy.currLocation
+    cy.currLocation = lounge
+    assert cy.currLocation is lounge and cy.prevLocation is hall
+    assert table.location_ids[2] == lounge.get_space_id()
+    assert table.rows_in_space(lounge.get_space_id()) == [2]
+    cy.currLocation = None
+    assert table.location_ids[2] == NO_LOCATION
+
+def test_elimination(table):
+    ann, bob, _ = table.get_players()
+    assert table.active_count() == 3
+    bob.isEliminated = True
+    assert bob.isEliminated and table.eliminated[1] == 1
+    assert table.active_count() == 2 and table.active_rows() == [0, 2]
+    assert not table.eliminate(1)
+    assert table.active_count() == 2
+    ann.isEliminated = False
+    with pytest.raises(ValueError):
+        bob.isEliminated = False
+
+def test_load_rows_keeps_views(table):
+    views = table.get_players()
+    table.get_player(0).receive_card_dealt(Card("Rope", CardType.WEAPON))
+    other = PlayerTable()
+    other.load_rows(table.names[:2], table.player_ids[:2].tobytes(), table.character_ids[:2].tobytes(),
+                    table.location_ids[:2].tobytes(), table.prev_location_ids[:2].tobytes(),
+                    bytes(table.eliminated[:2]), table.hand_masks[:2])
+    assert [player.playerName for player in other.get_players()] == ["Ann", "Bob"]
+    assert other.get_player(0).playerHand == table.get_player(0).playerHand
+    table.load_rows(other.names, other.player_ids.tobytes(), other.character_ids.tobytes(),
+                    other.location_ids.tobytes(), other.prev_location_ids.tobytes(),
+                    bytes(other.eliminated), other.hand_masks)
+    assert len(table) == 2
+    assert table.get_players() == views[:2]
+
+def test_standalone_player():
+    player = Player("Solo")
+    assert player.playerName == "Solo" and player.get_row() == 0
+    assert player.get_table().get_player(0) is player
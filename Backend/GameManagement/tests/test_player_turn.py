@@ -0,0 +1,47 @@
+import pytest
+from Backend.GameManagement.player import Player
+from Backend.GameManagement.player_turn import Player_Turn, TurnAction
+
+@pytest.fixture
+def turn():
+    """Fixture to create a fresh turn for a standalone player."""
+    return Player_Turn(Player("Ann"))
+
+def test_new_turn_may_move_or_accuse(turn):
+    assert not turn.isActive
+    assert turn.get_valid_actions() == TurnAction.MOVE | TurnAction.ACCUSATION
+    assert turn.isActive
+
+@pytest.mark.parametrize("flag, removed, added", [
+    ("hasMoved", TurnAction.MOVE, TurnAction.NONE),
+    ("hasMadeAccusation", TurnAction.ACCUSATION, TurnAction.NONE),
+    ("hasEnteredRoom", TurnAction.NONE, TurnAction.SUGGESTION),
+])
+def test_setting_a_flag_invalidates_the_cache(turn, flag, removed, added):
+    before = turn.get_valid_actions()
+    assert turn.get_valid_actions() is before
+    setattr(turn, flag, True)
+    assert turn.get_valid_actions() == (before & ~removed) | added
+
+def test_suggestion_needs_a_room_and_only_once(turn):
+    turn.hasEnteredRoom = True
+    assert TurnAction.SUGGESTION in turn.get_valid_actions()
+    turn.hasMadeSuggestion = True
+    assert TurnAction.SUGGESTION not in turn.get_valid_actions()
+
+def test_end_turn_resets_flags(turn):
+    turn.hasMoved = turn.hasEnteredRoom = turn.hasMadeSuggestion = turn.hasMadeAccusation = True
+    assert turn.get_valid_actions() == TurnAction.NONE
+    turn.end_turn()
+    assert not turn.isActive
+    assert turn.get_valid_actions() == TurnAction.MOVE | TurnAction.ACCUSATION
+
+def test_take_action_rejects_invalid_and_combined_actions(turn):
+    turn.hasEnteredRoom = True
+    with pytest.raises(ValueError):
+        turn.take_action(TurnAction.SUGGESTION | TurnAction.MOVE)
+    with pytest.raises(ValueError):
+        turn.take_action(TurnAction.NONE)
+    turn.hasMoved = True
+    with pytest.raises(ValueError):
+        turn.take_action(TurnAction.MOVE)
@@ -1,6 +1,6 @@
 from django.test import TestCase
 from django.contrib.auth.models import User
-from .models import Game, Person, Weapon, RoomHallway, Player, Card, GameSession
+from ..models import Game, Person, Weapon, RoomHallway, Player, Card, GameSession
 # Create your tests here.
 # Helper setup functions to avoid repetitive code
 def create_user(username="testuser"):
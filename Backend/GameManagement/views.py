@@ -1,8 +1,51 @@
+import json
 from django.views import View
 from django.http import JsonResponse
 from channels.layers import get_channel_layer
-from asgiref.sync import async_to_sync
 from django.shortcuts import render
+from Backend.GameManagement.game_actor import GAME_ACTIONS, GameNotFound, MailboxFull
+from Backend.GameManagement.game_engine import game_engine
+from Backend.GameManagement.game_registry import is_valid_game_id
+
+
+async def submit_game_action(request, action_name: str) -> JsonResponse:
+    """
+    Runs a game action on its game's actor and responds with the result.
+
+    The request body is a JSON object holding 'game_id' and the action's
+    arguments. A game whose mailbox is full, or whose actor or worker has
+    stopped, is answered with 503 instead of queueing the request. Requests
+    the game rejects are answered with 400.
+
+    Args:
+        request: The HTTP request object.
+        action_name (str): Key of the action in GAME_ACTIONS.
+
+    Returns:
+        JsonResponse: The action's result, or an error message.
+    """
+    action, arg_names = GAME_ACTIONS[action_name]
+    try:
+        data = json.loads(request.body)
+        game_id = data['game_id']
+        args = [data[name] for name in arg_names]
+    except (ValueError, KeyError, TypeError) as e:
+        return JsonResponse({'message': f'Invalid request: {e}'}, status=400)
+    if not is_valid_game_id(game_id):
+        return JsonResponse({'message': 'Invalid request: malformed game_id'}, status=400)
+
+    try:
+        result = await game_engine.submit_nowait(game_id, action, *args)
+    except GameNotFound:
+        return JsonResponse({'message': f'Game {game_id} does not exist.'}, status=404)
+    except MailboxFull:
+        return JsonResponse({'message': 'The game is busy, try again.'}, status=503)
+    except RuntimeError:
+        # The game's actor or worker stopped before running the action
+        return JsonResponse({'message': 'The game is unavailable, try again.'}, status=503)
+    except (ValueError, TypeError, LookupError) as e:
+        return JsonResponse({'message': str(e)}, status=400)
+    return JsonResponse(result, status=200)
 
 class GameView(View):
         def post(self, request):
@@ -23,7 +66,7 @@ class CreateGameView(View):
         post(request): Handles creating game lobbies via POST request.
     """
 
-    def post(self, request) -> JsonResponse:
+    async def post(self, request) -> JsonResponse:
         """
         Handles creating game lobbies via POST request.
 
@@ -33,12 +76,8 @@ class CreateGameView(View):
         Returns:
             JsonResponse: A JSON response indicating success or failure.
         """
-
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+        game_id = await game_engine.create_game()
+        return JsonResponse({'game_id': game_id}, status=200)
 
 class JoinGameView(View):
     """
@@ -50,7 +89,7 @@ class JoinGameView(View):
         post(request): Handles joining game lobbies via POST request.
     """
 
-    def post(self, request) -> JsonResponse:
+    async def post(self, request) -> JsonResponse:
         """
         Handles joining game lobbies via POST request.
 
@@ -61,11 +100,7 @@ class JoinGameView(View):
             JsonResponse: A JSON response indicating success or failure.
         """
 
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+        return await submit_game_action(request, 'join_game')
     
 class LeaveGameView(View):
     """
@@ -104,7 +139,7 @@ class StartGameView(View):
         post(request): Handles start games via POST request.
     """
 
-    def post(self, request) -> JsonResponse:
+    async def post(self, request) -> JsonResponse:
         """
         Handles starting games via POST request.
 
@@ -115,11 +150,7 @@ class StartGameView(View):
             JsonResponse: A JSON response indicating success or failure.
         """
 
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+        return await submit_game_action(request, 'start_game')
     
 class ChooseCharacterView(View):
     """
@@ -150,53 +181,36 @@ class ChooseCharacterView(View):
     
 class PlayerMoveView(View):
 
-    def post(self, request) -> JsonResponse:
-
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+    async def post(self, request) -> JsonResponse:
+        return await submit_game_action(request, 'move_player')
     
 class MakeSuggestionView(View):
 
-    def post(self, request) -> JsonResponse:
-
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # Notify all clients of the new login
-        channel_layer = get_channel_layer()
-        username = request.user.username 
-        async_to_sync(channel_layer.group_send)(
-            "notifications",
-            {
-                'type': 'notify',
-                'message': f" {username} Made a Suggestion.",
-            }
-        )
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+    async def post(self, request) -> JsonResponse:
+        response = await submit_game_action(request, 'make_suggestion')
+        if response.status_code == 200:
+            # Notify all clients of the suggestion
+            channel_layer = get_channel_layer()
+            username = (await request.auser()).username
+            await channel_layer.group_send(
+                "notifications",
+                {
+                    'type': 'notify',
+                    'message': f" {username} Made a Suggestion.",
+                }
+            )
+
+        return response
  
 class MakeAccusationView(View):
 
-    def post(self, request) -> JsonResponse:
-
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+    async def post(self, request) -> JsonResponse:
+        return await submit_game_action(request, 'make_accusation')
     
 class EndTurnView(View):
 
-    def post(self, request) -> JsonResponse:
-
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-        # TODO: THIS IS A STUB
-
-        return JsonResponse({'message': 'This feature has not been implemented yet.'}, status=200)
+    async def post(self, request) -> JsonResponse:
+        return await submit_game_action(request, 'end_turn')
     
 class EndGameEarlyRequestView(View):
 
@@ -3,6 +3,9 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from channels.layers import get_channel_layer
 from channels.generic.websocket import WebsocketConsumer
 from django.db import transaction
+from Backend.GameManagement.game_actor import GAME_ACTIONS, GameNotFound
+from Backend.GameManagement.game_engine import game_engine
+from Backend.GameManagement.game_registry import is_valid_game_id
 
 
 class NotificationConsumer(AsyncWebsocketConsumer):
@@ -66,3 +69,84 @@ class NotificationConsumer(AsyncWebsocketConsumer):
         except Exception as e:
             # Log the error or handle it appropriately
             print(f"Error while sending notification: {e}")
+
+
+class GameConsumer(AsyncWebsocketConsumer):
+    """
+    A WebSocket consumer for playing one game.
+
+    Each message received is a JSON object naming an action from GAME_ACTIONS
+    and its arguments. The action runs on the game's actor; its result (or
+    error) is sent back to this client, and every client connected to the
+    game is told which action was taken.
+
+    Methods:
+        connect(): Joins the game's group and accepts the connection.
+        disconnect(close_code): Leaves the game's group.
+        receive(text_data): Runs an action on the game and replies with its result.
+        game_event(event): Forwards an action taken in the game to the client.
+    """
+    async def connect(self):
+        """
+        Handle WebSocket connection requests for the game named in the URL.
+        """
+        self.game_id = self.scope['url_route']['kwargs']['game_id']
+        self.group_name = f"game_{self.game_id}"
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+
+    async def disconnect(self, close_code: int) -> None:
+        """
+        Handle WebSocket disconnection requests.
+
+        Args:
+            close_code (int): The code indicating why the WebSocket connection was closed.
+        """
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def receive(self, text_data: str = None, bytes_data: bytes = None) -> None:
+        """
+        Run the requested action on the game's actor and reply with its result.
+
+        Awaiting the actor holds back this client's next message while the
+        game's mailbox is full.
+
+        Args:
+            text_data (str): The JSON message, e.g. {"action": "end_turn"}.
+        """
+        try:
+            data = json.loads(text_data)
+            action_name = data['action']
+            action, arg_names = GAME_ACTIONS[action_name]
+            args = [data[name] for name in arg_names]
+        except (ValueError, KeyError, TypeError) as e:
+            await self.send(text_data=json.dumps({'error': f'Invalid message: {e}'}))
+            return
+        if not is_valid_game_id(self.game_id):
+            await self.send(text_data=json.dumps({'action': action_name, 'error': 'Malformed game id.'}))
+            return
+
+        try:
+            result = await game_engine.submit(self.game_id, action, *args)
+        except GameNotFound:
+            await self.send(text_data=json.dumps({'action': action_name, 'error': 'Game does not exist.'}))
+            return
+        except RuntimeError:
+            # The game's actor or worker stopped before running the action
+            await self.send(text_data=json.dumps({'action': action_name, 'error': 'The game is unavailable, try again.'}))
+            return
+        except (ValueError, TypeError, LookupError) as e:
+            await self.send(text_data=json.dumps({'action': action_name, 'error': str(e)}))
+            return
+
+        await self.send(text_data=json.dumps({'action': action_name, 'result': result}))
+        await self.channel_layer.group_send(self.group_name, {'type': 'game_event', 'action': action_name})
+
+    async def game_event(self, event: dict) -> None:
+        """
+        Tell the client an action was taken in the game.
+
+        Args:
+            event (dict): The event dictionary holding the action's name.
+        """
+        await self.send(text_data=json.dumps({'event': event['action']}))
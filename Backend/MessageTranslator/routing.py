@@ -3,5 +3,6 @@ from Backend.MessageTranslator import consumers  # Import the consumer
 
 
 websocket_urlpatterns = [
-    re_path(r"ws/notifications/$", consumers.NotificationConsumer.as_asgi())
+    re_path(r"ws/notifications/$", consumers.NotificationConsumer.as_asgi()),
+    re_path(r"ws/games/(?P<game_id>[\w-]+)/$", consumers.GameConsumer.as_asgi())
 ]
\ No newline at end of file
@@ -1,4 +1,22 @@
+import json
+import struct
+import zlib
+from array import array
 from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
+
+# Card editions are loaded from data files in this directory
+CATALOG_DIR = Path(__file__).resolve().parent / "catalogs"
+DEFAULT_CATALOG = CATALOG_DIR / "classic.json"
+
+# Binary encoding shared by Card, Hand and Deck: an 8-byte header of
+# (version, tag, catalog size, catalog fingerprint) followed by the payload
+ENCODING_VERSION = 2
+CARD_TAG = ord("C")
+HAND_TAG = ord("H")
+DECK_TAG = ord("D")
+HEADER = struct.Struct(">BBHI")
 
 class CardType(Enum):
     """
@@ -15,56 +33,111 @@ class CardType(Enum):
     ROOM = "Room"
     WEAPON = "Weapon"
 
+    # Members are singletons, so identity hashing is equivalent to Enum's
+    # name-based hash and keeps catalog key lookups in C
+    __hash__ = object.__hash__
+
 
 class Card:
     """
     Class object to represent valid card types in the game clue-less.
 
+    Cards are interned flyweights: every valid (name, card_type) pair maps to
+    exactly one shared, immutable instance with a small integer id. Calling
+    Card(name, card_type) returns that instance from the installed
+    CardCatalog instead of building and validating a new object.
+
     Attributes:
         VALID_SUSPECTS: List of valid suspect
         VALID_WEAPONS: List of valid weapons
         VALID_ROOMS: List of valid rooms
     """
-    VALID_SUSPECTS = [
-        "Miss Scarlet",
-        "Professor Plum",
-        "Mrs. Peacock",
-        "Mr. Green",
-        "Colonel Mustard",
-        "Mrs. White"
-        ]
-
-    VALID_WEAPONS = [
-        "Candlestick",
-        "Dagger",
-        "Lead Pipe",
-        "Revolver",
-        "Rope",
-        "Wrench"
-        ]
-
-    VALID_ROOMS = [
-        "Ballroom",
-        "Kitchen",
-        "Library",
-        "Study",
-        "Hall",
-        "Lounge",
-        "Dining Room",
-        "Conservatory",
-        "Billiard Room"
-        ]
-
-    def __init__(self, name: str, card_type: CardType):
-        if card_type == CardType.SUSPECT and name not in self.VALID_SUSPECTS:
-            raise ValueError(f"{name} is not a valid suspect.")
-        elif card_type == CardType.WEAPON and name not in self.VALID_WEAPONS:
-            raise ValueError(f"{name} is not a valid weapon.")
-        elif card_type == CardType.ROOM and name not in self.VALID_ROOMS:
-            raise ValueError(f"{name} is not a valid room.")
+    __slots__ = ("_name", "_card_type", "_id", "_mask")
 
-        self._name = name
-        self._card_type = card_type
+    # Filled in from the installed catalog by use_catalog()
+    VALID_SUSPECTS = []
+    VALID_WEAPONS = []
+    VALID_ROOMS = []
+
+    _catalog = None
+    _BY_KEY = {}
+    _BY_ID = ()
+
+    def __new__(cls, name: str, card_type: CardType):
+        """Return the shared instance for (name, card_type)."""
+        try:
+            return cls._BY_KEY[(name, card_type)]
+        except (KeyError, TypeError):
+            label = _INVALID_LABELS.get(card_type, "card")
+            raise ValueError(f"{name} is not a valid {label}.") from None
+
+    @classmethod
+    def _create(cls, name: str, card_type: CardType, card_id: int) -> "Card":
+        """Build a catalog entry. Only CardCatalog should call this."""
+        card = object.__new__(cls)
+        object.__setattr__(card, "_name", name)
+        object.__setattr__(card, "_card_type", card_type)
+        object.__setattr__(card, "_id", card_id)
+        object.__setattr__(card, "_mask", 1 << card_id)
+        return card
+
+    @classmethod
+    def use_catalog(cls, catalog: "CardCatalog"):
+        """Install a compiled catalog as the process-wide set of valid cards.
+
+        Call this at startup, before any game is created; cards from the
+        previously installed catalog must not be mixed with the new ones.
+        """
+        cls._catalog = catalog
+        cls._BY_KEY = catalog._by_key
+        cls._BY_ID = catalog._cards
+        cls.VALID_SUSPECTS = list(catalog.get_names(CardType.SUSPECT))
+        cls.VALID_WEAPONS = list(catalog.get_names(CardType.WEAPON))
+        cls.VALID_ROOMS = list(catalog.get_names(CardType.ROOM))
+
+    @classmethod
+    def get_catalog(cls) -> "CardCatalog":
+        """Return the installed catalog."""
+        return cls._catalog
+
+    @classmethod
+    def get(cls, name: str, card_type: CardType) -> "Card":
+        """Look up a card by name and type. Raises ValueError if invalid."""
+        return cls(name, card_type)
+
+    @classmethod
+    def from_id(cls, card_id: int) -> "Card":
+        """Look up a card by its integer id."""
+        return cls._BY_ID[card_id]
+
+    @classmethod
+    def from_mask(cls, mask: int) -> list:
+        """Return the cards whose id bits are set in mask, ordered by id."""
+        by_id = cls._BY_ID
+        cards = []
+        while mask:
+            low_bit = mask & -mask
+            cards.append(by_id[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return cards
+
+    @classmethod
+    def mask_of(cls, cards) -> int:
+        """Return the bitmask covering an iterable of cards."""
+        mask = 0
+        for card in cards:
+            mask |= card._mask
+        return mask
+
+    @classmethod
+    def all_cards(cls) -> tuple:
+        """Return every card in the catalog, ordered by id."""
+        return cls._BY_ID
+
+    @classmethod
+    def count(cls) -> int:
+        """Return the number of cards in the catalog."""
+        return len(cls._BY_ID)
 
     def get_name(self) -> str:
         return self._name
@@ -72,11 +145,54 @@ class Card:
     def get_card_type(self) -> CardType:
         return self._card_type
 
+    def get_id(self) -> int:
+        return self._id
+
+    def get_mask(self) -> int:
+        """Return the single-bit mask for this card (1 << id)."""
+        return self._mask
+
+    def to_bytes(self) -> bytes:
+        """Encode the card as its header followed by a 2-byte card id."""
+        return encode_header(CARD_TAG) + self._id.to_bytes(2, "big")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Card":
+        """Decode a card produced by to_bytes."""
+        payload = decode_header(data, CARD_TAG)
+        if len(payload) != 2:
+            raise ValueError("Encoded card has the wrong length.")
+        card_id = int.from_bytes(payload, "big")
+        if card_id >= len(cls._BY_ID):
+            raise ValueError(f"Encoded card id {card_id} is not in the catalog.")
+        return cls._BY_ID[card_id]
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card objects are immutable.")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card objects are immutable.")
+
+    # Cards are shared, so copies and pickles resolve back to the catalog instance
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (Card, (self._name, self._card_type))
+
     # Compare function
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Card):
             return NotImplemented
-        return self._name == other._name and self._card_type == other._card_type
+        return self._id == other._id
+
+    def __hash__(self) -> int:
+        return self._id
 
     # Less than Function : Used for sorting
     def __lt__(self, other):
@@ -94,6 +210,159 @@ class Card:
     def __str__(self) -> str:
         return f"name='{self._name}', card_type={self._card_type}"
 
+_INVALID_LABELS = {
+    CardType.SUSPECT: "suspect",
+    CardType.WEAPON: "weapon",
+    CardType.ROOM: "room",
+}
+
+class CardCatalog:
+    """
+    Compiled, read-only lookup tables for one card edition.
+
+    A catalog is compiled once from a data file and shared by every game in
+    the process. Ids are assigned suspects first, then weapons, then rooms,
+    in file order, so lookups by key, by id and by type are all O(1)
+    however many cards the edition has.
+
+    Attributes:
+        CARD_GROUPS: Data file keys and the card type each one holds
+    """
+    CARD_GROUPS = (
+        ("suspects", CardType.SUSPECT),
+        ("weapons", CardType.WEAPON),
+        ("rooms", CardType.ROOM),
+    )
+
+    def __init__(self, name: str, suspects: list, weapons: list, rooms: list):
+        by_key = {}
+        names = {}
+        type_ids = {}
+        type_masks = {}
+        for card_names, (_, card_type) in zip((suspects, weapons, rooms), self.CARD_GROUPS):
+            if not card_names:
+                raise ValueError(f"Catalog '{name}' has no {card_type.value.lower()} cards.")
+            ids = array("H")
+            mask = 0
+            for card_name in card_names:
+                if (card_name, card_type) in by_key:
+                    raise ValueError(f"Catalog '{name}' lists {card_name} more than once.")
+                card = Card._create(card_name, card_type, len(by_key))
+                by_key[(card_name, card_type)] = card
+                ids.append(card.get_id())
+                mask |= card.get_mask()
+            names[card_type] = tuple(card_names)
+            type_ids[card_type] = ids
+            type_masks[card_type] = mask
+
+        self._name = name
+        self._by_key = by_key
+        self._cards = tuple(by_key.values())
+        self._names = MappingProxyType(names)
+        self._type_ids = MappingProxyType(type_ids)
+        self._type_masks = MappingProxyType(type_masks)
+
+        # A solution (suspect, weapon, room) packs into one int in mixed radix
+        # by each card's index within its type, so every solution has a
+        # distinct code in 0..solution_count() - 1
+        self._first_ids = tuple(type_ids[card_type][0] for _, card_type in self.CARD_GROUPS)
+        self._type_counts = tuple(len(type_ids[card_type]) for _, card_type in self.CARD_GROUPS)
+
+        # Encoded cards are only ids, so they record which catalog assigned
+        # them: a crc of every (type, name) in id order
+        self._fingerprint = zlib.crc32("\n".join(
+            f"{card.get_card_type().value}:{card.get_name()}" for card in self._cards).encode("utf-8"))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CardCatalog":
+        """Compile a catalog from its parsed data file contents."""
+        return cls(data.get("name", "Custom"), *(list(data.get(key, ())) for key, _ in cls.CARD_GROUPS))
+
+    @classmethod
+    def load(cls, path=DEFAULT_CATALOG) -> "CardCatalog":
+        """Compile a catalog from a JSON data file."""
+        with open(path, encoding="utf-8") as catalog_file:
+            return cls.from_dict(json.load(catalog_file))
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+    def get_name(self) -> str:
+        """Return the edition name."""
+        return self._name
+
+    def get_fingerprint(self) -> int:
+        """Return the crc identifying this catalog's cards and their ids."""
+        return self._fingerprint
+
+    def get_cards(self) -> tuple:
+        """Return every card, ordered by id."""
+        return self._cards
+
+    def get_lookup(self) -> MappingProxyType:
+        """Return the read-only (name, card_type) -> Card mapping."""
+        return MappingProxyType(self._by_key)
+
+    def get_names(self, card_type: CardType) -> tuple:
+        """Return the card names of one type in id order."""
+        return self._names[card_type]
+
+    def get_type_ids(self, card_type: CardType) -> array:
+        """Return the ids of the cards of one type. Do not modify the array."""
+        return self._type_ids[card_type]
+
+    def get_type_mask(self, card_type: CardType) -> int:
+        """Return the bitmask covering every card of one type."""
+        return self._type_masks[card_type]
+
+    def solution_count(self) -> int:
+        """Return the number of possible (suspect, weapon, room) solutions."""
+        suspects, weapons, rooms = self._type_counts
+        return suspects * weapons * rooms
+
+    def pack_solution(self, suspect: Card, weapon: Card, room: Card) -> int:
+        """Pack a suspect, weapon and room into one integer code."""
+        first_suspect, first_weapon, first_room = self._first_ids
+        _, weapons, rooms = self._type_counts
+        if (suspect.get_card_type() != CardType.SUSPECT or weapon.get_card_type() != CardType.WEAPON
+                or room.get_card_type() != CardType.ROOM):
+            raise ValueError("A solution needs one suspect, one weapon and one room.")
+        return ((suspect.get_id() - first_suspect) * weapons
+                + weapon.get_id() - first_weapon) * rooms + room.get_id() - first_room
+
+    def unpack_solution(self, code: int) -> tuple:
+        """Return the (suspect, weapon, room) cards packed in a code."""
+        if not 0 <= code < self.solution_count():
+            raise ValueError(f"{code} is not a valid solution code.")
+        first_suspect, first_weapon, first_room = self._first_ids
+        _, weapons, rooms = self._type_counts
+        code, room = divmod(code, rooms)
+        suspect, weapon = divmod(code, weapons)
+        return (self._cards[first_suspect + suspect], self._cards[first_weapon + weapon],
+                self._cards[first_room + room])
+
+
+Card.use_catalog(CardCatalog.load())
+
+
+def encode_header(tag: int) -> bytes:
+    """Return the encoding header for a Card, Hand or Deck payload."""
+    return HEADER.pack(ENCODING_VERSION, tag, Card.count(), Card.get_catalog().get_fingerprint())
+
+
+def decode_header(data: bytes, tag: int) -> bytes:
+    """Check the encoding header and return the payload that follows it."""
+    if len(data) < HEADER.size:
+        raise ValueError("Encoded data is too short.")
+    version, found_tag, catalog_size, fingerprint = HEADER.unpack_from(data)
+    if version != ENCODING_VERSION:
+        raise ValueError(f"Unsupported encoding version {version}.")
+    if found_tag != tag:
+        raise ValueError(f"Expected encoded {chr(tag)!r} data, found {chr(found_tag)!r}.")
+    if catalog_size != Card.count() or fingerprint != Card.get_catalog().get_fingerprint():
+        raise ValueError("Encoded data was written for a different card catalog.")
+    return bytes(data[HEADER.size:])
+
 if __name__ == "__main__":
     card1 = Card(Card.VALID_SUSPECTS[2], CardType.SUSPECT)
     card2 = Card(Card.VALID_ROOMS[4], CardType.ROOM)
@@ -106,4 +375,5 @@ if __name__ == "__main__":
     # Comparing cards
     card4 = Card(Card.VALID_SUSPECTS[2], CardType.SUSPECT)
     print(card1 == card4)  # Output: True
-    print(card1 == card2)  # Output: False
\ No newline at end of file
+    print(card1 == card2)  # Output: False
+    print(card1 is card4)  # Output: True
\ No newline at end of file
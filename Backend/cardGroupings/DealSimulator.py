@@ -0,0 +1,183 @@
+import numpy as np
+from Backend.cardGroupings.Card import Card, CardType
+
+# Player bounds, kept in step with GameProcessor.MIN_PLAYERS / MAX_PLAYERS
+MIN_PLAYERS = 3
+MAX_PLAYERS = 6
+
+CASE_FILE_SEAT = -1
+DEFAULT_BATCH_SIZE = 100_000
+CASE_FILE_TYPES = (CardType.SUSPECT, CardType.WEAPON, CardType.ROOM)
+
+
+class DealReport():
+    """
+    DealReport: Aggregated statistics from a DealSimulator run
+
+    All per-card arrays are indexed by card id.
+
+    Attributes:
+        num_games (int): Number of simulated games
+        num_players (int): Number of seats at the table
+        case_file_counts (ndarray): Times each card was placed in the case file
+        seat_counts (ndarray): (cards x seats) times each card was dealt to each seat
+        hand_size_counts (ndarray): (seats x hand sizes) histogram of hand sizes per seat
+        position_counts (ndarray): (cards x deck positions) where each card sat in the
+            shuffled deck before dealing
+    """
+    def __init__(self, num_players: int, num_cards: int):
+        num_dealt = num_cards - len(CASE_FILE_TYPES)
+        self.num_games = 0
+        self.num_players = num_players
+        self.case_file_counts = np.zeros(num_cards, dtype=np.int64)
+        self.seat_counts = np.zeros((num_cards, num_players), dtype=np.int64)
+        self.hand_size_counts = np.zeros((num_players, num_dealt + 1), dtype=np.int64)
+        self.position_counts = np.zeros((num_cards, num_dealt), dtype=np.int64)
+
+    def case_file_frequency(self) -> np.ndarray:
+        """Return the fraction of games in which each card was in the case file."""
+        return self.case_file_counts / max(self.num_games, 1)
+
+    def seat_frequency(self) -> np.ndarray:
+        """Return the fraction of games in which each card was dealt to each seat."""
+        return self.seat_counts / max(self.num_games, 1)
+
+    def mean_hand_sizes(self) -> np.ndarray:
+        """Return the mean hand size for each seat."""
+        sizes = np.arange(self.hand_size_counts.shape[1])
+        return (self.hand_size_counts * sizes).sum(axis=1) / max(self.num_games, 1)
+
+    def hand_size_skew(self) -> float:
+        """Return the difference between the largest and smallest mean hand size."""
+        mean_sizes = self.mean_hand_sizes()
+        return float(mean_sizes.max() - mean_sizes.min())
+
+    def case_file_chi_square(self) -> dict:
+        """Return the chi-square statistic and degrees of freedom of the case-file
+        picks for each card type against a uniform choice within that type."""
+        results = {}
+        for card_type in CASE_FILE_TYPES:
+            ids = _ids_of_type(card_type)
+            observed = self.case_file_counts[ids]
+            expected = np.full(len(ids), self.num_games / len(ids))
+            results[card_type] = (_chi_square(observed, expected), len(ids) - 1)
+        return results
+
+    def seat_chi_square(self) -> tuple:
+        """Return the chi-square statistic and degrees of freedom of card-to-seat
+        assignment against each seat's share of the dealt cards."""
+        num_dealt = self.position_counts.shape[1]
+        seat_share = np.array([_hand_size(seat, self.num_players, num_dealt)
+                               for seat in range(self.num_players)]) / num_dealt
+        times_dealt = self.num_games - self.case_file_counts
+        expected = np.outer(times_dealt, seat_share)
+        degrees = self.seat_counts.shape[0] * (self.num_players - 1)
+        return _chi_square(self.seat_counts, expected), degrees
+
+    def shuffle_chi_square(self) -> tuple:
+        """Return the chi-square statistic and degrees of freedom of deck positions
+        against a uniform shuffle of the dealt cards."""
+        num_dealt = self.position_counts.shape[1]
+        times_dealt = self.num_games - self.case_file_counts
+        expected = np.outer(times_dealt, np.full(num_dealt, 1 / num_dealt))
+        degrees = self.position_counts.shape[0] * (num_dealt - 1)
+        return _chi_square(self.position_counts, expected), degrees
+
+    def merge(self, owners: np.ndarray, order: np.ndarray):
+        """Accumulate one batch of simulated games."""
+        batch_size, num_dealt = order.shape
+        self.num_games += batch_size
+        self.case_file_counts += (owners == CASE_FILE_SEAT).sum(axis=0)
+        for seat in range(self.num_players):
+            dealt_to_seat = owners == seat
+            self.seat_counts[:, seat] += dealt_to_seat.sum(axis=0)
+            self.hand_size_counts[seat] += np.bincount(
+                dealt_to_seat.sum(axis=1), minlength=num_dealt + 1)
+        cells = order * num_dealt + np.arange(num_dealt)
+        self.position_counts += np.bincount(
+            cells.ravel(), minlength=self.position_counts.size).reshape(self.position_counts.shape)
+
+
+class DealSimulator():
+    """
+    DealSimulator: Vectorized Monte Carlo model of a game's card setup
+
+    Reproduces GameProcessor._create_case_file followed by _deal_cards for a
+    whole batch of games at once using permutation arrays, so millions of
+    deals can be audited without building GameProcessor objects.
+
+    Attributes:
+        num_players (int): Number of seats at the table
+    """
+    def __init__(self, num_players: int, seed=None):
+        if not MIN_PLAYERS <= num_players <= MAX_PLAYERS:
+            raise ValueError(f"Number of players must be between {MIN_PLAYERS} and {MAX_PLAYERS}.")
+        self.num_players = num_players
+        self._rng = np.random.default_rng(seed)
+        self._num_cards = Card.count()
+        self._type_ids = [_ids_of_type(card_type) for card_type in CASE_FILE_TYPES]
+
+        # Deck.deal pops from the end, so the card at position p is dealt
+        # (num_dealt - 1 - p)-th and goes to that seat round-robin
+        num_dealt = self._num_cards - len(CASE_FILE_TYPES)
+        self._position_seat = ((num_dealt - 1 - np.arange(num_dealt)) % num_players).astype(np.int8)
+
+    def simulate_batch(self, batch_size: int) -> np.ndarray:
+        """Return a (batch_size x cards) array of the seat each card was dealt to,
+        with CASE_FILE_SEAT marking the case file."""
+        owners, _ = self._simulate_batch(batch_size)
+        return owners
+
+    def run(self, num_games: int, batch_size: int = DEFAULT_BATCH_SIZE) -> DealReport:
+        """Simulate num_games deals in batches and return the aggregated report."""
+        report = DealReport(self.num_players, self._num_cards)
+        remaining = num_games
+        while remaining > 0:
+            size = min(batch_size, remaining)
+            owners, order = self._simulate_batch(size)
+            report.merge(owners, order)
+            remaining -= size
+        return report
+
+    def _simulate_batch(self, batch_size: int) -> tuple:
+        rng = self._rng
+        num_cards = self._num_cards
+        num_dealt = num_cards - len(CASE_FILE_TYPES)
+
+        # Taking the first card of each type from a shuffled deck is a uniform
+        # pick within that type
+        case_ids = np.stack([ids[rng.integers(len(ids), size=batch_size)]
+                             for ids in self._type_ids], axis=1)
+
+        # Shuffle with random sort keys, pushing the case file cards past the end
+        keys = rng.random((batch_size, num_cards))
+        np.put_along_axis(keys, case_ids, 2.0, axis=1)
+        order = np.argsort(keys, axis=1)[:, :num_dealt]
+
+        owners = np.empty((batch_size, num_cards), dtype=np.int8)
+        np.put_along_axis(owners, order, np.broadcast_to(self._position_seat, order.shape), axis=1)
+        np.put_along_axis(owners, case_ids, CASE_FILE_SEAT, axis=1)
+        return owners, order
+
+
+def _ids_of_type(card_type: CardType) -> np.ndarray:
+    return np.array(Card.get_catalog().get_type_ids(card_type), dtype=np.intp)
+
+
+def _hand_size(seat: int, num_players: int, num_dealt: int) -> int:
+    return (num_dealt - seat + num_players - 1) // num_players
+
+
+def _chi_square(observed: np.ndarray, expected: np.ndarray) -> float:
+    mask = expected > 0
+    return float((((observed - expected) ** 2)[mask] / expected[mask]).sum())
+
+
+# Sample
+if __name__ == "__main__":
+    for players in range(MIN_PLAYERS, MAX_PLAYERS + 1):
+        result = DealSimulator(players, seed=players).run(1_000_000)
+        print(f"{players} players: mean hand sizes {result.mean_hand_sizes()}, skew {result.hand_size_skew():.2f}")
+        print("  case file chi-square:", {t.value: c for t, c in result.case_file_chi_square().items()})
+        print("  seat chi-square:", result.seat_chi_square())
+        print("  shuffle chi-square:", result.shuffle_chi_square())
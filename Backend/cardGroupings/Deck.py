@@ -1,5 +1,10 @@
-from Card import Card, CardType
-from random import shuffle
+import sys
+from array import array
+from random import randrange, shuffle
+from Backend.cardGroupings.Card import Card, CardType, DECK_TAG, encode_header, decode_header
+from Backend.cardGroupings.Hand import Hand
+
+CASE_FILE_TYPES = (CardType.SUSPECT, CardType.WEAPON, CardType.ROOM)
 
 class Deck():
     """
@@ -8,50 +13,156 @@ class Deck():
     This class provides methods for the management of a deck of cards. It provides
     operations for shuffling, dealing, adding, and removing cards.
 
+    The deal order is kept as a compact array of card ids and membership as a
+    bitmask over those ids, so lookups never scan the deck.
+
     Attributes:
-        cards (List: Card): List of Cards in the deck
+        order (array: int): Card ids in the deck; the last id is dealt first
+        mask (int): Bitmask of the card ids in the deck
     """
-    def __init__(self):
-        # Initialize Deck with an empty list of cards
-        self._cards = []
+    __slots__ = ("_order", "_mask")
 
-    def add_card(self, card: Card):
-        if card in self.cards:
-            raise ValueError(f"The card '{card._name}' is already in the deck.")
-        self.cards.append(card)
+    def __init__(self):
+        # Initialize Deck with no cards
+        self._order = array("H")
+        self._mask = 0
+
+    @classmethod
+    def from_catalog(cls) -> "Deck":
+        """Build a deck holding every card in the catalog, ordered by card id."""
+        deck = cls()
+        deck._order = array("H", range(Card.count()))
+        deck._mask = (1 << Card.count()) - 1
+        return deck
 
     def __contains__(self, card):
-        return card in self._cards
+        return isinstance(card, Card) and bool(self._mask & card.get_mask())
+
+    def __len__(self):
+        return len(self._order)
 
     def shuffle(self):
         """Shuffle the deck of cards."""
-        shuffle(self._cards)
+        shuffle(self._order)
 
     def deal(self) -> Card:
         """Deal a card from the deck. Returns None if the deck is empty."""
-        if self._cards:
-            return self._cards.pop()
+        if self._order:
+            card_id = self._order.pop()
+            self._mask &= ~(1 << card_id)
+            return Card.from_id(card_id)
         return None
 
     def add_card(self, card: Card):
         """Add a card to the deck."""
         if isinstance(card, Card):
-            if card in self._cards:
-                raise ValueError(f"The card '{card._name}' is already in the deck.")
-            self._cards.append(card)
+            if card in self:
+                raise ValueError(f"The card '{card.get_name()}' is already in the deck.")
+            self._order.append(card.get_id())
+            self._mask |= card.get_mask()
         else:
             raise ValueError("Must add an instance of Card.")
 
     def remove_card(self, card: Card):
         """Remove a card from the deck."""
-        if card in self._cards:
-            self._cards.remove(card)
+        if card in self:
+            self._order.remove(card.get_id())
+            self._mask &= ~card.get_mask()
         else:
             raise ValueError("Card not found in the deck.")
 
+    def draw_case_file(self) -> Hand:
+        """Draw one random card of each case file type and return them as a hand.
+
+        Runs Fisher-Yates only until one card of every type has been picked,
+        which is the same as taking the first of each type from a fully
+        shuffled deck. The picked cards are removed from the deck.
+        """
+        order = self._order
+        size = len(order)
+        needed = set(CASE_FILE_TYPES)
+        picked = 0
+        position = 0
+        while needed and position < size:
+            swap = randrange(position, size)
+            order[position], order[swap] = order[swap], order[position]
+            card_type = Card.from_id(order[position]).get_card_type()
+            if card_type in needed:
+                needed.discard(card_type)
+                order[picked], order[position] = order[position], order[picked]
+                picked += 1
+            position += 1
+        if needed:
+            raise ValueError("The deck must hold at least one card of each type.")
+
+        case_mask = 0
+        for card_id in order[:picked]:
+            case_mask |= 1 << card_id
+        del order[:picked]
+        self._mask &= ~case_mask
+        return Hand.from_mask(case_mask)
+
+    def deal_hands(self, num_hands: int) -> list:
+        """Deal every card round-robin into num_hands hands and empty the deck.
+
+        Cards are dealt in the same order as repeated deal() calls, so the
+        first hand receives the top card. Hands are built directly from
+        bitmasks with no per-card checks.
+        """
+        if num_hands < 1:
+            raise ValueError("Must deal to at least one hand.")
+        masks = [0] * num_hands
+        for index, card_id in enumerate(reversed(self._order)):
+            masks[index % num_hands] |= 1 << card_id
+        self._order = array("H")
+        self._mask = 0
+        return [Hand.from_mask(mask) for mask in masks]
+
+    def to_bytes(self) -> bytes:
+        """Encode the deck as its header followed by the card ids in deal order.
+
+        Ids take one byte each for catalogs of up to 256 cards and two
+        little-endian bytes otherwise.
+        """
+        ids = array(_id_typecode(), self._order)
+        if ids.itemsize > 1 and sys.byteorder == "big":
+            ids.byteswap()
+        return encode_header(DECK_TAG) + ids.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Deck":
+        """Decode a deck produced by to_bytes."""
+        payload = decode_header(data, DECK_TAG)
+        ids = array(_id_typecode())
+        if len(payload) % ids.itemsize:
+            raise ValueError("Encoded deck has the wrong length.")
+        ids.frombytes(payload)
+        if ids.itemsize > 1 and sys.byteorder == "big":
+            ids.byteswap()
+
+        mask = 0
+        for card_id in ids:
+            mask |= 1 << card_id
+        if mask >> Card.count():
+            raise ValueError("Encoded deck holds cards outside the catalog.")
+        if mask.bit_count() != len(ids):
+            raise ValueError("Encoded deck holds duplicate cards.")
+
+        deck = cls()
+        deck._order = array("H", ids)
+        deck._mask = mask
+        return deck
+
     def get_deck(self) -> list:
         """Return the current state of the deck."""
-        return self._cards
+        return [Card.from_id(card_id) for card_id in self._order]
+
+    def get_mask(self) -> int:
+        """Return the bitmask of the cards in the deck."""
+        return self._mask
+
+def _id_typecode() -> str:
+    return "B" if Card.count() <= 256 else "H"
 
 # Sample
 if __name__ == "__main__":
@@ -1,5 +1,4 @@
-from Card import Card, CardType
-from random import shuffle
+from Backend.cardGroupings.Card import Card, CardType, HAND_TAG, encode_header, decode_header
 
 class Hand():
     """
@@ -8,48 +7,137 @@ class Hand():
     This class provides methods for the management of a hand of cards. It provides
     operations for shuffling, dealing, adding, and removing cards.
 
+    A hand is stored as a bitmask over card ids, so membership, union and
+    intersection are single integer operations. `hand & suggestion_mask` gives
+    the mask of matching cards. The catalog gives each card type a contiguous
+    id range, so the mask is also partitioned by type and per-type queries are
+    a single AND with that type's mask.
+
     Attributes:
-        cards (List: Card): List of Cards in the hand
+        mask (int): Bitmask of the card ids in the hand
     """
+    __slots__ = ("_mask",)
+
     def __init__(self):
-        # Initialize Hand with an empty list of cards
-        self._cards = []
+        # Initialize Hand with no cards
+        self._mask = 0
+
+    @classmethod
+    def from_mask(cls, mask: int) -> "Hand":
+        """Build a hand directly from a card bitmask without validation."""
+        hand = cls()
+        hand._mask = mask
+        return hand
 
     def add_card(self, card: Card):
         """Add a card to the hand."""
         if isinstance(card, Card):
-            if card in self._cards:
-                raise ValueError(f"The card '{card._name}' is already in the hand.")
-            self._cards.append(card)
+            bit = card.get_mask()
+            if self._mask & bit:
+                raise ValueError(f"The card '{card.get_name()}' is already in the hand.")
+            self._mask |= bit
         else:
             raise ValueError("Must add an instance of Card.")
 
     def remove_card(self, card: Card):
         """Remove a card from the hand."""
-        if card in self._cards:
-            self._cards.remove(card)
+        if self.has_card(card):
+            self._mask &= ~card.get_mask()
         else:
             raise ValueError("Card not found in the hand.")
 
     def get_hand(self) -> list:
-        """Return the current state of the hand."""
-        return self._cards
+        """Return the cards in the hand, ordered by card id."""
+        return Card.from_mask(self._mask)
+
+    def get_mask(self) -> int:
+        """Return the bitmask of the cards in the hand."""
+        return self._mask
+
+    def to_bytes(self) -> bytes:
+        """Encode the hand as its header followed by the little-endian card mask."""
+        return encode_header(HAND_TAG) + self._mask.to_bytes(_mask_length(), "little")
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Hand":
+        """Decode a hand produced by to_bytes."""
+        payload = decode_header(data, HAND_TAG)
+        if len(payload) != _mask_length():
+            raise ValueError("Encoded hand has the wrong length.")
+        mask = int.from_bytes(payload, "little")
+        if mask >> Card.count():
+            raise ValueError("Encoded hand holds cards outside the catalog.")
+        return cls.from_mask(mask)
 
     def clear_hand(self):
         """Clear all cards from the hand."""
-        self._cards.clear()
+        self._mask = 0
 
     def has_card(self, card: Card):
         """Check if a specific card is in hand."""
-        return card in self._cards
+        return isinstance(card, Card) and bool(self._mask & card.get_mask())
+
+    def cards_of_type(self, card_type: CardType) -> list:
+        """Return the cards in hand of one type."""
+        return Card.from_mask(self._mask & Card.get_catalog().get_type_mask(card_type))
+
+    def matching_cards(self, suspect: str, weapon: str, room: str) -> list:
+        """Return the cards in hand that can disprove a suggestion.
+
+        Raises ValueError if any name is not a valid card of its type.
+        """
+        suggestion_mask = (Card(suspect, CardType.SUSPECT).get_mask()
+                           | Card(weapon, CardType.WEAPON).get_mask()
+                           | Card(room, CardType.ROOM).get_mask())
+        return Card.from_mask(self._mask & suggestion_mask)
 
     def sort_hand(self):
-        """Sort the cards in hand."""
-        self._cards.sort()
+        """Sort the cards in hand. Cards are always kept in card id order."""
 
     def display_hand(self):
         """Display the cards in hand."""
-        return ', '.join(str(card) for card in self._cards)
+        return ', '.join(str(card) for card in self.get_hand())
+
+    def __contains__(self, card):
+        return self.has_card(card)
+
+    def __len__(self):
+        return self._mask.bit_count()
+
+    def __iter__(self):
+        return iter(self.get_hand())
+
+    # Set operations return plain masks so they never allocate a new Hand
+    def __and__(self, other) -> int:
+        if isinstance(other, Hand):
+            return self._mask & other._mask
+        if isinstance(other, int):
+            return self._mask & other
+        return NotImplemented
+
+    __rand__ = __and__
+
+    def __or__(self, other) -> int:
+        if isinstance(other, Hand):
+            return self._mask | other._mask
+        if isinstance(other, int):
+            return self._mask | other
+        return NotImplemented
+
+    __ror__ = __or__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Hand):
+            return NotImplemented
+        return self._mask == other._mask
+
+    # Hands compare by their cards but change as cards are dealt and played,
+    # so, like a list, a Hand is not hashable; hash get_mask() instead
+    __hash__ = None
+
+def _mask_length() -> int:
+    return (Card.count() + 7) // 8
+
 # Sample
 if __name__ == "__main__":
     hand = Hand()
@@ -0,0 +1,79 @@
+"""
+Benchmark card lookup and validation cost as the catalog grows.
+
+Builds synthetic catalogs from 21 to 500 cards and times Card(name, type)
+for valid names, rejected names and Card.from_id. The per-lookup cost should
+stay flat across sizes. The list scan the old Card.__init__ used is timed
+alongside for comparison.
+
+Usage:
+    python -m Backend.cardGroupings.bench_catalog
+"""
+from random import Random
+from timeit import repeat
+from Backend.cardGroupings.Card import Card, CardType, CardCatalog
+
+CATALOG_SIZES = (21, 50, 100, 250, 500)
+LOOKUPS = 20_000
+
+
+def build_catalog(size: int) -> CardCatalog:
+    """Build a catalog with size cards split evenly across the three types."""
+    suspects = size // 3
+    weapons = size // 3
+    rooms = size - suspects - weapons
+    return CardCatalog(
+        f"Synthetic {size}",
+        [f"Suspect {i}" for i in range(suspects)],
+        [f"Weapon {i}" for i in range(weapons)],
+        [f"Room {i}" for i in range(rooms)],
+    )
+
+
+def time_lookups(catalog: CardCatalog) -> dict:
+    """Return nanoseconds per operation for each lookup kind."""
+    rng = Random(len(catalog))
+    names = list(catalog.get_names(CardType.ROOM))
+    keys = [(rng.choice(names), CardType.ROOM) for _ in range(LOOKUPS)]
+    ids = [rng.randrange(len(catalog)) for _ in range(LOOKUPS)]
+
+    def valid():
+        for name, card_type in keys:
+            Card(name, card_type)
+
+    def invalid():
+        for _ in range(LOOKUPS):
+            try:
+                Card("Nowhere", CardType.ROOM)
+            except ValueError:
+                pass
+
+    def by_id():
+        for card_id in ids:
+            Card.from_id(card_id)
+
+    def list_scan():
+        for name, _ in keys:
+            _ = name in names
+
+    return {label: min(repeat(func, number=1, repeat=5)) / LOOKUPS * 1e9
+            for label, func in (("valid", valid), ("invalid", invalid),
+                                ("from_id", by_id), ("list scan", list_scan))}
+
+
+def main():
+    default = Card.get_catalog()
+    try:
+        print(f"{'cards':>6} {'valid':>10} {'invalid':>10} {'from_id':>10} {'list scan':>10}  (ns/op)")
+        for size in CATALOG_SIZES:
+            catalog = build_catalog(size)
+            Card.use_catalog(catalog)
+            timings = time_lookups(catalog)
+            print(f"{size:>6} " + " ".join(f"{timings[label]:>10.1f}" for label in
+                                          ("valid", "invalid", "from_id", "list scan")))
+    finally:
+        Card.use_catalog(default)
+
+
+if __name__ == "__main__":
+    main()
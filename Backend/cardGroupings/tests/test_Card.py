@@ -1,6 +1,6 @@
 # tests/test_card.py
 import pytest
-from Card import CardType, Card
+from Backend.cardGroupings.Card import CardType, Card, CardCatalog
 
 @pytest.fixture
 def card():
@@ -41,4 +41,137 @@ def test_card_repr(card):
 
 def test_card_str(card):
     """Test the __str__ method."""
-    assert str(card) == f"name='{Card.VALID_SUSPECTS[2]}', card_type=CardType.SUSPECT"
\ No newline at end of file
+    assert str(card) == f"name='{Card.VALID_SUSPECTS[2]}', card_type=CardType.SUSPECT"
+
+def test_card_is_interned():
+    """Test that constructing the same card twice returns the shared instance."""
+    card1 = Card(Card.VALID_ROOMS[3], CardType.ROOM)
+    card2 = Card(Card.VALID_ROOMS[3], CardType.ROOM)
+    assert card1 is card2
+
+def test_card_hash():
+    """Test that cards can be used in sets and as dictionary keys."""
+    cards = {
+        Card(Card.VALID_SUSPECTS[0], CardType.SUSPECT),
+        Card(Card.VALID_WEAPONS[0], CardType.WEAPON),
+        Card(Card.VALID_SUSPECTS[0], CardType.SUSPECT),
+    }
+    assert len(cards) == 2
+    assert Card(Card.VALID_WEAPONS[0], CardType.WEAPON) in cards
+
+def test_card_ids_are_unique_and_dense():
+    """Test that every card has a unique id that maps back to it."""
+    ids = [card.get_id() for card in Card.all_cards()]
+    assert ids == list(range(Card.count()))
+    assert Card.count() == len(Card.VALID_SUSPECTS) + len(Card.VALID_WEAPONS) + len(Card.VALID_ROOMS)
+    for card in Card.all_cards():
+        assert Card.from_id(card.get_id()) is card
+
+def test_same_name_different_type():
+    """Test that the card type is part of the card's identity."""
+    with pytest.raises(ValueError, match="Miss Scarlet is not a valid room."):
+        Card("Miss Scarlet", CardType.ROOM)
+
+def test_card_is_immutable(card):
+    with pytest.raises(AttributeError):
+        card._name = "Mrs. White"
+
+def test_card_copy_and_pickle_keep_identity(card):
+    import copy
+    import pickle
+    assert copy.copy(card) is card
+    assert copy.deepcopy(card) is card
+    assert pickle.loads(pickle.dumps(card)) is card
+
+def test_card_bytes_round_trip():
+    for card in Card.all_cards():
+        assert Card.from_bytes(card.to_bytes()) is card
+
+def test_card_from_bytes_rejects_bad_data(card):
+    encoded = card.to_bytes()
+    with pytest.raises(ValueError, match="version"):
+        Card.from_bytes(b"\xff" + encoded[1:])
+    with pytest.raises(ValueError, match="Expected encoded"):
+        Card.from_bytes(encoded[:1] + b"H" + encoded[2:])
+    with pytest.raises(ValueError):
+        Card.from_bytes(encoded[:-1])
+    with pytest.raises(ValueError, match="not in the catalog"):
+        Card.from_bytes(encoded[:-2] + b"\xff\xff")
+
+@pytest.fixture
+def custom_catalog():
+    """Fixture that installs a small custom catalog and restores the default afterwards."""
+    default = Card.get_catalog()
+    catalog = CardCatalog.from_dict({
+        "name": "Mini",
+        "suspects": ["Butler", "Cook"],
+        "weapons": ["Poison"],
+        "rooms": ["Attic", "Cellar", "Garden"],
+    })
+    Card.use_catalog(catalog)
+    yield catalog
+    Card.use_catalog(default)
+
+def test_default_catalog_matches_valid_lists():
+    catalog = Card.get_catalog()
+    assert catalog.get_name() == "Classic"
+    assert list(catalog.get_names(CardType.SUSPECT)) == Card.VALID_SUSPECTS
+    assert list(catalog.get_names(CardType.WEAPON)) == Card.VALID_WEAPONS
+    assert list(catalog.get_names(CardType.ROOM)) == Card.VALID_ROOMS
+    assert len(catalog) == Card.count()
+
+def test_custom_catalog(custom_catalog):
+    assert Card.count() == 6
+    assert Card.VALID_ROOMS == ["Attic", "Cellar", "Garden"]
+    cellar = Card("Cellar", CardType.ROOM)
+    assert cellar.get_id() == 4
+    assert list(custom_catalog.get_type_ids(CardType.ROOM)) == [3, 4, 5]
+    assert custom_catalog.get_type_mask(CardType.SUSPECT) == 0b11
+    with pytest.raises(ValueError, match="Miss Scarlet is not a valid suspect."):
+        Card("Miss Scarlet", CardType.SUSPECT)
+
+def test_catalog_lookup_is_read_only():
+    with pytest.raises(TypeError):
+        Card.get_catalog().get_lookup()[("Butler", CardType.SUSPECT)] = None
+
+def test_catalog_rejects_duplicates_and_empty_groups():
+    with pytest.raises(ValueError, match="more than once"):
+        CardCatalog("Bad", ["Butler", "Butler"], ["Poison"], ["Attic"])
+    with pytest.raises(ValueError, match="no weapon cards"):
+        CardCatalog("Bad", ["Butler"], [], ["Attic"])
+
+def test_solution_codes_are_dense_and_round_trip():
+    catalog = Card.get_catalog()
+    codes = set()
+    for suspect in Card.VALID_SUSPECTS:
+        for weapon in Card.VALID_WEAPONS:
+            for room in Card.VALID_ROOMS:
+                cards = (Card(suspect, CardType.SUSPECT), Card(weapon, CardType.WEAPON), Card(room, CardType.ROOM))
+                code = catalog.pack_solution(*cards)
+                assert catalog.unpack_solution(code) == cards
+                codes.add(code)
+    assert codes == set(range(catalog.solution_count()))
+
+def test_solution_rejects_wrong_types_and_codes(custom_catalog):
+    butler, poison, attic = Card("Butler", CardType.SUSPECT), Card("Poison", CardType.WEAPON), Card("Attic", CardType.ROOM)
+    assert custom_catalog.solution_count() == 6
+    with pytest.raises(ValueError):
+        custom_catalog.pack_solution(poison, butler, attic)
+    with pytest.raises(ValueError):
+        custom_catalog.unpack_solution(6)
+
+def test_from_bytes_rejects_same_size_catalog(custom_catalog):
+    encoded = Card("Butler", CardType.SUSPECT).to_bytes()
+    renamed = CardCatalog.from_dict({
+        "name": "Mini 2",
+        "suspects": ["Butler", "Maid"],
+        "weapons": ["Poison"],
+        "rooms": ["Attic", "Cellar", "Garden"],
+    })
+    assert len(renamed) == len(custom_catalog)
+    assert renamed.get_fingerprint() != custom_catalog.get_fingerprint()
+    Card.use_catalog(renamed)
+    with pytest.raises(ValueError, match="different card catalog"):
+        Card.from_bytes(encoded)
+    Card.use_catalog(custom_catalog)
+    assert Card.from_bytes(encoded) is Card("Butler", CardType.SUSPECT)
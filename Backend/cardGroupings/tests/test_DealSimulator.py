@@ -0,0 +1,37 @@
+import pytest
+from Backend.cardGroupings.Card import Card, CardType
+
+np = pytest.importorskip("numpy")
+from Backend.cardGroupings.DealSimulator import DealSimulator, CASE_FILE_SEAT, MIN_PLAYERS, MAX_PLAYERS
+
+
+@pytest.mark.parametrize("num_players", range(MIN_PLAYERS, MAX_PLAYERS + 1))
+def test_every_card_dealt_once(num_players):
+    owners = DealSimulator(num_players, seed=1).simulate_batch(500)
+    assert owners.shape == (500, Card.count())
+    # Exactly one card of each type in the case file
+    for card_type in CardType:
+        ids = [card.get_id() for card in Card.all_cards() if card.get_card_type() == card_type]
+        assert ((owners[:, ids] == CASE_FILE_SEAT).sum(axis=1) == 1).all()
+    # Every other card belongs to a valid seat
+    assert ((owners >= CASE_FILE_SEAT) & (owners < num_players)).all()
+
+def test_hand_sizes_match_round_robin_deal():
+    report = DealSimulator(4, seed=2).run(1000, batch_size=300)
+    assert report.num_games == 1000
+    # 18 dealt cards over 4 seats: the first two seats get the extra card
+    assert list(report.mean_hand_sizes()) == [5, 5, 4, 4]
+    assert report.hand_size_skew() == 1
+
+def test_invalid_player_count():
+    with pytest.raises(ValueError):
+        DealSimulator(MAX_PLAYERS + 1)
+
+def test_deal_is_uniform():
+    report = DealSimulator(3, seed=3).run(20_000)
+    for statistic, degrees in report.case_file_chi_square().values():
+        assert statistic < 3 * degrees + 30
+    statistic, degrees = report.seat_chi_square()
+    assert statistic < 2 * degrees
+    statistic, degrees = report.shuffle_chi_square()
+    assert statistic < 2 * degrees
@@ -1,6 +1,6 @@
 import pytest
-from Card import Card, CardType
-from Deck import Deck
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.cardGroupings.Deck import Deck
 
 @pytest.fixture
 def card_suspect():
@@ -71,4 +71,77 @@ def test_add_duplicate_card_to_deck(card_suspect):
     deck = Deck()
     deck.add_card(card_suspect)  # Add the card once
     with pytest.raises(ValueError, match=f"The card '{card_suspect.get_name()}' is already in the deck."):
-        deck.add_card(card_suspect)  # Attempt to add the same card again
\ No newline at end of file
+        deck.add_card(card_suspect)  # Attempt to add the same card again
+
+
+def test_deck_membership(card_suspect, card_room):
+    deck = Deck()
+    deck.add_card(card_suspect)
+    assert card_suspect in deck
+    assert card_room not in deck
+    assert deck.get_mask() == card_suspect.get_mask()
+    deck.deal()
+    assert card_suspect not in deck
+    assert deck.get_mask() == 0
+
+
+def test_deal_order_is_last_added_first(card_suspect, card_room, card_weapon):
+    deck = Deck()
+    deck.add_card(card_suspect)
+    deck.add_card(card_room)
+    deck.add_card(card_weapon)
+    assert [deck.deal(), deck.deal(), deck.deal()] == [card_weapon, card_room, card_suspect]
+
+
+def test_deck_from_catalog():
+    deck = Deck.from_catalog()
+    assert len(deck) == Card.count()
+    assert deck.get_deck() == list(Card.all_cards())
+
+
+def test_draw_case_file():
+    deck = Deck.from_catalog()
+    case_file = deck.draw_case_file()
+    cards = case_file.get_hand()
+    assert sorted(card.get_card_type().value for card in cards) == ["Room", "Suspect", "Weapon"]
+    assert len(deck) == Card.count() - 3
+    for card in cards:
+        assert card not in deck
+
+
+def test_draw_case_file_missing_type(card_suspect, card_weapon):
+    deck = Deck()
+    deck.add_card(card_suspect)
+    deck.add_card(card_weapon)
+    with pytest.raises(ValueError):
+        deck.draw_case_file()
+
+
+def test_deal_hands_round_robin():
+    deck = Deck.from_catalog()
+    deck.draw_case_file()
+    deck.shuffle()
+    expected = deck.get_deck()[::-1]
+    hands = deck.deal_hands(4)
+    assert len(deck) == 0
+    assert [len(hand) for hand in hands] == [5, 5, 4, 4]
+    for index, card in enumerate(expected):
+        assert hands[index % 4].has_card(card)
+
+
+def test_deck_bytes_round_trip():
+    deck = Deck.from_catalog()
+    deck.shuffle()
+    deck.deal()
+    decoded = Deck.from_bytes(deck.to_bytes())
+    assert decoded.get_deck() == deck.get_deck()
+    assert decoded.get_mask() == deck.get_mask()
+    assert Deck.from_bytes(Deck().to_bytes()).get_deck() == []
+
+
+def test_deck_from_bytes_rejects_duplicates(card_suspect):
+    deck = Deck()
+    deck.add_card(card_suspect)
+    encoded = deck.to_bytes()
+    with pytest.raises(ValueError, match="duplicate"):
+        Deck.from_bytes(encoded + encoded[-1:])
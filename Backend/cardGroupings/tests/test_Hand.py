@@ -1,6 +1,6 @@
 import pytest
-from Card import Card, CardType
-from Hand import Hand
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.cardGroupings.Hand import Hand
 
 @pytest.fixture
 def card_suspect():
@@ -51,4 +51,74 @@ def test_add_duplicate_card_to_hand(card_weapon):
     hand = Hand()
     hand.add_card(card_weapon)  # Add the card once
     with pytest.raises(ValueError, match=f"The card '{card_weapon.get_name()}' is already in the hand."):
-        hand.add_card(card_weapon)  # Attempt to add the same card again
\ No newline at end of file
+        hand.add_card(card_weapon)  # Attempt to add the same card again
+
+
+def test_has_card(card_suspect, card_room):
+    hand = Hand()
+    hand.add_card(card_suspect)
+    assert hand.has_card(card_suspect)
+    assert card_suspect in hand
+    assert not hand.has_card(card_room)
+    assert not hand.has_card("not a card")
+
+
+def test_hand_mask_matches_suggestion(card_suspect, card_weapon, card_room):
+    hand = Hand()
+    hand.add_card(card_suspect)
+    hand.add_card(card_room)
+    suggestion_mask = Card.mask_of([card_suspect, card_weapon])
+    assert hand & suggestion_mask == card_suspect.get_mask()
+    assert Card.from_mask(hand & suggestion_mask) == [card_suspect]
+    assert hand | card_weapon.get_mask() == Card.mask_of([card_suspect, card_weapon, card_room])
+
+
+def test_hand_from_mask(card_suspect, card_weapon):
+    hand = Hand.from_mask(Card.mask_of([card_weapon, card_suspect]))
+    assert len(hand) == 2
+    assert hand.get_hand() == [card_suspect, card_weapon]
+
+
+def test_hands_compare_by_cards(card_suspect, card_weapon):
+    hand = Hand.from_mask(Card.mask_of([card_suspect, card_weapon]))
+    assert hand == Hand.from_mask(hand.get_mask())
+    assert hand != Hand()
+    with pytest.raises(TypeError):
+        hash(hand)
+
+
+def test_hand_bytes_round_trip(card_suspect, card_weapon, card_room):
+    hand = Hand()
+    assert Hand.from_bytes(hand.to_bytes()) == hand
+    hand.add_card(card_suspect)
+    hand.add_card(card_weapon)
+    hand.add_card(card_room)
+    encoded = hand.to_bytes()
+    assert len(encoded) == 11
+    assert Hand.from_bytes(encoded) == hand
+
+
+def test_hand_from_bytes_rejects_deck_data():
+    from Backend.cardGroupings.Deck import Deck
+    with pytest.raises(ValueError, match="Expected encoded"):
+        Hand.from_bytes(Deck.from_catalog().to_bytes())
+
+
+def test_cards_of_type(card_suspect, card_weapon, card_room):
+    hand = Hand()
+    hand.add_card(card_suspect)
+    hand.add_card(card_room)
+    assert hand.cards_of_type(CardType.SUSPECT) == [card_suspect]
+    assert hand.cards_of_type(CardType.ROOM) == [card_room]
+    assert hand.cards_of_type(CardType.WEAPON) == []
+
+
+def test_matching_cards(card_suspect, card_weapon, card_room):
+    hand = Hand()
+    hand.add_card(card_suspect)
+    hand.add_card(card_weapon)
+    matches = hand.matching_cards(card_suspect.get_name(), Card.VALID_WEAPONS[0], card_room.get_name())
+    assert matches == [card_suspect]
+    assert hand.matching_cards(Card.VALID_SUSPECTS[0], Card.VALID_WEAPONS[0], card_room.get_name()) == []
+    with pytest.raises(ValueError):
+        hand.matching_cards("King Jamar", Card.VALID_WEAPONS[0], card_room.get_name())
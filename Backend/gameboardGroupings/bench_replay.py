@@ -0,0 +1,76 @@
+"""
+Benchmark rebuilding games from their event logs.
+
+Plays random games to build event logs, then times two ways of recovering
+them: replaying every event onto a fresh GameProcessor, and
+GameProcessor.from_log, which restores the latest snapshot and replays only
+the tail. Throughput is reported in logged events per second.
+
+Usage:
+    python -m Backend.gameboardGroupings.bench_replay
+"""
+from random import Random
+from timeit import repeat
+from Backend.cardGroupings.Card import Card
+from Backend.GameManagement.player_turn import TurnAction
+from Backend.gameboardGroupings.game_log import GameLog
+from Backend.gameboardGroupings.game_processor import GameProcessor, GameState
+
+NUM_GAMES = 50
+ACTIONS_PER_GAME = 400
+NUM_PLAYERS = 6
+SNAPSHOT_INTERVALS = (16, 64, 256)
+
+
+def play_random_game(rng: Random, snapshot_interval: int) -> GameLog:
+    """Play random legal actions and return the game's log."""
+    game = GameProcessor()
+    game.event_log = GameLog(game.game_id, snapshot_interval)
+    for index in range(NUM_PLAYERS):
+        game.add_player(f"Player {index}")
+    game.start_game()
+    for _ in range(ACTIONS_PER_GAME):
+        turn = game.current_turn
+        player = turn.p
+        valid_actions = turn.get_valid_actions()
+        roll = rng.random()
+        if roll < 0.5:
+            moves = game.get_valid_moves(player)
+            if TurnAction.MOVE in valid_actions and moves:
+                game.move_player(player, rng.choice(moves))
+        elif roll < 0.65:
+            # Suggestions name the room the player has just entered
+            if TurnAction.SUGGESTION in valid_actions:
+                game.handle_suggestion(player, rng.choice(Card.VALID_SUSPECTS),
+                                       rng.choice(Card.VALID_WEAPONS), player.currLocation.get_name())
+        elif roll < 0.7:
+            game.move_weapon(rng.choice(Card.VALID_WEAPONS), game.game_board.get_space(rng.randrange(9)))
+        else:
+            game.end_turn()
+        if game.state == GameState.GAME_OVER:
+            break
+    return game.event_log
+
+
+def main():
+    rng = Random(0)
+    print(f"{'interval':>8} {'events':>8} {'full replay':>14} {'from_log':>14}  (events/s)")
+    for interval in SNAPSHOT_INTERVALS:
+        logs = [play_random_game(rng, interval) for _ in range(NUM_GAMES)]
+        total_events = sum(len(log) for log in logs)
+
+        def full_replay():
+            for log in logs:
+                GameProcessor().replay(log.events())
+
+        def from_log():
+            for log in logs:
+                GameProcessor.from_log(log)
+
+        full = total_events / min(repeat(full_replay, number=1, repeat=5))
+        tail = total_events / min(repeat(from_log, number=1, repeat=5))
+        print(f"{interval:>8} {total_events:>8} {full:>14,.0f} {tail:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
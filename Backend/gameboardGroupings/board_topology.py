@@ -0,0 +1,259 @@
+import hashlib
+import json
+from array import array
+from collections import deque
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+from Backend.gameboardGroupings.space import SpaceType
+
+LAYOUT_DIR = Path(__file__).resolve().parent / "layouts"
+DEFAULT_LAYOUT = LAYOUT_DIR / "classic.json"
+
+UNREACHABLE = 0xFFFF
+NO_SPACE = -1
+
+# Bound on memoized (space, blocked hallways, passages) move lists per layout
+MOVE_CACHE_SIZE = 4096
+
+
+class BoardTopology:
+    """
+    Immutable layout of a Clue board, shared by every game that uses it.
+
+    Rooms get ids 0..R-1 in the order given and hallways follow. Adjacency is
+    stored as compressed sparse-row arrays: the neighbors of space i are
+    targets[offsets[i]:offsets[i + 1]], hallway connections first and secret
+    passages from passage_starts[i] on. All-pairs shortest-path tables are
+    computed once at construction.
+
+    Legal destinations are memoized per (space id, occupied neighboring
+    hallways, secret passages allowed) in a bounded LRU cache. Only hallways
+    next to the space are part of the key, so the few occupancy patterns a
+    space can see are computed once and then shared by every game.
+
+    Layouts are normally defined in a JSON data file (see layouts/) and
+    compiled with load() or from_dict(), which cache compiled topologies by
+    a hash of the layout's contents.
+
+    Nothing here changes during a game; per-game occupancy lives on GameBoard.
+    """
+    def __init__(self, rooms: List[str], hallways: List[Tuple[str, str]],
+                 secret_passages: List[Tuple[str, str]],
+                 starting_positions: Dict[str, Tuple[str, str]], name: str = "Custom"):
+        names = list(rooms)
+        ids_by_name = {name: space_id for space_id, name in enumerate(names)}
+        if len(ids_by_name) != len(names):
+            raise ValueError("Room names must be unique")
+
+        corner_rooms = {room for passage in secret_passages for room in passage}
+        space_types = [SpaceType.CornerRoom if name in corner_rooms else SpaceType.ROOM for name in names]
+
+        # Hallways are named after the two rooms they join
+        hallway_ids: Dict[frozenset, int] = {}
+        neighbors: List[List[int]] = [[] for _ in names]
+        for room_a, room_b in hallways:
+            hallway_id = len(names)
+            room_a_id, room_b_id = self._room_id(ids_by_name, room_a), self._room_id(ids_by_name, room_b)
+            names.append(f"{room_a} - {room_b} Hallway")
+            space_types.append(SpaceType.HALLWAY)
+            hallway_ids[frozenset((room_a, room_b))] = hallway_id
+            ids_by_name[names[-1]] = hallway_id
+            neighbors[room_a_id].append(hallway_id)
+            neighbors[room_b_id].append(hallway_id)
+            neighbors.append([room_a_id, room_b_id])
+
+        passages: List[List[int]] = [[] for _ in names]
+        for room_a, room_b in secret_passages:
+            room_a_id, room_b_id = self._room_id(ids_by_name, room_a), self._room_id(ids_by_name, room_b)
+            passages[room_a_id].append(room_b_id)
+            passages[room_b_id].append(room_a_id)
+
+        self._layout_name: str = name
+        self._names: Tuple[str, ...] = tuple(names)
+        self._space_types: Tuple[SpaceType, ...] = tuple(space_types)
+        self._ids_by_name: Dict[str, int] = ids_by_name
+        self._room_count: int = len(rooms)
+
+        self._adj_offsets = array("H", [0])
+        self._adj_targets = array("H")
+        self._passage_starts = array("H")
+        for space_id in range(len(names)):
+            self._adj_targets.extend(neighbors[space_id])
+            self._passage_starts.append(len(self._adj_targets))
+            self._adj_targets.extend(passages[space_id])
+            self._adj_offsets.append(len(self._adj_targets))
+
+        # Bitmask over space ids of the hallways next to each space; only
+        # these can block a move out of it
+        self._hallway_neighbor_masks: Tuple[int, ...] = tuple(
+            sum(1 << neighbor for neighbor in neighbors[space_id] if space_types[neighbor] == SpaceType.HALLWAY)
+            for space_id in range(len(names)))
+        self._valid_moves = lru_cache(maxsize=MOVE_CACHE_SIZE)(self._compute_valid_moves)
+
+        self._starting_positions: Dict[str, int] = {}
+        for character, (room_a, room_b) in starting_positions.items():
+            hallway_id = hallway_ids.get(frozenset((room_a, room_b)))
+            if hallway_id is None:
+                raise ValueError(f"No hallway between {room_a} and {room_b} for {character}")
+            self._starting_positions[character] = hallway_id
+
+        # Row-major n x n shortest-path tables over hallway and secret passage
+        # moves; entry [a * n + b] describes the route from a to b
+        self._distances, self._next_hops = self._compute_distance_tables()
+        self._frozen = True
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BoardTopology":
+        """Compiles a layout from its parsed data file contents. Layouts with
+           the same contents share one compiled topology."""
+        digest = layout_digest(data)
+        topology = _compiled_layouts.get(digest)
+        if topology is None:
+            topology = cls(
+                list(data.get("rooms", ())),
+                [tuple(hallway) for hallway in data.get("hallways", ())],
+                [tuple(passage) for passage in data.get("secret_passages", ())],
+                {character: tuple(rooms) for character, rooms in data.get("starting_positions", {}).items()},
+                data.get("name", "Custom"),
+            )
+            _compiled_layouts[digest] = topology
+        return topology
+
+    @classmethod
+    def load(cls, path=DEFAULT_LAYOUT) -> "BoardTopology":
+        """Compiles a layout from a JSON data file"""
+        with open(path, encoding="utf-8") as layout_file:
+            return cls.from_dict(json.load(layout_file))
+
+    @staticmethod
+    def _room_id(ids_by_name: Dict[str, int], room: str) -> int:
+        if room not in ids_by_name:
+            raise ValueError(f"Unknown room {room}")
+        return ids_by_name[room]
+
+    def _compute_distance_tables(self) -> Tuple[array, array]:
+        """Runs a breadth-first search from every space over the CSR arrays."""
+        count = len(self._names)
+        distances = array("H", [UNREACHABLE]) * (count * count)
+        next_hops = array("H", [UNREACHABLE]) * (count * count)
+        offsets, targets = self._adj_offsets, self._adj_targets
+        for source in range(count):
+            row = source * count
+            distances[row + source] = 0
+            queue = deque()
+            for neighbor in targets[offsets[source]:offsets[source + 1]]:
+                if distances[row + neighbor] == UNREACHABLE:
+                    distances[row + neighbor] = 1
+                    next_hops[row + neighbor] = neighbor
+                    queue.append(neighbor)
+            while queue:
+                current = queue.popleft()
+                for neighbor in targets[offsets[current]:offsets[current + 1]]:
+                    if distances[row + neighbor] == UNREACHABLE:
+                        distances[row + neighbor] = distances[row + current] + 1
+                        next_hops[row + neighbor] = next_hops[row + current]
+                        queue.append(neighbor)
+        return distances, next_hops
+
+    def _compute_valid_moves(self, space_id: int, blocked_mask: int, include_secret_passages: bool) -> Tuple[int, ...]:
+        return tuple(neighbor for neighbor in self.get_neighbor_ids(space_id, include_secret_passages)
+                     if not blocked_mask >> neighbor & 1)
+
+    def __setattr__(self, name, value):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("BoardTopology is immutable")
+        super().__setattr__(name, value)
+
+    def get_layout_name(self) -> str:
+        """Returns the name of the layout"""
+        return self._layout_name
+
+    def get_space_count(self) -> int:
+        """Returns the number of spaces on the board"""
+        return len(self._names)
+
+    def get_room_count(self) -> int:
+        """Returns the number of rooms; rooms have ids 0..count-1"""
+        return self._room_count
+
+    def get_name(self, space_id: int) -> str:
+        """Returns the name of a space"""
+        return self._names[space_id]
+
+    def get_space_type(self, space_id: int) -> SpaceType:
+        """Returns the type of a space"""
+        return self._space_types[space_id]
+
+    def get_space_id(self, name: str) -> int:
+        """Returns the id of the space with the given name, or NO_SPACE"""
+        return self._ids_by_name.get(name, NO_SPACE)
+
+    def get_starting_positions(self) -> Dict[str, int]:
+        """Returns a mapping of character name to starting space id"""
+        return dict(self._starting_positions)
+
+    def get_neighbor_ids(self, space_id: int, include_secret_passages: bool = True) -> array:
+        """Returns the ids of the spaces reachable in one move from space_id,
+           including secret passages unless told otherwise"""
+        end = self._adj_offsets[space_id + 1] if include_secret_passages else self._passage_starts[space_id]
+        return self._adj_targets[self._adj_offsets[space_id]:end]
+
+    def get_secret_passage_ids(self, space_id: int) -> array:
+        """Returns the ids of the rooms reachable by secret passage from space_id"""
+        return self._adj_targets[self._passage_starts[space_id]:self._adj_offsets[space_id + 1]]
+
+    def get_adjacency(self) -> tuple:
+        """Returns the (offsets, targets, passage_starts) CSR arrays"""
+        return self._adj_offsets, self._adj_targets, self._passage_starts
+
+    def distance(self, source_id: int, target_id: int) -> int:
+        """Returns the number of moves from source to target, or -1 if the
+           target cannot be reached"""
+        moves = self._distances[source_id * len(self._names) + target_id]
+        return -1 if moves == UNREACHABLE else moves
+
+    def next_hop(self, source_id: int, target_id: int) -> int:
+        """Returns the id of the first space on a shortest route from source
+           to target, or -1 if source is target or target is unreachable"""
+        hop = self._next_hops[source_id * len(self._names) + target_id]
+        return -1 if hop == UNREACHABLE else hop
+
+    def get_path(self, source_id: int, target_id: int) -> List[int]:
+        """Returns the ids of the spaces on a shortest route from source to
+           target, excluding source. Empty if there is no route."""
+        path = []
+        current = source_id
+        while current != target_id:
+            current = self.next_hop(current, target_id)
+            if current == -1:
+                return []
+            path.append(current)
+        return path
+
+    def get_hallway_neighbor_mask(self, space_id: int) -> int:
+        """Returns a bitmask over space ids of the hallways next to space_id"""
+        return self._hallway_neighbor_masks[space_id]
+
+    def get_valid_move_ids(self, space_id: int, occupied_mask: int,
+                           include_secret_passages: bool = True) -> Tuple[int, ...]:
+        """Returns the ids of the spaces a player in space_id may move to,
+           given a bitmask over space ids of the occupied spaces. Occupied
+           hallways are blocked; rooms never are."""
+        return self._valid_moves(space_id, occupied_mask & self._hallway_neighbor_masks[space_id],
+                                 include_secret_passages)
+
+    def get_move_cache_info(self):
+        """Returns the hit and miss counts of the valid-move cache"""
+        return self._valid_moves.cache_info()
+
+
+# Compiled topologies by layout_digest of their layout data
+_compiled_layouts: Dict[str, BoardTopology] = {}
+
+
+def layout_digest(data: dict) -> str:
+    """Returns a SHA-256 hex digest of a layout's contents, independent of
+       key order and formatting"""
+    canonical = json.dumps(data, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,159 @@
+import struct
+from array import array
+from enum import IntEnum
+from typing import Iterator, Optional, Tuple
+from Backend.gameboardGroupings.game_snapshot import GameSnapshot, encode_snapshot, decode_snapshot
+
+DEFAULT_SNAPSHOT_INTERVAL = 64
+
+# Every event is framed as (type, payload length) followed by the payload
+FRAME = struct.Struct(">BH")
+MAX_PAYLOAD = 0xFFFF
+
+# A whole log is encoded as (version, snapshot interval, events covered by
+# the snapshot, snapshot length, game id length), the game id, the encoded
+# snapshot, then the events; events_since() tails can be appended after it
+LOG_VERSION = 1
+LOG_HEAD = struct.Struct(">BHIIH")
+
+# Payloads; variable-length tails are noted beside each
+ADD_PLAYER = struct.Struct(">h")        # character card id, then the UTF-8 name
+START_GAME = struct.Struct(">I")        # case file code, then hand masks and weapon rooms
+WEAPON_ROOM = struct.Struct(">h")       # one per weapon
+MOVE_PLAYER = struct.Struct(">BH")      # seat, space id
+MOVE_WEAPON = struct.Struct(">BH")      # weapon index, room id
+SOLUTION = struct.Struct(">BI")         # seat, packed suspect/weapon/room
+# RESTORE carries an encode_snapshot() payload
+
+
+def hand_mask_size(card_count: int) -> int:
+    """Returns the bytes taken by one hand mask in a START_GAME payload"""
+    return (card_count + 7) // 8
+
+
+class EventType(IntEnum):
+    """Kinds of state change recorded in a GameLog"""
+    ADD_PLAYER = 1
+    START_GAME = 2
+    MOVE_PLAYER = 3
+    MOVE_WEAPON = 4
+    SUGGESTION = 5
+    ACCUSATION = 6
+    END_TURN = 7
+    RESTORE = 8
+
+
+class GameLog():
+    """
+    GameLog: Append-only record of one game's state changes
+
+    Events are packed back to back in a bytearray, with an array of their
+    offsets, so appending is a few bytes and the log can be written out
+    incrementally with events_since(). Every snapshot_interval events the
+    game's snapshot replaces the one kept before, so rebuilding a game means
+    restoring the latest snapshot and replaying only the events after it.
+    to_bytes() encodes the snapshot along with the events.
+    """
+    def __init__(self, game_id: str, snapshot_interval: int = DEFAULT_SNAPSHOT_INTERVAL):
+        if snapshot_interval < 1:
+            raise ValueError("Snapshot interval must be at least 1")
+        self.game_id = game_id
+        self.snapshot_interval = snapshot_interval
+        self._data = bytearray()
+        self._offsets = array("I")
+        self._snapshot: Tuple[int, Optional[GameSnapshot]] = (0, None)
+        # Bytes of a torn final event dropped by from_bytes()
+        self.torn_bytes = 0
+
+    def __len__(self) -> int:
+        """Returns the number of events"""
+        return len(self._offsets)
+
+    def append(self, event_type: EventType, payload: bytes = b"") -> int:
+        """Appends an event and returns its index"""
+        if len(payload) > MAX_PAYLOAD:
+            raise ValueError(f"Event payload of {len(payload)} bytes is too long")
+        frame = FRAME.pack(event_type, len(payload))
+        self._offsets.append(len(self._data))
+        self._data += frame
+        self._data += payload
+        return len(self._offsets) - 1
+
+    def needs_snapshot(self) -> bool:
+        """Returns True when the last event completed a snapshot interval"""
+        return len(self._offsets) % self.snapshot_interval == 0
+
+    def add_snapshot(self, snapshot: GameSnapshot):
+        """Keeps a snapshot of the game as of the current end of the log, in
+           place of the previous one"""
+        self._snapshot = (len(self._offsets), snapshot)
+
+    def latest_snapshot(self) -> Tuple[int, Optional[GameSnapshot]]:
+        """Returns (number of events it covers, snapshot), or (0, None)"""
+        return self._snapshot
+
+    def events(self, start: int = 0) -> Iterator[Tuple[EventType, bytes]]:
+        """Yields (event type, payload) for each event from index start on"""
+        data = self._data
+        offset = self._offsets[start] if start < len(self._offsets) else len(data)
+        end = len(data)
+        while offset < end:
+            event_type, length = FRAME.unpack_from(data, offset)
+            offset += FRAME.size
+            yield EventType(event_type), bytes(data[offset:offset + length])
+            offset += length
+
+    def events_since(self, start: int) -> bytes:
+        """Returns the encoded events from index start on, e.g. to persist
+           the tail written since the last flush"""
+        if start >= len(self._offsets):
+            return b""
+        return bytes(self._data[self._offsets[start]:])
+
+    def extend(self, data: bytes):
+        """Appends encoded events, e.g. ones read back from storage"""
+        if self._extend(memoryview(data)) != len(data):
+            raise ValueError("Encoded events are truncated")
+
+    def _extend(self, view: memoryview) -> int:
+        """Appends every whole event in view and returns the bytes used"""
+        offset = 0
+        while offset + FRAME.size <= len(view):
+            _, length = FRAME.unpack_from(view, offset)
+            end = offset + FRAME.size + length
+            if end > len(view):
+                break
+            self._offsets.append(len(self._data))
+            self._data += view[offset:end]
+            offset = end
+        return offset
+
+    def to_bytes(self) -> bytes:
+        """Returns the log, with its latest snapshot, as bytes"""
+        covered, snapshot = self._snapshot
+        encoded_snapshot = b"" if snapshot is None else encode_snapshot(snapshot)
+        game_id = self.game_id.encode("utf-8")
+        return b"".join((LOG_HEAD.pack(LOG_VERSION, self.snapshot_interval, covered, len(encoded_snapshot),
+                                       len(game_id)), game_id, encoded_snapshot, self._data))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameLog":
+        """Rebuilds a log from to_bytes() output and any events_since()
+           tails appended to it. A torn final event, as left by a crash
+           mid-write, is dropped."""
+        if len(data) < LOG_HEAD.size:
+            raise ValueError("Encoded log is too short")
+        version, snapshot_interval, covered, snapshot_length, id_length = LOG_HEAD.unpack_from(data)
+        if version != LOG_VERSION:
+            raise ValueError(f"Unsupported log version {version}")
+        view = memoryview(data)
+        offset = LOG_HEAD.size + id_length + snapshot_length
+        if offset > len(view):
+            raise ValueError("Encoded log is truncated")
+        log = cls(bytes(view[LOG_HEAD.size:LOG_HEAD.size + id_length]).decode("utf-8"), snapshot_interval)
+        if snapshot_length:
+            log._snapshot = (covered, decode_snapshot(bytes(view[offset - snapshot_length:offset])))
+        log.torn_bytes = len(view) - offset - log._extend(view[offset:])
+        if covered > len(log):
+            raise ValueError("Encoded log is missing events its snapshot covers")
+        return log
@@ -1,127 +1,176 @@
-from enum import Enum, auto
 from typing import List, Optional, Dict, Set
-from cardGroupings.Deck import Deck
-from cardGroupings.Hand import Hand
-from cardGroupings.Card import Card, CardType
-from GameManagement.player import Player
-from GameManagement.player_turn import PlayerTurn
-from space import Room, Hallway, Space
+from Backend.cardGroupings.Deck import Deck
+from Backend.cardGroupings.Hand import Hand
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.GameManagement.player import Player, PlayerTable, NO_LOCATION
+from Backend.GameManagement.player_turn import Player_Turn
+from Backend.gameboardGroupings.gameboard import GameBoard
+from Backend.gameboardGroupings.turn_order import TurnOrder
+from Backend.gameboardGroupings.game_snapshot import (GameSetup, GameSnapshot, GameState, TurnState, NO_TURN,
+                                                     NO_WINNER, TURN_ACTIVE, TURN_MADE_ACCUSATION, TURN_MADE_SUGGESTION,
+                                                     TURN_ENTERED_ROOM, TURN_MOVED, encode_snapshot,
+                                                     decode_snapshot)
+from Backend.gameboardGroupings.game_log import (GameLog, EventType, ADD_PLAYER, START_GAME, WEAPON_ROOM,
+                                                MOVE_PLAYER, MOVE_WEAPON, SOLUTION, hand_mask_size)
+from Backend.gameboardGroupings.space import Room, Space, SpaceType
 import random
+import uuid
 
-class GameState(Enum):
-    WAITING_FOR_PLAYERS = auto()
-    INITIALIZING = auto()
-    IN_PROGRESS = auto()
-    GAME_OVER = auto()
+CASE_FILE_OWNER = -1
+NO_SOLUTION = -1
 
 class GameProcessor:
     """Controls the game flow and manages game state."""
     
     MIN_PLAYERS = 3
     MAX_PLAYERS = 6
+    # Names are logged and snapshotted as UTF-8 with a 16-bit length
+    MAX_NAME_BYTES = 255
     
-    def __init__(self):
-        # Game identification
-        self.game_id: str = str(uuid.uuid4())
+    def __init__(self, game_id: Optional[str] = None):
+        # Game identification; the registry may assign one
+        self.game_id: str = game_id or str(uuid.uuid4())
         
         # Game components
         self.game_board: GameBoard = GameBoard()
         self.main_deck: Deck = Deck()
         self.case_file: Hand = Hand()
+        # The case file packed by CardCatalog.pack_solution, so checking an
+        # accusation is one integer comparison
+        self.case_file_code: int = NO_SOLUTION
         
-        # Player management
-        self.players: List[Player] = []
+        # Player management; players are rows of the table, seated in the
+        # order they joined
+        self.player_table: PlayerTable = PlayerTable(self.game_board)
+        self.turn_order: TurnOrder = TurnOrder()
         self.current_turn: Optional[Player_Turn] = None
-        self.eliminated_players: Set[Player] = set()
+
+        # Seat holding each card by card id, built once in _deal_cards
+        self._card_owner: List[int] = []
+
+        # GameSetup shared by snapshots until players join or the game starts
+        self._setup: Optional[GameSetup] = None
         
         # Game state
         self.state: GameState = GameState.WAITING_FOR_PLAYERS
         self.winner: Optional[Player] = None
+
+        # Every state change goes through an _apply_* method, which records
+        # it here; None while replaying
+        self.event_log: Optional[GameLog] = GameLog(self.game_id)
         
         self._initialize_deck()
 
+    @property
+    def players(self) -> List[Player]:
+        """Players in seat order."""
+        return self.player_table.get_players()
+
+    @property
+    def eliminated_players(self) -> Set[Player]:
+        """Players that have been eliminated."""
+        table = self.player_table
+        return {table.get_player(row) for row, is_out in enumerate(table.eliminated) if is_out}
+
     def _initialize_deck(self) -> None:
         """Initialize the main deck with all cards."""
-        # Add all suspect cards
-        for suspect in Card.VALID_SUSPECTS:
-            self.main_deck.add_card(Card(suspect, CardType.SUSPECT))
-            
-        # Add all weapon cards
-        for weapon in Card.VALID_WEAPONS:
-            self.main_deck.add_card(Card(weapon, CardType.WEAPON))
-            
-        # Add all room cards
-        for room in Card.VALID_ROOMS:
-            self.main_deck.add_card(Card(room, CardType.ROOM))
+        self.main_deck = Deck.from_catalog()
 
     def add_player(self, player_name: str) -> Optional[Player]:
         """Add a new player to the game."""
         if self.state != GameState.WAITING_FOR_PLAYERS:
             raise ValueError("Cannot add players after game has started")
             
-        if len(self.players) >= self.MAX_PLAYERS:
+        if len(self.player_table) >= self.MAX_PLAYERS:
             raise ValueError("Maximum number of players reached")
+
+        if len(player_name.encode("utf-8")) > self.MAX_NAME_BYTES:
+            raise ValueError(f"Player names are limited to {self.MAX_NAME_BYTES} bytes")
             
         # Create new player
-        player = Player(player_name)
-        available_characters = set(Card.VALID_SUSPECTS) - {p.character for p in self.players}
-        player.character = random.choice(list(available_characters))
+        taken_characters = set(self.player_table.character_ids)
+        available_characters = [card_id for card_id in Card.get_catalog().get_type_ids(CardType.SUSPECT)
+                                if card_id not in taken_characters]
+        return self._apply_add_player(player_name, random.choice(available_characters))
+
+    def _apply_add_player(self, player_name: str, character_id: int) -> Player:
+        player = self.player_table.add_player(player_name)
+        player.character = Card.from_id(character_id).get_name()
         
         # Set starting position
         starting_positions = self.game_board.get_starting_positions()
         player.currLocation = starting_positions[player.character]
+        player.currLocation.add_player(player)
         
-        self.players.append(player)
+        self.turn_order.add_player(player)
+        self._setup = None
+        self._record(EventType.ADD_PLAYER, ADD_PLAYER.pack(character_id) + player_name.encode("utf-8"))
         return player
 
     def start_game(self) -> bool:
         """Initialize and start the game."""
-        if len(self.players) < self.MIN_PLAYERS:
+        if self.state != GameState.WAITING_FOR_PLAYERS:
+            raise ValueError("The game has already started")
+        if len(self.player_table) < self.MIN_PLAYERS:
             raise ValueError(f"Need at least {self.MIN_PLAYERS} players to start")
             
         self.state = GameState.INITIALIZING
         
         # Create case file
-        self._create_case_file()
+        case_file_code = self._create_case_file()
         
         # Deal remaining cards
-        self._deal_cards()
+        hand_masks = self._deal_cards()
+
+        # Put the weapon tokens in the rooms
+        weapon_rooms = self._place_weapons()
         
-        # Start first turn
-        self.state = GameState.IN_PROGRESS
-        self.current_turn = Player_Turn(self.players[0])
+        self._apply_start_game(case_file_code, hand_masks, weapon_rooms)
         return True
 
-    def _create_case_file(self) -> None:
-        """Create the case file by selecting one of each card type."""
-        self.main_deck.shuffle()
-        
-        # Get one of each type
-        suspect = next(card for card in self.main_deck.get_deck() 
-                      if card.get_card_type() == CardType.SUSPECT)
-        weapon = next(card for card in self.main_deck.get_deck() 
-                     if card.get_card_type() == CardType.WEAPON)
-        room = next(card for card in self.main_deck.get_deck() 
-                   if card.get_card_type() == CardType.ROOM)
-        
-        # Remove from main deck and add to case file
-        for card in [suspect, weapon, room]:
-            self.main_deck.remove_card(card)
-            self.case_file.add_card(card)
+    def _create_case_file(self) -> int:
+        """Draw one card of each type for the case file and return its code."""
+        # Hands list cards by id, and ids run suspects, weapons, then rooms
+        return Card.get_catalog().pack_solution(*self.main_deck.draw_case_file().get_hand())
 
-    def _deal_cards(self) -> None:
-        """Deal remaining cards to players."""
+    def _deal_cards(self) -> List[int]:
+        """Deal remaining cards and return each seat's hand mask."""
         self.main_deck.shuffle()
-        current_player = 0
+        return [hand.get_mask() for hand in self.main_deck.deal_hands(len(self.player_table))]
+
+    def _place_weapons(self) -> List[int]:
+        """Pick a random room for each weapon token, one per room while rooms last."""
+        room_count = self.game_board.topology.get_room_count()
+        if room_count >= len(Card.VALID_WEAPONS):
+            return random.sample(range(room_count), len(Card.VALID_WEAPONS))
+        return random.choices(range(room_count), k=len(Card.VALID_WEAPONS))
+
+    def _apply_start_game(self, case_file_code: int, hand_masks: List[int], weapon_rooms: List[int]) -> None:
+        self._set_cards(case_file_code, hand_masks)
+        self.main_deck = Deck()
+        for player, mask in zip(self.players, hand_masks):
+            player.receive_hand(Hand.from_mask(mask))
+        for weapon_name, room_id in zip(Card.VALID_WEAPONS, weapon_rooms):
+            self.game_board.add_weapon(Card(weapon_name, CardType.WEAPON), room_id)
         
-        # Deal all remaining cards
-        while True:
-            card = self.main_deck.deal()
-            if not card:
-                break
-                
-            self.players[current_player].receive_card_dealt(card)
-            current_player = (current_player + 1) % len(self.players)
+        # Start first turn
+        self._setup = None
+        self.state = GameState.IN_PROGRESS
+        self.current_turn = self._start_turn(self.turn_order.get_current_turn())
+
+        mask_size = hand_mask_size(Card.count())
+        self._record(EventType.START_GAME, START_GAME.pack(case_file_code)
+                     + b"".join(mask.to_bytes(mask_size, "big") for mask in hand_masks)
+                     + b"".join(WEAPON_ROOM.pack(room_id) for room_id in weapon_rooms))
+
+    def _set_cards(self, case_file_code: int, hand_masks) -> None:
+        """Set the case file and record which seat holds each card."""
+        self.case_file_code = case_file_code
+        self.case_file = Hand.from_mask(Card.mask_of(Card.get_catalog().unpack_solution(case_file_code)))
+        self._card_owner = [CASE_FILE_OWNER] * Card.count()
+        for seat, mask in enumerate(hand_masks):
+            for card in Card.from_mask(mask):
+                self._card_owner[card.get_id()] = seat
 
     def handle_suggestion(self, player: Player, suspect: str, weapon: str, room: str) -> Optional[Card]:
         """Handle a suggestion from a player."""
@@ -131,90 +180,334 @@ class GameProcessor:
         if player != self.current_turn.p:
             raise ValueError("Not this player's turn")
             
-        suggestion_cards = {
+        suggestion_cards = (
             Card(suspect, CardType.SUSPECT),
             Card(weapon, CardType.WEAPON),
             Card(room, CardType.ROOM)
-        }
-        
-        # Check each other player's hand in order
-        start_idx = (self.players.index(player) + 1) % len(self.players)
-        for i in range(len(self.players) - 1):
-            check_idx = (start_idx + i) % len(self.players)
-            check_player = self.players[check_idx]
-            
-            # Skip eliminated players
-            if check_player in self.eliminated_players:
-                continue
-                
-            # Check player's hand for matching cards
-            for card in suggestion_cards:
-                if check_player.playerHand.has_card(card):
-                    return card
-                    
+        )
+        self._apply_suggestion(player, Card.get_catalog().pack_solution(*suggestion_cards))
+
+        # The first non-eliminated player after the suggester, in the
+        # direction of play, that holds any suggested card disproves it
+        held_by: Dict[int, Card] = {}
+        for card in suggestion_cards:
+            owner = self._card_owner[card.get_id()]
+            if owner != CASE_FILE_OWNER:
+                held_by.setdefault(owner, card)
+        if held_by:
+            for seat in self.turn_order.seats_after(self.turn_order.get_seat(player.playerID)):
+                if seat in held_by:
+                    return held_by[seat]
+
         return None
 
+    def _apply_suggestion(self, player: Player, code: int) -> None:
+        self.current_turn.hasMadeSuggestion = True
+        self._record(EventType.SUGGESTION, SOLUTION.pack(player.get_row(), code))
+
     def handle_accusation(self, player: Player, suspect: str, weapon: str, room: str) -> bool:
         """Handle an accusation from a player."""
         if not self.current_turn or not self.current_turn.isActive:
             raise ValueError("Not currently this player's turn")
+
+        if player != self.current_turn.p:
+            raise ValueError("Not this player's turn")
             
-        accusation_cards = {
-            Card(suspect, CardType.SUSPECT),
-            Card(weapon, CardType.WEAPON),
-            Card(room, CardType.ROOM)
-        }
-        
+        return self._apply_accusation(player, self.encode_solution(suspect, weapon, room))
+
+    def _apply_accusation(self, player: Player, code: int) -> bool:
+        self.current_turn.hasMadeAccusation = True
+
         # Check if accusation matches case file
-        case_file_cards = set(self.case_file.get_hand())
-        
-        if accusation_cards == case_file_cards:
+        is_correct = code == self.case_file_code
+        if is_correct:
             self.winner = player
             self.state = GameState.GAME_OVER
-            return True
         else:
             # Eliminate player
-            self.eliminated_players.add(player)
+            self.eliminate_player(player)
             
             # Check if game is over
-            active_players = len(self.players) - len(self.eliminated_players)
-            if active_players < self.MIN_PLAYERS:
+            if self.player_table.active_count() < self.MIN_PLAYERS:
                 self.state = GameState.GAME_OVER
-                
-            return False
+
+        self._record(EventType.ACCUSATION, SOLUTION.pack(player.get_row(), code))
+        return is_correct
+
+    def eliminate_player(self, player: Player) -> None:
+        """Mark a player eliminated and take them out of the turn order."""
+        self.player_table.eliminate(player.get_row())
+        self.turn_order.remove_player(player.playerID)
+
+    def encode_solution(self, suspect: str, weapon: str, room: str) -> int:
+        """Pack a suspect, weapon and room into the case file's integer code."""
+        return Card.get_catalog().pack_solution(
+            Card(suspect, CardType.SUSPECT),
+            Card(weapon, CardType.WEAPON),
+            Card(room, CardType.ROOM)
+        )
 
     def end_turn(self) -> Optional[Player_Turn]:
         """End current turn and start next player's turn."""
         if not self.current_turn:
             return None
-            
-        current_player_idx = self.players.index(self.current_turn.p)
-        
-        # Find next non-eliminated player
-        for i in range(1, len(self.players) + 1):
-            next_idx = (current_player_idx + i) % len(self.players)
-            next_player = self.players[next_idx]
-            
-            if next_player not in self.eliminated_players:
-                self.current_turn = Player_Turn(next_player)
-                return self.current_turn
-                
-        return None
+
+        return self._apply_end_turn()
+
+    def _apply_end_turn(self) -> Optional[Player_Turn]:
+        # Eliminated players are out of the turn order, so they are skipped
+        next_player = self.turn_order.advance_turn()
+        if next_player is None:
+            return None
+        self.current_turn = self._start_turn(next_player)
+        self._record(EventType.END_TURN)
+        return self.current_turn
+
+    def _start_turn(self, player: Player) -> Player_Turn:
+        turn = Player_Turn(player, self)
+        turn.isActive = True
+        return turn
+
+    def get_player_associated_with_character(self, character: str) -> Optional[Player]:
+        """Get the player playing a character, or None."""
+        return self.game_board.get_player_by_character(character)
+
+    def get_player_location(self, player: Player) -> Optional[Space]:
+        """Get the space a player is in."""
+        return self.game_board.get_player_location(player.playerID)
+
+    def get_weapon_location(self, weapon: str) -> Optional[Space]:
+        """Get the room a weapon token is in, or None."""
+        room_id = self.game_board.get_weapon_room_id(Card(weapon, CardType.WEAPON))
+        return None if room_id < 0 else self.game_board.get_space(room_id)
+
+    def move_weapon(self, weapon: str, room: Room) -> None:
+        """Move a weapon token to a room, as when it is named in a suggestion."""
+        weapon_card = Card(weapon, CardType.WEAPON)
+        weapon_index = weapon_card.get_id() - Card.get_catalog().get_type_ids(CardType.WEAPON)[0]
+        self._apply_move_weapon(weapon_index, room.get_space_id())
+
+    def _apply_move_weapon(self, weapon_index: int, room_id: int) -> None:
+        weapon_id = Card.get_catalog().get_type_ids(CardType.WEAPON)[weapon_index]
+        self.game_board.move_weapon(Card.from_id(weapon_id), room_id)
+        self._record(EventType.MOVE_WEAPON, MOVE_WEAPON.pack(weapon_index, room_id))
 
     def get_valid_moves(self, player: Player) -> List[Space]:
         """Get valid moves for a player."""
-        if player != self.current_turn.p:
+        if not self.current_turn or player != self.current_turn.p:
             return []
-        return player.get_valid_moves()
+        return self.game_board.get_valid_moves(self.game_board.get_player_space_id(player.playerID))
 
     def move_player(self, player: Player, target_space: Space) -> bool:
         """Move a player to a new space."""
-        if player != self.current_turn.p or not self.current_turn.isActive:
+        if not self.current_turn or player != self.current_turn.p or not self.current_turn.isActive:
             return False
             
-        if target_space not in self.get_valid_moves(player):
+        if not self.game_board.is_valid_move(self.game_board.get_player_space_id(player.playerID),
+                                             target_space.get_space_id()):
             return False
             
+        self._apply_move_player(player, target_space.get_space_id())
+        return True
+
+    def summon_player(self, player: Player, room: Room) -> bool:
+        """Move a player's token to a room named in a suggestion. Returns
+        False if they are already there."""
+        if self.game_board.get_player_space_id(player.playerID) == room.get_space_id():
+            return False
+        self._apply_move_player(player, room.get_space_id())
+        return True
+
+    def _apply_move_player(self, player: Player, space_id: int) -> None:
+        target_space = self.game_board.get_space(space_id)
+        target_space.add_player(player)
         player.prevLocation = player.currLocation
         player.currLocation = target_space
-        return True
\ No newline at end of file
+        # Summoned players are moved on someone else's turn
+        if self.current_turn is not None and player == self.current_turn.p:
+            self.current_turn.hasMoved = True
+            if target_space.get_space_type() != SpaceType.HALLWAY:
+                self.current_turn.hasEnteredRoom = True
+        self._record(EventType.MOVE_PLAYER, MOVE_PLAYER.pack(player.get_row(), space_id))
+
+    def snapshot(self) -> GameSnapshot:
+        """Capture the game state as an immutable GameSnapshot. Snapshots
+        taken between the same two setup changes share one GameSetup."""
+        table = self.player_table
+        if self._setup is None:
+            self._setup = GameSetup(
+                tuple(table.names),
+                table.player_ids.tobytes(),
+                table.character_ids.tobytes(),
+                tuple(table.hand_masks),
+                self.case_file_code,
+                self.main_deck.to_bytes()
+            )
+        seat, is_reversed, in_rotation = self.turn_order.get_state()
+        return GameSnapshot(
+            self.game_id,
+            self.state,
+            self._setup,
+            table.location_ids.tobytes(),
+            table.prev_location_ids.tobytes(),
+            bytes(table.eliminated),
+            self.game_board.get_weapon_spaces(),
+            TurnState(seat, is_reversed, in_rotation, self._turn_flags()),
+            NO_WINNER if self.winner is None else self.winner.get_row()
+        )
+
+    def restore(self, snapshot: GameSnapshot) -> None:
+        """Return the game to the state captured in a snapshot, e.g. to undo
+        moves the players have seen. Player objects for seats in the snapshot
+        stay valid. A logged game records the whole snapshot, so replaying
+        the log does not redo the changes it undid; look-ahead should play
+        on a from_snapshot(snapshot, logged=False) copy instead."""
+        self._apply_restore(snapshot)
+        if self.event_log is not None:
+            self._record(EventType.RESTORE, encode_snapshot(snapshot))
+
+    def _apply_restore(self, snapshot: GameSnapshot) -> None:
+        setup = snapshot.setup
+        table = self.player_table
+        table.load_rows(setup.names, setup.player_ids, setup.character_ids, snapshot.locations,
+                        snapshot.prev_locations, snapshot.eliminated, setup.hand_masks)
+        players = table.get_players()
+
+        self.game_board.clear_players()
+        for player, space_id in zip(players, table.location_ids):
+            if space_id != NO_LOCATION:
+                self.game_board.add_player(player, space_id)
+        self.game_board.set_weapon_spaces(snapshot.weapons)
+
+        turn = snapshot.turn
+        self.turn_order.set_state(players, (turn.seat, turn.is_reversed, turn.in_rotation))
+        self.current_turn = None if turn.flags == NO_TURN else self._restore_turn(players[turn.seat], turn.flags)
+
+        self.main_deck = Deck.from_bytes(setup.deck)
+        if setup.case_file_code == NO_SOLUTION:
+            # Not dealt yet
+            self.case_file_code = NO_SOLUTION
+            self.case_file = Hand()
+            self._card_owner = []
+        else:
+            self._set_cards(setup.case_file_code, setup.hand_masks)
+        self._setup = setup
+
+        self.game_id = snapshot.game_id
+        self.state = snapshot.state
+        self.winner = None if snapshot.winner == NO_WINNER else players[snapshot.winner]
+
+    @classmethod
+    def from_snapshot(cls, snapshot: GameSnapshot, logged: bool = True) -> "GameProcessor":
+        """Build a new processor in the state captured in a snapshot. Its log
+        starts from the snapshot; with logged=False it has no log, so moves
+        and restores on it cost nothing beyond the change itself, as
+        look-ahead needs."""
+        game = cls(snapshot.game_id)
+        game.event_log = None
+        game._apply_restore(snapshot)
+        if logged:
+            game.event_log = GameLog(snapshot.game_id)
+            game.event_log.add_snapshot(snapshot)
+        return game
+
+    def to_bytes(self) -> bytes:
+        """Encode the game as its log, with a snapshot of its current state,
+        e.g. to store it. Later events can be stored with events_since()."""
+        log = self.event_log
+        if log is None:
+            raise ValueError("The game is not being logged")
+        log.add_snapshot(self.snapshot())
+        return log.to_bytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameProcessor":
+        """Rebuild a game, history included, from to_bytes() output and any
+        events_since() tails appended to it."""
+        return cls.from_log(GameLog.from_bytes(data))
+
+    @classmethod
+    def from_log(cls, log: GameLog) -> "GameProcessor":
+        """Rebuild a game from its log: restore the latest snapshot, then
+        replay only the events recorded after it. The game keeps logging."""
+        covered, snapshot = log.latest_snapshot()
+        game = cls(log.game_id)
+        game.event_log = None
+        if snapshot is not None:
+            game.restore(snapshot)
+        game.replay(log.events(covered))
+        game.event_log = log
+        return game
+
+    def replay(self, events) -> int:
+        """Apply (event type, payload) pairs from a GameLog without
+        recording them again. Returns the number applied."""
+        event_log, self.event_log = self.event_log, None
+        count = 0
+        try:
+            for event_type, payload in events:
+                self._apply_event(event_type, payload)
+                count += 1
+        finally:
+            self.event_log = event_log
+        return count
+
+    def _apply_event(self, event_type: EventType, payload: bytes) -> None:
+        table = self.player_table
+        if event_type == EventType.MOVE_PLAYER:
+            seat, space_id = MOVE_PLAYER.unpack(payload)
+            self._apply_move_player(table.get_player(seat), space_id)
+        elif event_type == EventType.END_TURN:
+            self._apply_end_turn()
+        elif event_type == EventType.SUGGESTION:
+            seat, code = SOLUTION.unpack(payload)
+            self._apply_suggestion(table.get_player(seat), code)
+        elif event_type == EventType.ACCUSATION:
+            seat, code = SOLUTION.unpack(payload)
+            self._apply_accusation(table.get_player(seat), code)
+        elif event_type == EventType.MOVE_WEAPON:
+            self._apply_move_weapon(*MOVE_WEAPON.unpack(payload))
+        elif event_type == EventType.ADD_PLAYER:
+            character_id, = ADD_PLAYER.unpack_from(payload)
+            self._apply_add_player(payload[ADD_PLAYER.size:].decode("utf-8"), character_id)
+        elif event_type == EventType.RESTORE:
+            self._apply_restore(decode_snapshot(payload))
+        elif event_type == EventType.START_GAME:
+            case_file_code, = START_GAME.unpack_from(payload)
+            mask_size = hand_mask_size(Card.count())
+            offset = START_GAME.size
+            hand_masks = []
+            for _ in range(len(table)):
+                hand_masks.append(int.from_bytes(payload[offset:offset + mask_size], "big"))
+                offset += mask_size
+            weapon_rooms = [room_id for room_id, in WEAPON_ROOM.iter_unpack(payload[offset:])]
+            self._apply_start_game(case_file_code, hand_masks, weapon_rooms)
+        else:
+            raise ValueError(f"Unknown event type {event_type}")
+
+    def _record(self, event_type: EventType, payload: bytes = b"") -> None:
+        log = self.event_log
+        if log is None:
+            return
+        log.append(event_type, payload)
+        if log.needs_snapshot():
+            log.add_snapshot(self.snapshot())
+
+    def _turn_flags(self) -> int:
+        turn = self.current_turn
+        if turn is None:
+            return NO_TURN
+        return ((TURN_ACTIVE if turn.isActive else 0)
+                | (TURN_MADE_ACCUSATION if turn.hasMadeAccusation else 0)
+                | (TURN_MADE_SUGGESTION if turn.hasMadeSuggestion else 0)
+                | (TURN_ENTERED_ROOM if turn.hasEnteredRoom else 0)
+                | (TURN_MOVED if turn.hasMoved else 0))
+
+    def _restore_turn(self, player: Player, flags: int) -> Player_Turn:
+        turn = Player_Turn(player, self)
+        turn.isActive = bool(flags & TURN_ACTIVE)
+        turn.hasMadeAccusation = bool(flags & TURN_MADE_ACCUSATION)
+        turn.hasMadeSuggestion = bool(flags & TURN_MADE_SUGGESTION)
+        turn.hasEnteredRoom = bool(flags & TURN_ENTERED_ROOM)
+        turn.hasMoved = bool(flags & TURN_MOVED)
+        return turn
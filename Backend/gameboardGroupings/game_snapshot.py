@@ -0,0 +1,127 @@
+import struct
+from enum import Enum, auto
+from typing import List, NamedTuple, Tuple
+
+# Bits of TurnState.flags
+TURN_ACTIVE = 1
+TURN_MADE_ACCUSATION = 2
+TURN_MADE_SUGGESTION = 4
+TURN_ENTERED_ROOM = 8
+TURN_MOVED = 16
+# TurnState.flags when no turn has started
+NO_TURN = -1
+
+NO_WINNER = -1
+
+# Binary encoding of a GameSnapshot: a fixed head of (version, game state,
+# player count, case file code, turn seat, is reversed, turn flags, winner),
+# then length-prefixed fields: the game id, the eight bytes fields in the
+# order encode_snapshot lists them, then each player's name and hand mask
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEAD = struct.Struct(">BBBih?bb")
+FIELD_LENGTH = struct.Struct(">H")
+_FIXED_FIELDS = 9
+
+
+class GameState(Enum):
+    WAITING_FOR_PLAYERS = auto()
+    INITIALIZING = auto()
+    IN_PROGRESS = auto()
+    GAME_OVER = auto()
+
+
+class GameSetup(NamedTuple):
+    """The parts of a game fixed once it starts: who is playing, as which
+    character, with which cards, and the case file. Column fields are the
+    raw bytes of the matching PlayerTable arrays."""
+    names: Tuple[str, ...]
+    player_ids: bytes
+    character_ids: bytes
+    hand_masks: Tuple[int, ...]
+    case_file_code: int
+    deck: bytes
+
+
+class TurnState(NamedTuple):
+    """The turn pointer: the current seat, direction of play, which seats are
+    still in the rotation, and the current turn's flags."""
+    seat: int
+    is_reversed: bool
+    in_rotation: bytes
+    flags: int
+
+
+class GameSnapshot(NamedTuple):
+    """
+    GameSnapshot: An immutable copy of a GameProcessor's state
+
+    Every field is an immutable value, so a snapshot is never copied again
+    once taken. The setup only changes when players join or the game starts,
+    so consecutive snapshots share one GameSetup; only the small per-move
+    fields are rebuilt each time.
+    """
+    game_id: str
+    state: GameState
+    setup: GameSetup
+    locations: bytes
+    prev_locations: bytes
+    eliminated: bytes
+    weapons: bytes
+    turn: TurnState
+    winner: int
+
+
+def encode_snapshot(snapshot: GameSnapshot) -> bytes:
+    """Returns a snapshot as bytes, e.g. to persist it next to a GameLog"""
+    setup, turn = snapshot.setup, snapshot.turn
+    fields: List[bytes] = [
+        snapshot.game_id.encode("utf-8"), setup.player_ids, setup.character_ids, setup.deck,
+        snapshot.locations, snapshot.prev_locations, snapshot.eliminated, snapshot.weapons, turn.in_rotation,
+    ]
+    fields.extend(name.encode("utf-8") for name in setup.names)
+    fields.extend(mask.to_bytes((mask.bit_length() + 7) // 8, "big") for mask in setup.hand_masks)
+    parts = [SNAPSHOT_HEAD.pack(SNAPSHOT_VERSION, snapshot.state.value, len(setup.names), setup.case_file_code,
+                                turn.seat, turn.is_reversed, turn.flags, snapshot.winner)]
+    for field in fields:
+        parts.append(FIELD_LENGTH.pack(len(field)))
+        parts.append(field)
+    return b"".join(parts)
+
+
+def decode_snapshot(data: bytes) -> GameSnapshot:
+    """Rebuilds a snapshot from bytes returned by encode_snapshot"""
+    if len(data) < SNAPSHOT_HEAD.size:
+        raise ValueError("Encoded snapshot is too short")
+    (version, state, player_count, case_file_code, seat, is_reversed, flags,
+     winner) = SNAPSHOT_HEAD.unpack_from(data)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version {version}")
+    view = memoryview(data)
+    offset = SNAPSHOT_HEAD.size
+    fields = []
+    for _ in range(_FIXED_FIELDS + 2 * player_count):
+        if offset + FIELD_LENGTH.size > len(view):
+            raise ValueError("Encoded snapshot is truncated")
+        length, = FIELD_LENGTH.unpack_from(view, offset)
+        offset += FIELD_LENGTH.size
+        if offset + length > len(view):
+            raise ValueError("Encoded snapshot is truncated")
+        fields.append(bytes(view[offset:offset + length]))
+        offset += length
+    if offset != len(view):
+        raise ValueError("Encoded snapshot has trailing data")
+    (game_id, player_ids, character_ids, deck, locations, prev_locations, eliminated, weapons,
+     in_rotation) = fields[:_FIXED_FIELDS]
+    names = tuple(name.decode("utf-8") for name in fields[_FIXED_FIELDS:_FIXED_FIELDS + player_count])
+    hand_masks = tuple(int.from_bytes(mask, "big") for mask in fields[_FIXED_FIELDS + player_count:])
+    return GameSnapshot(
+        game_id.decode("utf-8"),
+        GameState(state),
+        GameSetup(names, player_ids, character_ids, hand_masks, case_file_code, deck),
+        locations,
+        prev_locations,
+        eliminated,
+        weapons,
+        TurnState(seat, is_reversed, in_rotation, flags),
+        winner
+    )
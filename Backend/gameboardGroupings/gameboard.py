@@ -1,95 +1,282 @@
-from space import Room, Hallway, Space
-from typing import List
+from array import array
+from typing import Dict, List, Optional, Tuple
+from Backend.gameboardGroupings.board_topology import BoardTopology, NO_SPACE
+from Backend.gameboardGroupings.space import Room, CornerRoom, Hallway, Space, SpaceType
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.GameManagement.player import Player
+
+# Occupant masks are stored in 32-bit array entries
+MAX_PLACED_PLAYERS = 32
+
+_VIEW_CLASSES = {
+    SpaceType.ROOM: Room,
+    SpaceType.CornerRoom: CornerRoom,
+    SpaceType.HALLWAY: Hallway,
+}
+
+_classic_topology: Optional[BoardTopology] = None
+
+
+def classic_topology() -> BoardTopology:
+    """Returns the process-wide classic board topology, compiling the
+       default layout file on first use"""
+    global _classic_topology
+    if _classic_topology is None:
+        _classic_topology = BoardTopology.load()
+    return _classic_topology
+
 
 class GameBoard:
-    """Represents the class Clue gameboard."""
-    def __init__(self):
-        self.spaces: List[Space] = []
-        self.setup_gameboard()
-
-    def setup_gameboard(self):
-        """Creates the default Clue board layout with all rooms and connections"""
-        # Creates all room for the default Clue board layout
-        study_room = Room("Study")
-        hall_room = Room("Hall")
-        lounge_room = Room("Lounge")
-        library_room = Room("Library")
-        billiard_room = Room("Billiard Room")
-        dining_room = Room("Dining Room")
-        conservatory_room = Room("Conservatory")
-        ballroom_room = Room("Ballroom")
-        kitchen_room = Room("Kitchen")
-
-        # Creats hallways between rooms
-        # Horizontal hallways first (left to right)
-        study_hall = Hallway()
-        hall_lounge = Hallway()
-        library_billiard = Hallway()
-        billiard_dining = Hallway()
-        conservatory_ballroom = Hallway()
-        ballroom_kitchen = Hallway()
-
-        # Vertical hallways (top to bottom)
-        study_library = Hallway()
-        library_conservatory = Hallway()
-        hall_billiard = Hallway()
-        billiard_ballroom = Hallway()
-        lounge_dining = Hallway()
-        dining_kitchen = Hallway()
-
-        # Connect rooms with hallways
-        study_hall.add_adjacent_space(study_room)
-        study_hall.add_adjacent_space(hall_room)
-        
-        hall_lounge.add_adjacent_space(hall_room)
-        hall_lounge.add_adjacent_space(lounge_room)
-        
-        library_billiard.add_adjacent_space(library_room)
-        library_billiard.add_adjacent_space(billiard_room)
-        
-        billiard_dining.add_adjacent_space(billiard_room)
-        billiard_dining.add_adjacent_space(dining_room)
-        
-        conservatory_ballroom.add_adjacent_space(conservatory_room)
-        conservatory_ballroom.add_adjacent_space(ballroom_room)
-        
-        ballroom_kitchen.add_adjacent_space(ballroom_room)
-        ballroom_kitchen.add_adjacent_space(kitchen_room)
-        
-        study_library.add_adjacent_space(study_room)
-        study_library.add_adjacent_space(library_room)
-        
-        library_conservatory.add_adjacent_space(library_room)
-        library_conservatory.add_adjacent_space(conservatory_room)
-        
-        hall_billiard.add_adjacent_space(hall_room)
-        hall_billiard.add_adjacent_space(billiard_room)
-        
-        billiard_ballroom.add_adjacent_space(billiard_room)
-        billiard_ballroom.add_adjacent_space(ballroom_room)
-        
-        lounge_dining.add_adjacent_space(lounge_room)
-        lounge_dining.add_adjacent_space(dining_room)
-        
-        dining_kitchen.add_adjacent_space(dining_room)
-        dining_kitchen.add_adjacent_space(kitchen_room)
-
-        # Add secret passages between corner rooms
-        study_room.add_secret_passage(kitchen_room, create_bidirectional=True)  # Study <-> Kitchen
-        lounge_room.add_secret_passage(conservatory_room, create_bidirectional=True)  # Lounge <-> Conservatory
-
-        # store all spaces
-        self.spaces.extend([
-            study_room, hall_room, lounge_room,
-            library_room, billiard_room, dining_room,
-            conservatory_room, ballroom_room, kitchen_room,
-            study_hall, hall_lounge,
-            library_billiard, billiard_dining,
-            conservatory_ballroom, ballroom_kitchen,
-            study_library, library_conservatory,
-            hall_billiard, billiard_ballroom,
-            lounge_dining, dining_kitchen])
-        
+    """Represents the class Clue gameboard.
+
+    The layout is a BoardTopology shared by every game. A GameBoard only holds
+    this game's occupancy as small arrays: the space each placed player is in
+    and the room each weapon is in. Space objects are views over the two,
+    created on first use."""
+    def __init__(self, topology: Optional[BoardTopology] = None):
+        self.topology: BoardTopology = topology or classic_topology()
+
+        # Players in the order they were placed ("slots") and the space id of
+        # each, plus per-space bitmasks of the slots in that space and indexes
+        # from player id and character to slot, all kept in step by every move
+        self._players: List[Player] = []
+        self._player_spaces = array("h")
+        self._occupants = array("I", [0]) * self.topology.get_space_count()
+        self._slot_by_id: Dict[int, int] = {}
+        self._slot_by_character: Dict[str, int] = {}
+        # Bitmask over space ids of the spaces with anyone in them
+        self._occupied_spaces: int = 0
+
+        # Room id of each weapon, indexed by position in the weapon card ids,
+        # and per-space bitmasks of the weapon positions in that space
+        weapon_ids = Card.get_catalog().get_type_ids(CardType.WEAPON)
+        self._first_weapon_id: int = weapon_ids[0]
+        self._weapon_spaces = array("h", [NO_SPACE]) * len(weapon_ids)
+        self._room_weapons: List[int] = [0] * self.topology.get_space_count()
+
+        self._views: List[Optional[Space]] = [None] * self.topology.get_space_count()
+
+    @classmethod
+    def from_layout(cls, path) -> "GameBoard":
+        """Creates a board for the layout in a JSON data file"""
+        return cls(BoardTopology.load(path))
+
     def get_all_spaces(self) -> List[Space]:
         """Returns all sapces on the board"""
-        return self.spaces
\ No newline at end of file
+        return [self.get_space(space_id) for space_id in range(self.topology.get_space_count())]
+
+    def get_space_count(self) -> int:
+        """Returns the number of spaces on the board"""
+        return self.topology.get_space_count()
+
+    def get_space(self, space_id: int) -> Space:
+        """Returns the view of the space with the given id"""
+        view = self._views[space_id]
+        if view is None:
+            view = _VIEW_CLASSES[self.topology.get_space_type(space_id)](self, space_id)
+            self._views[space_id] = view
+        return view
+
+    def get_space_by_name(self, name: str) -> Optional[Space]:
+        """Returns the view of the space with the given name, or None"""
+        space_id = self.topology.get_space_id(name)
+        return None if space_id == NO_SPACE else self.get_space(space_id)
+
+    def get_starting_positions(self) -> Dict[str, Space]:
+        """Returns a mapping of character name to starting space"""
+        return {character: self.get_space(space_id)
+                for character, space_id in self.topology.get_starting_positions().items()}
+
+    def get_neighbor_ids(self, space_id: int, include_secret_passages: bool = True) -> array:
+        """Returns the ids of the spaces reachable in one move from space_id"""
+        return self.topology.get_neighbor_ids(space_id, include_secret_passages)
+
+    def get_secret_passage_ids(self, space_id: int) -> array:
+        """Returns the ids of the rooms reachable by secret passage from space_id"""
+        return self.topology.get_secret_passage_ids(space_id)
+
+    def distance(self, source_id: int, target_id: int) -> int:
+        """Returns the number of moves from source to target, or -1"""
+        return self.topology.distance(source_id, target_id)
+
+    def next_hop(self, source_id: int, target_id: int) -> int:
+        """Returns the first space on a shortest route from source to target, or -1"""
+        return self.topology.next_hop(source_id, target_id)
+
+    def get_path(self, source_id: int, target_id: int) -> List[int]:
+        """Returns the space ids on a shortest route from source to target"""
+        return self.topology.get_path(source_id, target_id)
+
+    def get_valid_move_ids(self, space_id: int, include_secret_passages: bool = True) -> Tuple[int, ...]:
+        """Returns the ids of the spaces a player in space_id may move to now"""
+        return self.topology.get_valid_move_ids(space_id, self._occupied_spaces, include_secret_passages)
+
+    def get_valid_moves(self, space_id: int, include_secret_passages: bool = True) -> List[Space]:
+        """Returns the spaces a player in space_id may move to now"""
+        return [self.get_space(target_id) for target_id in self.get_valid_move_ids(space_id, include_secret_passages)]
+
+    def is_valid_move(self, source_id: int, target_id: int) -> bool:
+        """Returns True if a player in source may move to target now"""
+        return target_id in self.get_valid_move_ids(source_id)
+
+    # Player occupancy
+
+    def add_player(self, player: Player, space_id: int) -> bool:
+        """Places a player in a space, taking them off any other space.
+           Returns False if the player is already there."""
+        slot = self._slot_by_id.get(player.playerID)
+        if slot is None:
+            slot = len(self._players)
+            if slot >= MAX_PLACED_PLAYERS:
+                raise ValueError("Too many players on the board")
+            self._players.append(player)
+            self._player_spaces.append(NO_SPACE)
+            self._slot_by_id[player.playerID] = slot
+            self._slot_by_character[player.character] = slot
+        current_space = self._player_spaces[slot]
+        if current_space == space_id:
+            return False
+        if current_space != NO_SPACE:
+            self._vacate(slot, current_space)
+        self._occupants[space_id] |= 1 << slot
+        self._occupied_spaces |= 1 << space_id
+        self._player_spaces[slot] = space_id
+        return True
+
+    def remove_player(self, player: Player) -> bool:
+        """Takes a player off the board. Returns False if they were not on it."""
+        slot = self._slot_by_id.get(player.playerID)
+        if slot is None or self._player_spaces[slot] == NO_SPACE:
+            return False
+        self._vacate(slot, self._player_spaces[slot])
+        self._player_spaces[slot] = NO_SPACE
+        return True
+
+    def clear_players(self):
+        """Takes every player off the board and forgets them"""
+        self._players = []
+        self._player_spaces = array("h")
+        self._occupants = array("I", [0]) * self.topology.get_space_count()
+        self._slot_by_id = {}
+        self._slot_by_character = {}
+        self._occupied_spaces = 0
+
+    def _vacate(self, slot: int, space_id: int):
+        self._occupants[space_id] &= ~(1 << slot)
+        if not self._occupants[space_id]:
+            self._occupied_spaces &= ~(1 << space_id)
+
+    def get_players(self, space_id: int) -> List[Player]:
+        """Returns the players in a space, in the order they were placed"""
+        players = []
+        mask = self._occupants[space_id]
+        while mask:
+            low_bit = mask & -mask
+            players.append(self._players[low_bit.bit_length() - 1])
+            mask ^= low_bit
+        return players
+
+    def get_player_count(self, space_id: int) -> int:
+        """Returns the number of players in a space"""
+        return self._occupants[space_id].bit_count()
+
+    def get_occupant_mask(self, space_id: int) -> int:
+        """Returns a bitmask of the placement slots of the players in a space"""
+        return self._occupants[space_id]
+
+    def get_player_by_id(self, player_id: int) -> Optional[Player]:
+        """Returns the placed player with the given id, or None"""
+        slot = self._slot_by_id.get(player_id)
+        return None if slot is None else self._players[slot]
+
+    def get_player_by_character(self, character: str) -> Optional[Player]:
+        """Returns the placed player playing the given character, or None"""
+        slot = self._slot_by_character.get(character)
+        return None if slot is None else self._players[slot]
+
+    def get_player_space_id(self, player_id: int) -> int:
+        """Returns the id of the space a player is in, or NO_SPACE"""
+        slot = self._slot_by_id.get(player_id)
+        return NO_SPACE if slot is None else self._player_spaces[slot]
+
+    def get_player_location(self, player_id: int) -> Optional[Space]:
+        """Returns the space a player is in, or None"""
+        space_id = self.get_player_space_id(player_id)
+        return None if space_id == NO_SPACE else self.get_space(space_id)
+
+    def get_player_index(self, player_id: int, space_id: int) -> int:
+        """Returns a player's index in get_players(space_id), or -1 if they
+           are not in that space"""
+        slot = self._slot_by_id.get(player_id)
+        if slot is None or self._player_spaces[slot] != space_id:
+            return -1
+        return (self._occupants[space_id] & ((1 << slot) - 1)).bit_count()
+
+    # Weapon occupancy
+
+    def add_weapon(self, weapon: Card, room_id: int):
+        """Places a weapon in a room, taking it out of any other room"""
+        index = weapon.get_id() - self._first_weapon_id
+        current_room = self._weapon_spaces[index]
+        if current_room != NO_SPACE:
+            self._room_weapons[current_room] &= ~(1 << index)
+        self._room_weapons[room_id] |= 1 << index
+        self._weapon_spaces[index] = room_id
+
+    def move_weapon(self, weapon: Card, room_id: int):
+        """Moves a weapon to a room, e.g. when it is named in a suggestion"""
+        self.add_weapon(weapon, room_id)
+
+    def remove_weapon(self, weapon: Card) -> bool:
+        """Takes a weapon off the board. Returns False if it was not on it."""
+        index = weapon.get_id() - self._first_weapon_id
+        current_room = self._weapon_spaces[index]
+        if current_room == NO_SPACE:
+            return False
+        self._room_weapons[current_room] &= ~(1 << index)
+        self._weapon_spaces[index] = NO_SPACE
+        return True
+
+    def get_weapon_room_id(self, weapon: Card) -> int:
+        """Returns the id of the room a weapon is in, or NO_SPACE"""
+        return self._weapon_spaces[weapon.get_id() - self._first_weapon_id]
+
+    def get_weapon_spaces(self) -> bytes:
+        """Returns the room id of every weapon, by position in the weapon
+           card ids, as the raw bytes of a signed 16-bit array"""
+        return self._weapon_spaces.tobytes()
+
+    def set_weapon_spaces(self, data: bytes):
+        """Places every weapon from bytes returned by get_weapon_spaces"""
+        weapon_spaces = array("h")
+        weapon_spaces.frombytes(data)
+        if len(weapon_spaces) != len(self._weapon_spaces):
+            raise ValueError("Weapon locations were saved for a different card catalog")
+        self._weapon_spaces = weapon_spaces
+        self._room_weapons = [0] * self.topology.get_space_count()
+        for index, room_id in enumerate(weapon_spaces):
+            if room_id != NO_SPACE:
+                self._room_weapons[room_id] |= 1 << index
+
+    def get_weapon_mask(self, room_id: int) -> int:
+        """Returns a bitmask of the weapons in a room, by position in the
+           weapon card ids"""
+        return self._room_weapons[room_id]
+
+    def get_weapons(self, room_id: int) -> List[Card]:
+        """Returns the weapons in a room, ordered by card id"""
+        weapons = []
+        mask = self._room_weapons[room_id]
+        while mask:
+            low_bit = mask & -mask
+            weapons.append(Card.from_id(self._first_weapon_id + low_bit.bit_length() - 1))
+            mask ^= low_bit
+        return weapons
+
+    def get_weapon_index(self, weapon: Card, room_id: int) -> int:
+        """Returns a weapon's index in get_weapons(room_id), or -1 if it is
+           not in that room"""
+        index = weapon.get_id() - self._first_weapon_id
+        if self._weapon_spaces[index] != room_id:
+            return -1
+        return (self._room_weapons[room_id] & ((1 << index) - 1)).bit_count()
@@ -0,0 +1,182 @@
+import json
+import pytest
+from Backend.gameboardGroupings.board_topology import BoardTopology, DEFAULT_LAYOUT, layout_digest
+from Backend.gameboardGroupings.gameboard import GameBoard, classic_topology
+from Backend.gameboardGroupings.space import SpaceType
+
+@pytest.fixture
+def layout():
+    """Fixture to read the classic layout data file."""
+    with open(DEFAULT_LAYOUT, encoding="utf-8") as layout_file:
+        return json.load(layout_file)
+
+@pytest.fixture
+def topology(layout):
+    """Fixture to compile the classic layout."""
+    return BoardTopology.from_dict(layout)
+
+def expected_neighbors(layout):
+    """Builds each space's hallway neighbors and secret passages by name,
+       straight from the layout data."""
+    hallways, passages = {}, {}
+    for room in layout["rooms"]:
+        hallways[room], passages[room] = set(), set()
+    for room_a, room_b in layout["hallways"]:
+        hallway = f"{room_a} - {room_b} Hallway"
+        hallways[hallway], passages[hallway] = {room_a, room_b}, set()
+        hallways[room_a].add(hallway)
+        hallways[room_b].add(hallway)
+    for room_a, room_b in layout["secret_passages"]:
+        passages[room_a].add(room_b)
+        passages[room_b].add(room_a)
+    return hallways, passages
+
+def names(topology, space_ids):
+    return {topology.get_name(space_id) for space_id in space_ids}
+
+def test_space_ids(topology, layout):
+    assert topology.get_room_count() == len(layout["rooms"])
+    assert topology.get_space_count() == len(layout["rooms"]) + len(layout["hallways"])
+    for space_id in range(topology.get_space_count()):
+        assert topology.get_space_id(topology.get_name(space_id)) == space_id
+    assert [topology.get_name(space_id) for space_id in range(topology.get_room_count())] == layout["rooms"]
+
+def test_neighbors_match_layout(topology, layout):
+    hallways, passages = expected_neighbors(layout)
+    for space_id in range(topology.get_space_count()):
+        name = topology.get_name(space_id)
+        assert names(topology, topology.get_neighbor_ids(space_id, include_secret_passages=False)) == hallways[name]
+        assert names(topology, topology.get_secret_passage_ids(space_id)) == passages[name]
+        assert names(topology, topology.get_neighbor_ids(space_id)) == hallways[name] | passages[name]
+
+def test_csr_arrays(topology):
+    offsets, targets, passage_starts = topology.get_adjacency()
+    count = topology.get_space_count()
+    assert len(offsets) == count + 1 and len(passage_starts) == count
+    assert offsets[0] == 0 and offsets[-1] == len(targets)
+    for space_id in range(count):
+        assert offsets[space_id] <= passage_starts[space_id] <= offsets[space_id + 1]
+        # Hallway connections come before secret passages
+        assert list(topology.get_neighbor_ids(space_id)) == (
+            list(topology.get_neighbor_ids(space_id, include_secret_passages=False))
+            + list(topology.get_secret_passage_ids(space_id)))
+
+def test_topology_is_immutable(topology):
+    with pytest.raises(AttributeError):
+        topology._names = ()
+
+def bfs_distances(topology, source):
+    """Breadth-first search over get_neighbor_ids, independent of the
+       precomputed tables."""
+    distances = {source: 0}
+    frontier = [source]
+    while frontier:
+        next_frontier = []
+        for space_id in frontier:
+            for neighbor in topology.get_neighbor_ids(space_id):
+                if neighbor not in distances:
+                    distances[neighbor] = distances[space_id] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+def test_distances_match_bfs(topology):
+    count = topology.get_space_count()
+    for source in range(count):
+        distances = bfs_distances(topology, source)
+        for target in range(count):
+            assert topology.distance(source, target) == distances.get(target, -1)
+
+def test_next_hops_follow_shortest_paths(topology):
+    count = topology.get_space_count()
+    for source in range(count):
+        assert topology.next_hop(source, source) == -1
+        assert topology.get_path(source, source) == []
+        for target in range(count):
+            if target == source:
+                continue
+            hop = topology.next_hop(source, target)
+            assert hop in topology.get_neighbor_ids(source)
+            assert topology.distance(hop, target) == topology.distance(source, target) - 1
+            path = topology.get_path(source, target)
+            assert len(path) == topology.distance(source, target) and path[-1] == target
+            for space_id, next_id in zip([source] + path, path):
+                assert next_id in topology.get_neighbor_ids(space_id)
+
+def test_secret_passages_shorten_routes(topology):
+    study, kitchen = topology.get_space_id("Study"), topology.get_space_id("Kitchen")
+    assert topology.distance(study, kitchen) == 1
+    assert topology.get_path(study, kitchen) == [kitchen]
+
+def test_unreachable_spaces():
+    topology = BoardTopology(["Attic", "Cellar", "Garden"], [("Attic", "Cellar")], [], {})
+    attic, garden = topology.get_space_id("Attic"), topology.get_space_id("Garden")
+    assert topology.distance(attic, garden) == -1
+    assert topology.next_hop(attic, garden) == -1
+    assert topology.get_path(attic, garden) == []
+    assert topology.distance(attic, topology.get_space_id("Cellar")) == 2
+
+def uncached_moves(topology, space_id, occupied_mask, include_secret_passages):
+    """Legal destinations worked out from scratch: every neighbor except
+       occupied hallways."""
+    return tuple(neighbor for neighbor in topology.get_neighbor_ids(space_id, include_secret_passages)
+                 if not (occupied_mask >> neighbor & 1 and topology.get_space_type(neighbor) == SpaceType.HALLWAY))
+
+def test_cached_moves_match_uncached_for_every_occupancy(layout):
+    topology = BoardTopology(layout["rooms"], layout["hallways"], layout["secret_passages"], {})
+    # Rooms are always occupied here, which must never block a move
+    rooms_mask = (1 << topology.get_room_count()) - 1
+    for _ in range(2):
+        for space_id in range(topology.get_space_count()):
+            hallway_mask = topology.get_hallway_neighbor_mask(space_id)
+            hallway_bits = [1 << bit for bit in range(hallway_mask.bit_length()) if hallway_mask >> bit & 1]
+            for pattern in range(1 << len(hallway_bits)):
+                occupied = sum(bit for index, bit in enumerate(hallway_bits) if pattern >> index & 1)
+                for include_secret_passages in (True, False):
+                    for extra in (0, rooms_mask, ~hallway_mask & ((1 << topology.get_space_count()) - 1)):
+                        expected = uncached_moves(topology, space_id, occupied | extra, include_secret_passages)
+                        assert topology.get_valid_move_ids(space_id, occupied | extra,
+                                                           include_secret_passages) == expected
+    # The second pass, and every extra occupancy outside the neighboring
+    # hallways, is served from the cache
+    info = topology.get_move_cache_info()
+    assert info.misses == info.currsize
+    assert info.hits == 5 * info.misses
+
+def test_hallway_neighbor_masks(topology):
+    for space_id in range(topology.get_space_count()):
+        mask = topology.get_hallway_neighbor_mask(space_id)
+        assert {bit for bit in range(topology.get_space_count()) if mask >> bit & 1} == {
+            neighbor for neighbor in topology.get_neighbor_ids(space_id)
+            if topology.get_space_type(neighbor) == SpaceType.HALLWAY}
+
+def test_load_compiles_the_classic_layout(topology, layout):
+    assert BoardTopology.load() is topology
+    assert classic_topology() is topology
+    assert topology.get_layout_name() == layout["name"]
+    assert {character: topology.get_name(space_id)
+            for character, space_id in topology.get_starting_positions().items()} == {
+        character: f"{room_a} - {room_b} Hallway" for character, (room_a, room_b) in layout["starting_positions"].items()}
+
+def test_layouts_are_cached_by_content(layout, tmp_path):
+    reordered = dict(reversed(list(layout.items())))
+    assert layout_digest(reordered) == layout_digest(layout)
+    assert BoardTopology.from_dict(reordered) is BoardTopology.from_dict(layout)
+    path = tmp_path / "classic_copy.json"
+    path.write_text(json.dumps(layout, indent=2), encoding="utf-8")
+    assert GameBoard.from_layout(path).topology is BoardTopology.from_dict(layout)
+
+def test_different_layouts_compile_separately(layout):
+    smaller = dict(layout, hallways=layout["hallways"][:-1])
+    assert layout_digest(smaller) != layout_digest(layout)
+    topology = BoardTopology.from_dict(smaller)
+    assert topology is not BoardTopology.from_dict(layout)
+    assert topology.get_space_count() == BoardTopology.from_dict(layout).get_space_count() - 1
+
+def test_invalid_layouts_are_rejected(layout):
+    with pytest.raises(ValueError, match="unique"):
+        BoardTopology.from_dict(dict(layout, rooms=layout["rooms"] + ["Study"]))
+    with pytest.raises(ValueError, match="Unknown room"):
+        BoardTopology.from_dict(dict(layout, hallways=layout["hallways"] + [["Study", "Attic"]]))
+    with pytest.raises(ValueError, match="No hallway"):
+        BoardTopology.from_dict(dict(layout, starting_positions={"Miss Scarlet": ["Study", "Kitchen"]}))
@@ -0,0 +1,134 @@
+import random
+import pytest
+from Backend.cardGroupings.Card import Card
+from Backend.GameManagement.player_turn import TurnAction
+from Backend.gameboardGroupings.game_log import GameLog, EventType
+from Backend.gameboardGroupings.game_processor import GameProcessor, GameState
+from Backend.gameboardGroupings.game_snapshot import encode_snapshot, decode_snapshot
+
+def new_game(snapshot_interval=8, players=4):
+    game = GameProcessor()
+    game.event_log = GameLog(game.game_id, snapshot_interval)
+    for index in range(players):
+        game.add_player(f"Player {index}")
+    return game
+
+def play(game, rng, actions):
+    """Plays random valid actions, as the players would."""
+    for _ in range(actions):
+        if game.state == GameState.GAME_OVER:
+            return
+        turn = game.current_turn
+        valid_actions = turn.get_valid_actions()
+        roll = rng.random()
+        if roll < 0.4 and TurnAction.MOVE in valid_actions and turn.p.get_valid_moves():
+            turn.take_action(TurnAction.MOVE, rng.choice(turn.p.get_valid_moves()))
+        elif roll < 0.6 and TurnAction.SUGGESTION in valid_actions:
+            turn.take_action(TurnAction.SUGGESTION, rng.choice(Card.VALID_SUSPECTS), rng.choice(Card.VALID_WEAPONS),
+                             turn.p.currLocation.get_name())
+        elif roll < 0.62 and TurnAction.ACCUSATION in valid_actions:
+            turn.take_action(TurnAction.ACCUSATION, rng.choice(Card.VALID_SUSPECTS), rng.choice(Card.VALID_WEAPONS),
+                             rng.choice(Card.VALID_ROOMS))
+        else:
+            game.end_turn()
+
+def test_turns_start_active():
+    game = new_game()
+    game.start_game()
+    assert game.current_turn.isActive
+    game.end_turn()
+    assert game.current_turn.isActive
+    recovered = GameProcessor.from_log(game.event_log)
+    assert recovered.current_turn.isActive
+    assert recovered.snapshot() == game.snapshot()
+
+def test_log_keeps_only_the_latest_snapshot():
+    game = new_game(snapshot_interval=4)
+    game.start_game()
+    play(game, random.Random(1), 40)
+    covered, snapshot = game.event_log.latest_snapshot()
+    assert covered == len(game.event_log) - len(game.event_log) % 4
+    assert GameLog("empty").latest_snapshot() == (0, None)
+
+@pytest.mark.parametrize("seed", range(20))
+def test_recovery_after_undo_matches_the_live_game(seed):
+    rng = random.Random(seed)
+    game = new_game(snapshot_interval=rng.choice((4, 8, 64)))
+    game.start_game()
+    play(game, rng, rng.randrange(5, 30))
+    saved = game.snapshot()
+    play(game, rng, rng.randrange(5, 30))
+    # Undo back to the saved state, then play on
+    game.restore(saved)
+    play(game, rng, rng.randrange(5, 30))
+    log = game.event_log
+    assert GameProcessor.from_log(log).snapshot() == game.snapshot()
+    full_replay = GameProcessor(log.game_id)
+    full_replay.replay(log.events())
+    assert full_replay.snapshot() == game.snapshot()
+
+def test_restore_is_logged():
+    game = new_game()
+    game.start_game()
+    saved = game.snapshot()
+    game.end_turn()
+    game.restore(saved)
+    event_type, payload = list(game.event_log.events())[-1]
+    assert event_type == EventType.RESTORE
+    assert decode_snapshot(payload) == saved
+
+def test_oversized_name_changes_nothing():
+    game = new_game(players=2)
+    before, events = game.snapshot(), len(game.event_log)
+    for name in ("x" * 70000, "\u00e9" * (GameProcessor.MAX_NAME_BYTES // 2 + 1)):
+        with pytest.raises(ValueError):
+            game.add_player(name)
+    assert game.snapshot() == before and len(game.event_log) == events
+    game.add_player("x" * GameProcessor.MAX_NAME_BYTES)
+    assert GameProcessor.from_bytes(game.to_bytes()).snapshot() == game.snapshot()
+    log = GameLog("game")
+    with pytest.raises(ValueError):
+        log.append(EventType.ADD_PLAYER, bytes(70000))
+    assert len(log) == 0 and log.to_bytes() == GameLog("game").to_bytes()
+
+def test_snapshot_encoding_round_trip():
+    game = new_game()
+    assert decode_snapshot(encode_snapshot(game.snapshot())) == game.snapshot()
+    game.start_game()
+    play(game, random.Random(2), 30)
+    snapshot = game.snapshot()
+    encoded = encode_snapshot(snapshot)
+    assert decode_snapshot(encoded) == snapshot
+    with pytest.raises(ValueError):
+        decode_snapshot(encoded[:-1])
+    with pytest.raises(ValueError):
+        decode_snapshot(encoded + b"\0")
+    with pytest.raises(ValueError):
+        decode_snapshot(b"\xff" + encoded[1:])
+
+def test_log_bytes_round_trip_with_appended_tails():
+    game = new_game(snapshot_interval=8)
+    game.start_game()
+    rng = random.Random(3)
+    play(game, rng, 20)
+    stored = game.event_log.to_bytes()
+    written = len(game.event_log)
+    play(game, rng, 20)
+    # A store appends each tail rather than rewriting the log
+    stored += game.event_log.events_since(written)
+    log = GameLog.from_bytes(stored)
+    assert log.game_id == game.game_id and len(log) == len(game.event_log)
+    assert list(log.events()) == list(game.event_log.events())
+    assert GameProcessor.from_log(log).snapshot() == game.snapshot()
+
+def test_log_from_bytes_drops_a_torn_event():
+    game = new_game()
+    game.start_game()
+    game.end_turn()
+    stored = game.event_log.to_bytes()
+    log = GameLog.from_bytes(stored[:-1])
+    assert len(log) == len(game.event_log) - 1
+    with pytest.raises(ValueError):
+        GameLog.from_bytes(stored[:5])
+    with pytest.raises(ValueError):
+        game.event_log.extend(game.event_log.events_since(0)[:-1])
@@ -0,0 +1,85 @@
+import pytest
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.GameManagement.player_turn import TurnAction
+from Backend.gameboardGroupings.game_processor import GameProcessor, GameState
+
+@pytest.fixture
+def game():
+    """Fixture to create a started game with three players."""
+    game = GameProcessor()
+    for name in ("Ann", "Bob", "Cy"):
+        game.add_player(name)
+    game.start_game()
+    return game
+
+def enter_room(game):
+    """Moves the current player from their starting hallway into a room and
+       returns the room."""
+    turn = game.current_turn
+    room_count = game.game_board.topology.get_room_count()
+    room = next(space for space in turn.p.get_valid_moves() if space.get_space_id() < room_count)
+    assert turn.take_action(TurnAction.MOVE, room)
+    return room
+
+def test_suggestion_moves_the_weapon_and_suspect(game):
+    room = enter_room(game)
+    suggester = game.current_turn.p
+    suspect = next(player for player in game.players if player is not suggester)
+    weapon = Card.VALID_WEAPONS[0]
+    game.current_turn.take_action(TurnAction.SUGGESTION, suspect.character, weapon, room.get_name())
+    assert game.get_weapon_location(weapon) == room
+    assert Card(weapon, CardType.WEAPON) in room.get_weapons()
+    assert game.get_player_location(suspect) == room
+    assert suspect.currLocation == room
+    assert game.current_turn.p is suggester and game.current_turn.hasMadeSuggestion
+
+def test_suggestion_needs_a_room(game):
+    enter_room(game)
+    with pytest.raises(ValueError):
+        game.current_turn.take_action(TurnAction.SUGGESTION, Card.VALID_SUSPECTS[0], Card.VALID_WEAPONS[0],
+                                      "Study - Hall Hallway")
+
+def test_suggestion_names_the_suggesters_room(game):
+    room = enter_room(game)
+    other_room = next(name for name in Card.VALID_ROOMS if name != room.get_name())
+    with pytest.raises(ValueError):
+        game.current_turn.take_action(TurnAction.SUGGESTION, Card.VALID_SUSPECTS[0], Card.VALID_WEAPONS[0],
+                                      other_room)
+    assert not game.current_turn.hasMadeSuggestion
+    assert game.get_player_location(game.current_turn.p) == room
+
+def test_start_game(game):
+    assert game.state == GameState.IN_PROGRESS
+    assert game.current_turn.p is game.players[0]
+    suspect, weapon, room = Card.get_catalog().unpack_solution(game.case_file_code)
+    assert (suspect.get_card_type(), weapon.get_card_type(), room.get_card_type()) == (
+        CardType.SUSPECT, CardType.WEAPON, CardType.ROOM)
+    assert sorted(game.case_file.get_hand(), key=Card.get_id) == [suspect, weapon, room]
+    # Every other card is dealt to exactly one player
+    hands = [player.playerHand.get_mask() for player in game.players]
+    assert sum(bin(mask).count("1") for mask in hands) == Card.count() - 3
+    assert sum(hands) | game.case_file.get_mask() == (1 << Card.count()) - 1
+    assert sum(len(game.game_board.get_weapons(room_id))
+               for room_id in range(game.game_board.topology.get_room_count())) == len(Card.VALID_WEAPONS)
+
+def test_start_game_needs_three_players():
+    game = GameProcessor()
+    game.add_player("Ann")
+    game.add_player("Bob")
+    with pytest.raises(ValueError):
+        game.start_game()
+
+def test_wrong_accusation_eliminates_once(game):
+    accuser = game.current_turn.p
+    suspect, weapon, room = Card.get_catalog().unpack_solution(game.case_file_code)
+    wrong_room = next(name for name in Card.VALID_ROOMS if name != room.get_name())
+    assert not game.current_turn.take_action(TurnAction.ACCUSATION, suspect.get_name(), weapon.get_name(), wrong_room)
+    assert accuser.isEliminated
+    assert game.player_table.active_count() == 2
+    assert accuser not in game.turn_order
+
+def test_right_accusation_wins(game):
+    accuser = game.current_turn.p
+    cards = Card.get_catalog().unpack_solution(game.case_file_code)
+    assert game.current_turn.take_action(TurnAction.ACCUSATION, *(card.get_name() for card in cards))
+    assert game.winner is accuser and game.state == GameState.GAME_OVER
@@ -0,0 +1,108 @@
+import pickle
+import pytest
+from Backend.cardGroupings.Card import Card
+from Backend.GameManagement.player_turn import TurnAction
+from Backend.gameboardGroupings.game_processor import GameProcessor, GameState
+from Backend.gameboardGroupings.game_snapshot import NO_TURN, NO_WINNER
+
+@pytest.fixture
+def game():
+    """Fixture to create a started game with three players."""
+    game = GameProcessor()
+    for name in ("Ann", "Bob", "Cy"):
+        game.add_player(name)
+    game.start_game()
+    return game
+
+def play_a_turn(game):
+    """Moves the current player somewhere and ends their turn."""
+    turn = game.current_turn
+    turn.take_action(TurnAction.MOVE, turn.p.get_valid_moves()[0])
+    game.end_turn()
+
+def test_snapshot_before_the_game_starts():
+    game = GameProcessor()
+    game.add_player("Ann")
+    snapshot = game.snapshot()
+    assert snapshot.state == GameState.WAITING_FOR_PLAYERS
+    assert snapshot.turn.flags == NO_TURN and snapshot.winner == NO_WINNER
+    restored = GameProcessor.from_snapshot(snapshot)
+    assert restored.snapshot() == snapshot
+    assert restored.current_turn is None
+    restored.add_player("Bob")
+    restored.add_player("Cy")
+    assert restored.start_game()
+
+def test_snapshots_share_their_setup(game):
+    first = game.snapshot()
+    play_a_turn(game)
+    second = game.snapshot()
+    assert second.setup is first.setup
+    assert second.locations != first.locations
+
+def test_restore_returns_to_the_snapshot(game):
+    play_a_turn(game)
+    snapshot = game.snapshot()
+    players = game.players
+    hands = [player.playerHand for player in players]
+    locations = [player.currLocation for player in players]
+    for _ in range(2):
+        play_a_turn(game)
+    game.move_weapon(Card.VALID_WEAPONS[0], game.game_board.get_space(0))
+    game.restore(snapshot)
+    assert game.snapshot() == snapshot
+    # Player objects stay valid and read the restored rows
+    assert game.players == players
+    assert [player.playerHand for player in players] == hands
+    assert [player.currLocation for player in players] == locations
+    assert [game.game_board.get_player_location(player.playerID) for player in players] == locations
+    assert game.current_turn.p is game.turn_order.get_current_turn()
+
+def test_from_snapshot_builds_an_equal_game(game):
+    play_a_turn(game)
+    game.current_turn.take_action(TurnAction.MOVE, game.current_turn.p.get_valid_moves()[0])
+    snapshot = game.snapshot()
+    copy = GameProcessor.from_snapshot(snapshot)
+    assert copy.game_id == game.game_id
+    assert copy.snapshot() == snapshot
+    assert copy.case_file == game.case_file
+    assert copy.current_turn.hasMoved and copy.current_turn.isActive
+    assert copy.current_turn.get_valid_actions() == game.current_turn.get_valid_actions()
+    # Both copies go on to play the same way
+    copy.end_turn()
+    game.end_turn()
+    assert copy.snapshot() == game.snapshot()
+    # The copy's log starts from the snapshot rather than a logged restore
+    assert len(copy.event_log) == 1
+    assert GameProcessor.from_bytes(copy.to_bytes()).snapshot() == copy.snapshot()
+
+def test_look_ahead_on_an_unlogged_copy(game):
+    play_a_turn(game)
+    snapshot = game.snapshot()
+    stored = game.event_log.to_bytes()
+    scratch = GameProcessor.from_snapshot(snapshot, logged=False)
+    assert scratch.event_log is None
+    for _ in range(100):
+        play_a_turn(scratch)
+        scratch.restore(snapshot)
+    assert scratch.snapshot() == snapshot
+    assert game.event_log.to_bytes() == stored
+
+def test_restore_after_game_over(game):
+    solution = [card.get_name() for card in Card.get_catalog().unpack_solution(game.case_file_code)]
+    wrong_room = next(name for name in Card.VALID_ROOMS if name != solution[2])
+    eliminated = game.current_turn.p
+    game.current_turn.take_action(TurnAction.ACCUSATION, solution[0], solution[1], wrong_room)
+    game.end_turn()
+    winner = game.current_turn.p
+    game.current_turn.take_action(TurnAction.ACCUSATION, *solution)
+    copy = GameProcessor.from_snapshot(game.snapshot())
+    assert copy.state == GameState.GAME_OVER
+    assert copy.winner.get_row() == winner.get_row()
+    assert copy.players[eliminated.get_row()].isEliminated
+    assert copy.players[eliminated.get_row()] not in copy.turn_order
+
+def test_snapshots_pickle(game):
+    play_a_turn(game)
+    snapshot = game.snapshot()
+    assert pickle.loads(pickle.dumps(snapshot)) == snapshot
@@ -0,0 +1,166 @@
+import pytest
+from Backend.cardGroupings.Card import Card, CardType
+from Backend.GameManagement.player import PlayerTable
+from Backend.gameboardGroupings.gameboard import GameBoard, classic_topology
+from Backend.gameboardGroupings.board_topology import BoardTopology, NO_SPACE
+from Backend.gameboardGroupings.space import Room, CornerRoom, Hallway, SpaceType
+
+@pytest.fixture
+def board():
+    """Fixture to create an empty classic GameBoard for testing."""
+    return GameBoard()
+
+@pytest.fixture
+def players(board):
+    """Fixture to create three players, each playing a different suspect."""
+    table = PlayerTable(board)
+    players = []
+    for name, character in zip(("Ann", "Bob", "Cy"), Card.VALID_SUSPECTS):
+        player = table.add_player(name)
+        player.character = character
+        players.append(player)
+    return players
+
+def test_boards_share_the_classic_topology(board):
+    assert board.topology is classic_topology()
+    assert GameBoard().topology is board.topology
+    assert board.get_space_count() == 21
+
+def test_space_views_are_cached_and_typed(board):
+    spaces = board.get_all_spaces()
+    assert [space.get_space_id() for space in spaces] == list(range(board.get_space_count()))
+    assert all(board.get_space(space.get_space_id()) is space for space in spaces)
+    study = board.get_space_by_name("Study")
+    assert type(study) is CornerRoom and study.get_space_type() == SpaceType.CornerRoom
+    assert type(board.get_space_by_name("Hall")) is Room
+    hallway = board.get_space_by_name("Study - Hall Hallway")
+    assert type(hallway) is Hallway and hallway.get_space_type() == SpaceType.HALLWAY
+    assert board.get_space_by_name("Attic") is None
+    assert study.get_board() is board
+    assert repr(study) == "CornerRoom('Study')"
+
+def test_space_adjacency(board):
+    study = board.get_space_by_name("Study")
+    assert {space.get_name() for space in study.get_adjacent_spaces()} == {
+        "Study - Hall Hallway", "Study - Library Hallway"}
+    assert study.has_secret_passage()
+    assert [space.get_name() for space in study.get_secret_passages()] == ["Kitchen"]
+    hallway = board.get_space_by_name("Study - Hall Hallway")
+    assert {space.get_name() for space in hallway.get_adjacent_spaces()} == {"Study", "Hall"}
+
+def test_space_equality_and_hash(board):
+    other_board = GameBoard()
+    study, hall = board.get_space_by_name("Study"), board.get_space_by_name("Hall")
+    other_study = other_board.get_space_by_name("Study")
+    assert study == other_study and hash(study) == hash(other_study)
+    assert study != hall
+    assert study != "Study"
+    assert len({study, other_study, hall}) == 2
+    tiny = GameBoard(BoardTopology.from_dict({"rooms": ["Study", "Hall"], "hallways": [["Study", "Hall"]]}))
+    assert tiny.get_space(0) != study
+
+def test_players_start_off_the_board(board, players):
+    for player in players:
+        assert board.get_player_space_id(player.playerID) == NO_SPACE
+        assert board.get_player_location(player.playerID) is None
+    assert board.get_players(0) == []
+
+def test_add_player_updates_occupancy(board, players):
+    ann, bob, _ = players
+    hall = board.get_space_by_name("Hall")
+    assert hall.add_player(ann)
+    assert not hall.add_player(ann)
+    assert hall.add_player(bob)
+    assert hall.get_players() == [ann, bob]
+    assert hall.get_player_count() == 2
+    assert board.get_occupant_mask(hall.get_space_id()) == 0b11
+    assert hall.is_player_in_room(ann.playerID)
+    assert hall.get_player_index(bob.playerID) == 1
+    assert board.get_player_by_character(bob.character) is bob
+    assert hall.get_player_by_character(bob.character) is bob
+    assert board.get_player_location(ann.playerID) == hall
+
+def test_moving_a_player_vacates_their_old_space(board, players):
+    ann, bob, _ = players
+    hall, lounge = board.get_space_by_name("Hall"), board.get_space_by_name("Lounge")
+    hall.add_player(ann)
+    hall.add_player(bob)
+    lounge.add_player(ann)
+    assert hall.get_players() == [bob]
+    assert hall.get_player_index(bob.playerID) == 0
+    assert hall.get_player_index(ann.playerID) == -1
+    assert lounge.get_players() == [ann]
+    assert hall.get_player_by_id(ann.playerID) is None
+
+def test_remove_and_clear_players(board, players):
+    ann, bob, cy = players
+    hall = board.get_space_by_name("Hall")
+    for player in players:
+        hall.add_player(player)
+    assert hall.remove_player(bob.playerID) is bob
+    assert hall.remove_player(bob.playerID) is None
+    assert not board.remove_player(bob)
+    assert hall.get_players() == [ann, cy]
+    hall.clear_players()
+    assert hall.get_player_count() == 0
+    assert board.get_player_space_id(ann.playerID) == NO_SPACE
+
+def test_hallway_holds_one_player(board, players):
+    ann, bob, _ = players
+    hallway = board.get_space_by_name("Study - Hall Hallway")
+    assert hallway.is_empty()
+    assert hallway.add_player(ann)
+    assert not hallway.add_player(bob)
+    assert hallway.get_players() == [ann]
+
+def test_occupied_hallways_are_not_valid_moves(board, players):
+    ann, bob, _ = players
+    study = board.get_space_by_name("Study")
+    hallway = board.get_space_by_name("Study - Hall Hallway")
+    study.add_player(ann)
+    assert hallway in study.get_valid_moves()
+    hallway.add_player(bob)
+    assert hallway not in study.get_valid_moves()
+    assert not board.is_valid_move(study.get_space_id(), hallway.get_space_id())
+    assert board.get_space_by_name("Kitchen") in study.get_valid_moves()
+
+def test_room_weapons(board):
+    hall, lounge = board.get_space_by_name("Hall"), board.get_space_by_name("Lounge")
+    rope, dagger = Card("Rope", CardType.WEAPON), Card("Dagger", CardType.WEAPON)
+    hall.add_weapon(dagger)
+    hall.add_weapon(rope)
+    assert hall.get_weapons() == sorted([rope, dagger], key=Card.get_id)
+    assert hall.has_weapon("Rope") and not lounge.has_weapon("Rope")
+    assert hall.get_weapon_index("Rope") == hall.get_weapons().index(rope)
+    lounge.add_weapon(rope)
+    assert hall.get_weapons() == [dagger] and lounge.get_weapons() == [rope]
+    assert lounge.remove_weapon("Dagger") is None
+    assert lounge.remove_weapon("Rope") is rope
+    assert board.get_weapon_room_id(rope) == NO_SPACE
+    with pytest.raises(ValueError):
+        hall.add_weapon(Card("Hall", CardType.ROOM))
+
+def test_weapon_index_masks(board):
+    hall = board.get_space_by_name("Hall")
+    weapons = [Card(name, CardType.WEAPON) for name in Card.VALID_WEAPONS]
+    for weapon in weapons[::2]:
+        board.add_weapon(weapon, hall.get_space_id())
+    assert board.get_weapon_mask(hall.get_space_id()) == 0b10101
+    assert hall.get_weapons() == weapons[::2]
+    for index, weapon in enumerate(weapons[::2]):
+        assert board.get_weapon_index(weapon, hall.get_space_id()) == index
+    assert board.get_weapon_index(weapons[1], hall.get_space_id()) == -1
+    board.move_weapon(weapons[2], 0)
+    assert board.get_weapon_mask(hall.get_space_id()) == 0b10001
+    assert board.get_weapon_mask(0) == 0b100
+
+def test_weapon_spaces_round_trip(board):
+    for index, name in enumerate(Card.VALID_WEAPONS):
+        board.add_weapon(Card(name, CardType.WEAPON), index % 3)
+    other = GameBoard()
+    other.set_weapon_spaces(board.get_weapon_spaces())
+    for room_id in range(board.topology.get_room_count()):
+        assert other.get_weapons(room_id) == board.get_weapons(room_id)
+        assert other.get_weapon_mask(room_id) == board.get_weapon_mask(room_id)
+    with pytest.raises(ValueError):
+        other.set_weapon_spaces(board.get_weapon_spaces()[:-2])
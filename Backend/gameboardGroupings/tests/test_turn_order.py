@@ -0,0 +1,106 @@
+import random
+import pytest
+from Backend.GameManagement.player import PlayerTable
+from Backend.gameboardGroupings.turn_order import TurnOrder, NO_SEAT
+
+@pytest.fixture
+def players():
+    """Fixture to create five players seated in order."""
+    table = PlayerTable()
+    return [table.add_player(name) for name in ("Ann", "Bob", "Cy", "Dee", "Eve")]
+
+@pytest.fixture
+def order(players):
+    """Fixture to create a turn order of the five players."""
+    return TurnOrder(players)
+
+def turns(order, count):
+    return [order.advance_turn() for _ in range(count)]
+
+def test_new_order(order, players):
+    assert len(order) == 5
+    assert order.get_current_turn() is players[0]
+    assert order.get_turn_order() == players
+    assert [order.get_seat(player.playerID) for player in players] == [0, 1, 2, 3, 4]
+    assert order.get_seat(99) == NO_SEAT
+    assert all(player in order for player in players)
+    assert TurnOrder().get_current_turn() is None
+    assert TurnOrder().advance_turn() is None
+
+def test_advance_wraps_around(order, players):
+    assert turns(order, 7) == players[1:] + players[:3]
+
+def test_eliminated_players_are_skipped(order, players):
+    assert order.remove_player(players[2].playerID)
+    assert not order.remove_player(players[2].playerID)
+    assert players[2] not in order and len(order) == 4
+    assert turns(order, 5) == [players[1], players[3], players[4], players[0], players[1]]
+
+def test_eliminate_current_player_mid_turn(order, players):
+    order.advance_turn()
+    assert order.remove_player(players[1].playerID)
+    # The turn stays with them until it ends, then moves on from their seat
+    assert order.get_current_turn() is players[1]
+    assert order.get_turn_order() == [players[2], players[3], players[4], players[0]]
+    assert order.advance_turn() is players[2]
+
+def test_eliminate_neighbors_in_any_order(order, players):
+    order.remove_player(players[2].playerID)
+    order.remove_player(players[1].playerID)
+    order.remove_player(players[0].playerID)
+    assert turns(order, 3) == [players[3], players[4], players[3]]
+
+def test_last_player_out(players):
+    order = TurnOrder(players[:2])
+    order.remove_player(players[0].playerID)
+    order.remove_player(players[1].playerID)
+    assert len(order) == 0
+    assert order.advance_turn() is None
+    assert order.get_turn_order() == []
+
+def test_reverse(order, players):
+    order.advance_turn()
+    order.reverse_turn_order()
+    assert turns(order, 3) == [players[0], players[4], players[3]]
+    order.remove_player(players[2].playerID)
+    assert order.advance_turn() is players[1]
+    order.reverse_turn_order()
+    assert turns(order, 2) == [players[3], players[4]]
+
+def test_seats_after(order, players):
+    assert list(order.seats_after(3)) == [4, 0, 1, 2]
+    order.remove_player(players[0].playerID)
+    assert list(order.seats_after(3)) == [4, 1, 2]
+    # From a removed seat, every remaining seat follows it
+    assert list(order.seats_after(0)) == [1, 2, 3, 4]
+    order.reverse_turn_order()
+    assert list(order.seats_after(3)) == [2, 1, 4]
+    assert list(order.players_after(players[3])) == [players[2], players[1], players[4]]
+
+def test_state_round_trip(order, players):
+    order.advance_turn()
+    order.remove_player(players[3].playerID)
+    order.reverse_turn_order()
+    rebuilt = TurnOrder()
+    rebuilt.set_state(players, order.get_state())
+    assert rebuilt.get_state() == order.get_state()
+    assert len(rebuilt) == len(order)
+    assert rebuilt.get_turn_order() == order.get_turn_order()
+    assert turns(rebuilt, 6) == turns(order, 6)
+
+def test_state_round_trip_after_random_eliminations(players):
+    rng = random.Random(7)
+    for _ in range(50):
+        order = TurnOrder(players)
+        for player in rng.sample(players, rng.randint(1, len(players) - 1)):
+            if rng.random() < 0.5:
+                order.advance_turn()
+            if rng.random() < 0.3:
+                order.reverse_turn_order()
+            order.remove_player(player.playerID)
+        rebuilt = TurnOrder()
+        rebuilt.set_state(players, order.get_state())
+        # Removed seats must lead back into the rotation the same way
+        for seat in range(len(players)):
+            assert list(rebuilt.seats_after(seat)) == list(order.seats_after(seat))
+        assert turns(rebuilt, 7) == turns(order, 7)
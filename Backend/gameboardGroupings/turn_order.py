@@ -1,27 +1,147 @@
-from typing import List
-from GameManagement.player import Player
+from typing import Dict, Iterator, List, Optional
+from Backend.GameManagement.player import Player
+
+NO_SEAT = -1
 
-DEFAULT_LIST = []
 
 class TurnOrder():
-    """Manages the order of turnsin the game."""
-    def __init__(self, turn_order: List[Player] = DEFAULT_LIST):
-        self._turn_order: List[Player] = turn_order
-    
-    def add_player(self, player: Player):
-        pass
+    """Manages the order of turns in the game.
+
+    Players keep the seat they were added in. Seats still taking turns are
+    linked into a circular doubly linked list held in two arrays, _next and
+    _prev, so advancing, reversing and taking a seat out of the rotation are
+    O(1). A removed seat keeps its own links, so the turn can still advance
+    from it after its player is eliminated mid-turn."""
+    def __init__(self, turn_order: Optional[List[Player]] = None):
+        self._clear()
+        for player in turn_order or ():
+            self.add_player(player)
+
+    def _clear(self):
+        self._players: List[Player] = []
+        self._seat_by_id: Dict[int, int] = {}
+        self._next: List[int] = []
+        self._prev: List[int] = []
+        self._in_rotation: List[bool] = []
+        self._head: int = NO_SEAT
+        self._current: int = NO_SEAT
+        self._active_count: int = 0
+        self._reversed: bool = False
+
+    def __len__(self) -> int:
+        """Returns the number of players still taking turns"""
+        return self._active_count
+
+    def __contains__(self, player: Player) -> bool:
+        """Returns True if the player is still taking turns"""
+        seat = self._seat_by_id.get(player.playerID, NO_SEAT)
+        return seat != NO_SEAT and self._in_rotation[seat]
+
+    def add_player(self, player: Player) -> int:
+        """Gives a player the next seat, last in the rotation, and returns it"""
+        seat = len(self._players)
+        self._players.append(player)
+        self._seat_by_id[player.playerID] = seat
+        self._in_rotation.append(True)
+        if self._head == NO_SEAT:
+            self._next.append(seat)
+            self._prev.append(seat)
+            self._head = self._current = seat
+        else:
+            # Link in just before the lowest seat, so the ring stays in seat order
+            last = self._prev[self._head]
+            self._next.append(self._head)
+            self._prev.append(last)
+            self._next[last] = seat
+            self._prev[self._head] = seat
+        self._active_count += 1
+        return seat
+
+    def remove_player(self, player_id: int) -> bool:
+        """Takes a player out of the rotation, e.g. when they are eliminated.
+           Returns False if they were not in it."""
+        seat = self._seat_by_id.get(player_id, NO_SEAT)
+        if seat == NO_SEAT or not self._in_rotation[seat]:
+            return False
+        self._in_rotation[seat] = False
+        self._active_count -= 1
+        if self._active_count == 0:
+            self._head = NO_SEAT
+            return True
+        self._next[self._prev[seat]] = self._next[seat]
+        self._prev[self._next[seat]] = self._prev[seat]
+        if self._head == seat:
+            self._head = self._next[seat]
+        return True
 
-    def remove_player(self, player_id: int):
-        pass
+    def get_seat(self, player_id: int) -> int:
+        """Returns a player's seat, or NO_SEAT"""
+        return self._seat_by_id.get(player_id, NO_SEAT)
 
-    def get_current_turn(self):
-        pass
+    def get_player(self, seat: int) -> Player:
+        """Returns the player in a seat"""
+        return self._players[seat]
 
-    def advance_turn(self):
-        pass
+    def get_current_turn(self) -> Optional[Player]:
+        """Returns the player whose turn it is"""
+        return None if self._current == NO_SEAT else self._players[self._current]
+
+    def advance_turn(self) -> Optional[Player]:
+        """Moves the turn to the next player still in the rotation and
+           returns them, or None if nobody is left"""
+        if self._active_count == 0:
+            return None
+        self._current = self._step(self._current)
+        return self._players[self._current]
 
     def reverse_turn_order(self):
-        pass
+        """Reverses the direction of play"""
+        self._reversed = not self._reversed
+
+    def seats_after(self, seat: int) -> Iterator[int]:
+        """Yields the seats still in the rotation after the given seat, in the
+           direction of play, stopping before coming back round to it"""
+        remaining = self._active_count - (1 if self._in_rotation[seat] else 0)
+        for _ in range(remaining):
+            seat = self._step(seat)
+            yield seat
+
+    def players_after(self, player: Player) -> Iterator[Player]:
+        """Yields the players still in the rotation after the given player, in
+           the direction of play, e.g. the order they are asked to disprove"""
+        for seat in self.seats_after(self._seat_by_id[player.playerID]):
+            yield self._players[seat]
 
     def get_turn_order(self) -> List[Player]:
-        return self._turn_order
+        """Returns the players still in the rotation, starting with the
+           current player"""
+        if self._active_count == 0:
+            return []
+        start = self._current if self._in_rotation[self._current] else self._step(self._current)
+        return [self._players[start]] + [self._players[seat] for seat in self.seats_after(start)]
+
+    def get_state(self) -> tuple:
+        """Returns (current seat, is reversed, in-rotation flags as bytes)"""
+        return self._current, self._reversed, bytes(self._in_rotation)
+
+    def set_state(self, players: List[Player], state: tuple):
+        """Rebuilds the order from the players by seat and a get_state() value"""
+        current, is_reversed, in_rotation = state
+        self._clear()
+        for player in players:
+            self.add_player(player)
+        for seat, is_in_rotation in enumerate(in_rotation):
+            if not is_in_rotation:
+                self.remove_player(players[seat].playerID)
+        # Seats removed here link to their neighbors in seat order, which is
+        # where their original links led
+        self._current = current
+        self._reversed = is_reversed
+
+    def _step(self, seat: int) -> int:
+        # Removed seats keep their links, which lead back into the rotation
+        links = self._prev if self._reversed else self._next
+        seat = links[seat]
+        while not self._in_rotation[seat]:
+            seat = links[seat]
+        return seat
@@ -13,11 +13,13 @@ from channels.routing import ProtocolTypeRouter, URLRouter
 from channels.auth import AuthMiddlewareStack
 from Backend.MessageTranslator import routing as message_routing# Import your app's routing file
 from channels.layers import get_channel_layer
+from Backend.GameManagement.game_engine import game_engine_lifespan
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clue_less.settings")
 
 application = ProtocolTypeRouter({
     "http": get_asgi_application(),
+    "lifespan": game_engine_lifespan,
     "websocket": AuthMiddlewareStack(
         URLRouter(
             message_routing.websocket_urlpatterns  # Define WebSocket URLs in routing.py
@@ -90,6 +90,14 @@ TEMPLATES = [
 ASGI_APPLICATION = "clue_less.asgi.application"
 WSGI_APPLICATION = "clue_less.wsgi.application"
 
+# Worker processes that run live games, spread over them by game id.
+# 0 runs every game on the ASGI process's own event loop.
+GAME_WORKER_PROCESSES = 0
+
+# Directory where live games are stored, one file per game, so they survive
+# eviction, worker exits and restarts.
+GAME_STORE_DIR = BASE_DIR / "game_store"
+
 
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases